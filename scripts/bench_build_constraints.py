@@ -0,0 +1,103 @@
+"""Time the assembly of the LP/MIP constraint matrix for the example cases.
+
+Each case is solved once so that all the self-consistent loop parameters are in
+place, then the constraint matrix is rebuilt and converted to CSR several times.
+The reported time is the best of the repeats, in milliseconds, which keeps the
+numbers comparable between two checkouts run on the same machine. The patched
+column times the same rebuild when the self-consistent loop reuses the constraint
+pattern recorded on its first iteration.
+
+    uv run python scripts/bench_build_constraints.py [--repeat N] [--option key=value ...]
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import owlplanner as owl
+
+EXDIR = "examples"
+
+CASES = [
+    "Case_alex+jamie",
+    "Case_bill",
+    "Case_jack+jill",
+    "Case_joe",
+    "Case_john+sally",
+    "Case_kim+sam-spending",
+]
+
+
+def parse_option(text):
+    key, _, value = text.partition("=")
+    for conv in (int, float):
+        try:
+            return key, conv(value)
+        except ValueError:
+            pass
+    return key, value
+
+
+def bench_case(name, repeat, extra):
+    p = owl.readConfig(os.path.join(EXDIR, name + ".toml"), verbose=False, logstreams=[io.StringIO()])
+    options = dict(p.solverOptions)
+    options.update(extra)
+    p.solve(p.objective, options)
+    if p.caseStatus != "solved":
+        return None
+
+    def best_of(repeat):
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            p._buildConstraints(p.objective, p.solverOptions)
+            p.A.to_csr()
+            best = min(best, time.perf_counter() - t0)
+        return best * 1000
+
+    full = best_of(repeat)
+    p._lpPattern = None
+    p._reuseLpPattern = True
+    p._buildConstraints(p.objective, p.solverOptions)
+    patched = best_of(repeat)
+    p._lpPattern = None
+    p._reuseLpPattern = False
+
+    return full, patched, p.A.ncons, p.nvars
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--option", action="append", default=[], help="extra solver option as key=value")
+    args = parser.parse_args()
+    extra = dict(parse_option(o) for o in args.option)
+
+    print(f"{'case':<24} {'rows':>7} {'vars':>7} {'build (ms)':>11} {'patched (ms)':>13}")
+    total = 0.0
+    total_patched = 0.0
+    for name in CASES:
+        res = bench_case(name, args.repeat, extra)
+        if res is None:
+            print(f"{name:<24} {'not solved':>27}")
+            continue
+        ms, patched, ncons, nvars = res
+        total += ms
+        total_patched += patched
+        print(f"{name:<24} {ncons:>7} {nvars:>7} {ms:>11.2f} {patched:>13.2f}")
+    print(f"{'total':<24} {'':>15} {total:>11.2f} {total_patched:>13.2f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
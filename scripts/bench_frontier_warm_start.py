@@ -0,0 +1,87 @@
+"""Compare spending/bequest frontiers traced cold and warm started level to level.
+
+run_spending_bequest_frontier solves every bequest level, in the stochastic modes for
+every scenario. With warm_start, each solve starts from the solve of the same scenario
+at the level below: its loop parameters, its solution as a MIP hint and its simplex
+basis. This reports, for both, the self-consistent iterations and solve seconds per
+level (summed over scenarios), the wall time of the whole sweep, and the largest
+difference in spending between the two frontiers.
+
+    uv run python scripts/bench_frontier_warm_start.py [--case NAME] [--mode deterministic|historical|mc]
+        [--levels K] [--step AMOUNT] [-N SCENARIOS] [--maxtime SECONDS]
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+import owlplanner as owl
+
+EXDIR = "examples"
+
+
+def load(case):
+    return owl.readConfig(os.path.join(EXDIR, case + ".toml"), verbose=False, logstreams=[io.StringIO()])
+
+
+def trace(p, options, grid, args, warm_start):
+    kwargs = {"scenario_method": args.mode, "warm_start": warm_start}
+    if args.mode == "historical":
+        kwargs.update(ystart=args.ystart, yend=args.yend)
+    elif args.mode == "mc":
+        kwargs.update(N=args.N, seed=1)
+    t0 = time.perf_counter()
+    res = p.runSpendingBequestFrontier(options, grid, **kwargs)
+    return res, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--case", default="Case_jack+jill")
+    parser.add_argument("--mode", choices=("deterministic", "historical", "mc"), default="deterministic")
+    parser.add_argument("--levels", type=int, default=8)
+    parser.add_argument("--step", type=float, default=250.0, help="bequest step between levels, in k$")
+    parser.add_argument("-N", type=int, default=50)
+    parser.add_argument("--ystart", type=int, default=1960)
+    parser.add_argument("--yend", type=int, default=1980)
+    parser.add_argument("--maxtime", type=float, default=30.0, help="per-solve solver time limit (s)")
+    args = parser.parse_args()
+
+    p = load(args.case)
+    options = dict(p.solverOptions)
+    options["maxTime"] = args.maxtime
+    grid = [k * args.step for k in range(args.levels)]
+
+    cold, cold_wall = trace(p, options, grid, args, warm_start=False)
+    warm, warm_wall = trace(p, options, grid, args, warm_start=True)
+
+    print(f"{args.case}, {args.mode}, {len(grid)} levels, {cold['n_scenarios']} scenario(s) per level")
+    print(f"{'bequest':>9} {'cold iters':>11} {'warm iters':>11} {'cold (s)':>9} {'warm (s)':>9}")
+    for k, b in enumerate(grid):
+        print(
+            f"{b:>9,.0f} {cold['sc_iterations'][k]:>11} {warm['sc_iterations'][k]:>11}"
+            f" {cold['solve_seconds'][k]:>9.2f} {warm['solve_seconds'][k]:>9.2f}"
+        )
+    ci, wi = cold["sc_iterations"].sum(), warm["sc_iterations"].sum()
+    print(f"{'total':>9} {ci:>11} {wi:>11} {cold['solve_seconds'].sum():>9.2f} {warm['solve_seconds'].sum():>9.2f}")
+    print(f"SC iterations saved: {100 * (1 - wi / max(ci, 1)):.1f}%")
+    print(f"Wall time: cold {cold_wall:.1f}s, warm {warm_wall:.1f}s")
+    diff = np.nanmax(np.abs(warm["g_at_success"] - cold["g_at_success"]))
+    print(f"Largest spending difference between the frontiers: ${diff:,.0f}/yr")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
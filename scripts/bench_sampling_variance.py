@@ -0,0 +1,84 @@
+"""Compare the variance of Monte Carlo success rates across sampling schemes.
+
+Runs R independent replicates of an N-scenario Monte Carlo run for each value of the
+``sampling`` option of the rate model, and reports the mean and standard deviation of
+the success rate across replicates, with the variance relative to plain random draws.
+A scheme with a variance ratio of 0.5 reaches the precision of random sampling with
+about half as many scenarios. The success rate is the share of scenarios whose optimal
+spending basis reaches a fixed level: the median basis of the random replicates.
+
+    uv run python scripts/bench_sampling_variance.py [--case NAME] [--method METHOD] [-N SCENARIOS] [-R REPLICATES]
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+"""
+
+import argparse
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+import owlplanner as owl
+from owlplanner.rate_models.constants import SAMPLING_SCHEMES
+from owlplanner.rates import FROM, TO
+
+EXDIR = "examples"
+
+
+def load(case):
+    return owl.readConfig(os.path.join(EXDIR, case + ".toml"), verbose=False, logstreams=[io.StringIO()])
+
+
+def replicate_bases(p, method, scheme, options, N, seed):
+    """Optimal spending basis of each of N scenarios, 0 for a scenario that failed."""
+    p.setReproducible(True, seed=seed)
+    p.setRates(method, frm=FROM, to=TO, sampling=scheme)
+    _, df = p.runMC("maxSpending", options, N)
+    bases = np.zeros(N)
+    bases[: len(df)] = df["maxSpending"].to_numpy()
+    return bases
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--case", default="Case_jack+jill")
+    parser.add_argument("--method", default="historical_gaussian")
+    parser.add_argument("-N", type=int, default=64, help="scenarios per replicate")
+    parser.add_argument("-R", type=int, default=20, help="replicates per scheme")
+    parser.add_argument("--maxtime", type=float, default=10.0, help="per-scenario solver time limit (s)")
+    args = parser.parse_args()
+
+    p = load(args.case)
+    options = dict(p.solverOptions)
+    options["maxTime"] = args.maxtime
+
+    runs = {}
+    for scheme in SAMPLING_SCHEMES:
+        t0 = time.perf_counter()
+        bases = [replicate_bases(p, args.method, scheme, options, args.N, seed) for seed in range(1, args.R + 1)]
+        runs[scheme] = (np.array(bases), time.perf_counter() - t0)
+
+    level = float(np.median(runs["random"][0]))
+    print(f"{args.case}, {args.method}, {args.R} replicates of {args.N} scenarios")
+    print(f"Success rate at a basis of ${level:,.0f}")
+    print(f"{'sampling':<12} {'mean (%)':>9} {'std (pts)':>10} {'var ratio':>10} {'time (s)':>9}")
+    ref = None
+    for scheme, (bases, elapsed) in runs.items():
+        rates = 100.0 * (bases >= level).mean(axis=1)
+        var = rates.var(ddof=1)
+        ref = var if ref is None else ref
+        ratio = var / ref if ref > 0 else float("nan")
+        print(f"{scheme:<12} {rates.mean():>9.1f} {np.sqrt(var):>10.2f} {ratio:>10.2f} {elapsed:>9.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
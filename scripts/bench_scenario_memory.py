@@ -0,0 +1,106 @@
+"""Compare the peak memory of stochastic spending runs with longevity sampling.
+
+Each longevity scenario is solved on its own clone of the plan. The "eager" path
+reproduces the former submission loop, which built every clone before solving any of
+them. The "bounded" path is run_stochastic_spending, which clones inside the workers
+and keeps at most IN_FLIGHT_PER_WORKER scenarios per worker submitted. Each path runs
+in a fresh interpreter so that the reported peak resident set size, in MB, is its own.
+
+    uv run python scripts/bench_scenario_memory.py [--case NAME] [-N SCENARIOS] [--maxtime SECONDS]
+
+On Case_chris+pat and one CPU, the eager path peaked at 351.5 MB for 200 scenarios
+and 759.5 MB for 1000; the bounded path at 278.0 MB and 332.8 MB.
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+"""
+
+import argparse
+import io
+import os
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+import owlplanner as owl
+from owlplanner import abcapi, stresstests
+from owlplanner.data.mortality_tables import sample_lifespans
+
+EXDIR = "examples"
+MODES = ("eager", "bounded")
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def load(case):
+    return owl.readConfig(os.path.join(EXDIR, case + ".toml"), verbose=False, logstreams=[io.StringIO()])
+
+
+def run_eager(p, options, N):
+    """The former path: one clone per scenario, all built and submitted up front."""
+    rng = np.random.default_rng(1)
+    current_ages = [int(p.year_n[0] - p.yobs[i]) for i in range(p.N_i)]
+    templates = abcapi.TemplateCache()
+    args_list = []
+    for _ in range(N):
+        drawn = [int(sample_lifespans(p.sexes[i], current_ages[i], 1, rng)[0]) for i in range(p.N_i)]
+        tau_kn = stresstests._draw_rate_path(p, max(d - a + 1 for d, a in zip(drawn, current_ages, strict=True)))
+        args_list.append((stresstests._scenario_clone(p, templates, drawn), tau_kn, None, options))
+    n_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(stresstests._scenario_worker, args) for args in args_list]
+        for fut in as_completed(futures):
+            fut.result()
+
+
+def run_bounded(p, options, N):
+    p.runStochasticSpending(options, "mc", N=N, with_longevity=True, sexes=p.sexes, seed=1)
+
+
+def child(mode, case, N, maxtime):
+    p = load(case)
+    options = dict(p.solverOptions)
+    options["maxTime"] = maxtime
+    t0 = time.perf_counter()
+    (run_eager if mode == "eager" else run_bounded)(p, options, N)
+    print(f"{peak_rss_mb():.1f} {time.perf_counter() - t0:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--case", default="Case_chris+pat")
+    parser.add_argument("-N", type=int, default=200)
+    parser.add_argument("--maxtime", type=float, default=10.0, help="per-scenario solver time limit (s)")
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        child(args.mode, args.case, args.N, args.maxtime)
+        return 0
+
+    print(f"{args.case}, {args.N} longevity scenarios")
+    print(f"{'path':<10} {'peak RSS (MB)':>14} {'time (s)':>9}")
+    for mode in MODES:
+        cmd = [sys.executable, __file__, "--mode", mode, "--case", args.case, "-N", str(args.N)]
+        cmd += ["--maxtime", str(args.maxtime)]
+        out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout.split()
+        rss, elapsed = float(out[-2]), float(out[-1])
+        print(f"{mode:<10} {rss:>14.1f} {elapsed:>9.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -23,10 +23,13 @@ from owlplanner.config import readConfig, saveConfig  # noqa: F401
 from owlplanner.rates import getRatesDistributions, RatesDistribution  # noqa: F401
 from owlplanner.stresstests import g_for_success_rate, compute_cvar, compute_res, summarize_year1  # noqa: F401
 from owlplanner.stresstests import run_conversion_regret_sweep, summarize_conversion_regret  # noqa: F401
+from owlplanner.stresstests import mc_precision, RatePathBank, iter_scenarios, ScenarioUpdate  # noqa: F401
 from owlplanner.stresstests import (  # noqa: F401
     run_spending_bequest_frontier,
+    iter_spending_bequest_frontier,
     summarize_spending_bequest_frontier,
 )
+from owlplanner.trajectories import TrajectoryStore  # noqa: F401
 from owlplanner.export import fixedIncomeStreams  # noqa: F401
 from owlplanner.version import __version__  # noqa: F401
 
@@ -41,10 +44,16 @@ __all__ = [
     "compute_cvar",
     "compute_res",
     "summarize_year1",
+    "mc_precision",
+    "RatePathBank",
+    "iter_scenarios",
+    "ScenarioUpdate",
     "run_conversion_regret_sweep",
     "summarize_conversion_regret",
     "run_spending_bequest_frontier",
+    "iter_spending_bequest_frontier",
     "summarize_spending_bequest_frontier",
+    "TrajectoryStore",
     "fixedIncomeStreams",
     "__version__",
 ]
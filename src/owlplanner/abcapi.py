@@ -2,10 +2,15 @@
 Abstract API for building linear programming constraint matrices.
 
 This module provides a solver-neutral API to build constraint matrices and
-objective functions line by line, abstracting the building process to enable
-use of various solvers (MOSEK, HiGHS, etc.) for comparison. The name ABCAPI
+objective functions, abstracting the building process to enable use of
+various solvers (MOSEK, HiGHS, etc.) for comparison. The name ABCAPI
 refers to A (matrix), B (bounds), C (constraints).
 
+Constraints can be added one row at a time (addRow/addNewRow) or as whole
+families of rows at once (addBlock). Both paths append to the same
+preallocated coordinate (COO) buffers, so a matrix assembled from blocks
+converts to CSR without any per-element Python work.
+
 Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
 
 This program is free software: you can redistribute it and/or modify
@@ -22,6 +27,10 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
+
 import numpy as np
 
 
@@ -39,6 +48,44 @@ def _bound_key(lb, ub):
         return "ra"
 
 
+def _bound_keys(lb, ub):
+    """Vectorized _bound_key(): classify arrays of bound pairs, returning a list of keys."""
+    lb = np.asarray(lb, dtype=np.float64)
+    ub = np.asarray(ub, dtype=np.float64)
+    keys = np.select(
+        [np.isclose(lb, ub), (ub == np.inf) & (lb == -np.inf), ub == np.inf, lb == -np.inf],
+        ["fx", "fr", "lo", "up"],
+        default="ra",
+    )
+    return keys.tolist()
+
+
+def digest(*arrays):
+    """Return a hex digest of the shapes and contents of ``arrays``, for use in cache keys."""
+    h = hashlib.sha1()
+    for a in arrays:
+        a = np.ascontiguousarray(a, dtype=np.float64)
+        h.update(repr(a.shape).encode())
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def _grow(buf, needed):
+    """Return ``buf``, or a copy of it doubled in capacity until it holds ``needed`` entries."""
+    if needed <= len(buf):
+        return buf
+    newbuf = np.empty(max(needed, 2 * len(buf)), dtype=buf.dtype)
+    newbuf[: len(buf)] = buf
+    return newbuf
+
+
+def _check_indices(ind, size):
+    """Raise the same error as Row.addElem() if any index falls outside [0, size)."""
+    bad = (ind < 0) | (ind >= size)
+    if bad.any():
+        raise ValueError(f"Index {ind[np.argmax(bad)]} out of range.")
+
+
 class Row:
     """
     Solver-neutral API to accommodate Mosek/HiGHS.
@@ -75,20 +122,63 @@ class Row:
 class ConstraintMatrix:
     """
     Solver-neutral API for expressing constraints.
+
+    Non-zeros are stored as (row, column, value) triplets in growable numpy
+    buffers, together with the row bounds. Rows keep the order in which they
+    were added and, within a row, elements keep their insertion order.
     """
 
-    def __init__(self, nvars):
+    def __init__(self, nvars, nnz=0, ncons=0):
         """
         Constructor only requires the number of decision variables.
+        Optional ``nnz`` and ``ncons`` are capacity hints used to size the buffers.
         """
         self.ncons = 0
         self.nvars = nvars
-        self.Aind = []
-        self.Aval = []
-        self.lb = []
-        self.ub = []
-        self.key = []
+        self.nnz = 0
         self.tags = []
+        self._rows = np.empty(max(nnz, 8 * nvars, 64), dtype=np.int64)
+        self._cols = np.empty(len(self._rows), dtype=np.int32)
+        self._vals = np.empty(len(self._rows), dtype=np.float64)
+        self._lb = np.empty(max(ncons, 2 * nvars, 16), dtype=np.float64)
+        self._ub = np.empty(len(self._lb), dtype=np.float64)
+        self._sorted = True
+        self._csr = None
+
+    def _reserve(self, nrows, nnz):
+        self._rows = _grow(self._rows, self.nnz + nnz)
+        self._cols = _grow(self._cols, self.nnz + nnz)
+        self._vals = _grow(self._vals, self.nnz + nnz)
+        self._lb = _grow(self._lb, self.ncons + nrows)
+        self._ub = _grow(self._ub, self.ncons + nrows)
+        self._csr = None
+
+    @property
+    def lb(self):
+        """Row lower bounds as a numpy array of length ncons."""
+        return self._lb[: self.ncons]
+
+    @property
+    def ub(self):
+        """Row upper bounds as a numpy array of length ncons."""
+        return self._ub[: self.ncons]
+
+    @property
+    def key(self):
+        """MOSEK-style bound key of each row."""
+        return _bound_keys(self.lb, self.ub)
+
+    @property
+    def Aind(self):
+        """Column indices of each row, as a list of lists."""
+        a_start, a_index, _ = self.to_csr()
+        return [r.tolist() for r in np.split(a_index, a_start[1:])] if self.ncons else []
+
+    @property
+    def Aval(self):
+        """Coefficients of each row, as a list of lists."""
+        a_start, _, a_value = self.to_csr()
+        return [r.tolist() for r in np.split(a_value, a_start[1:])] if self.ncons else []
 
     def newRow(self, rowDic=None):
         """
@@ -106,12 +196,15 @@ class ConstraintMatrix:
         upper bound ``ub`` provided. An optional ``tag`` (any hashable, e.g.
         ("cash_flow", n)) labels the row for dual-value reporting.
         """
-        self.Aind.append(row.ind)
-        self.Aval.append(row.val)
-        self.lb.append(lb)
-        self.ub.append(ub)
-        self.key.append(_bound_key(lb, ub))
+        k = len(row.ind)
+        self._reserve(1, k)
+        self._rows[self.nnz : self.nnz + k] = self.ncons
+        self._cols[self.nnz : self.nnz + k] = row.ind
+        self._vals[self.nnz : self.nnz + k] = row.val
+        self._lb[self.ncons] = lb
+        self._ub[self.ncons] = ub
         self.tags.append(tag)
+        self.nnz += k
         self.ncons += 1
 
     def addNewRow(self, rowDic, lb, ub, tag=None):
@@ -123,6 +216,87 @@ class ConstraintMatrix:
         row = self.newRow(rowDic)
         self.addRow(row, lb, ub, tag)
 
+    def addBlock(self, nrows, rows, cols, vals, lb, ub, tags=None):
+        """
+        Add a family of ``nrows`` rows in one call. Arguments ``rows``, ``cols``,
+        and ``vals`` are broadcast together and give the non-zeros in coordinate
+        form, with ``rows`` numbered locally from 0 to nrows-1. Bounds ``lb`` and
+        ``ub`` are scalars or arrays of length nrows, and ``tags`` an optional
+        sequence of nrows row labels. Within a row, elements keep the order in
+        which they appear in the flattened arrays. Return the index of the first row added.
+        """
+        rows, cols, vals = np.broadcast_arrays(np.asarray(rows), np.asarray(cols), np.asarray(vals, dtype=np.float64))
+        rows = rows.ravel()
+        cols = cols.ravel()
+        vals = vals.ravel()
+        _check_indices(cols, self.nvars)
+        _check_indices(rows, nrows)
+        if tags is not None and len(tags) != nrows:
+            raise ValueError(f"Expected {nrows} tags, got {len(tags)}.")
+
+        k = len(vals)
+        first = self.ncons
+        self._reserve(nrows, k)
+        self._rows[self.nnz : self.nnz + k] = rows + first
+        self._cols[self.nnz : self.nnz + k] = cols
+        self._vals[self.nnz : self.nnz + k] = vals
+        self._lb[first : first + nrows] = lb
+        self._ub[first : first + nrows] = ub
+        if self._sorted and k > 1:
+            self._sorted = bool(np.all(rows[1:] >= rows[:-1]))
+        self.tags.extend([None] * nrows if tags is None else tags)
+        self.nnz += k
+        self.ncons += nrows
+
+        return first
+
+    def addRows(self, nrows, terms, lb, ub, tags=None):
+        """
+        Add a family of ``nrows`` rows sharing the same layout. Each entry of
+        ``terms`` is a (cols, vals) pair, broadcast to length nrows, contributing
+        one element to every row in the order given. A term can carry a third
+        entry, a boolean mask over rows, to leave the element out of rows where
+        the mask is False. Bounds and tags are as in addBlock().
+        Return the index of the first row added.
+        """
+        return self.addInterleavedRows(nrows, [(terms, lb, ub)], tags)
+
+    def addInterleavedRows(self, nrows, families, tags=None):
+        """
+        Add several row families of ``nrows`` rows each, interleaved so that
+        row k of every family is emitted before row k+1 of any. Each family is a
+        (terms, lb, ub) tuple as in addRows(), and ``tags`` follows the final
+        row order. Return the index of the first row added.
+        """
+        nfam = len(families)
+        rows, cols, vals = [], [], []
+        lb = np.empty(nrows * nfam)
+        ub = np.empty(nrows * nfam)
+        for f, (terms, flb, fub) in enumerate(families):
+            fcols = np.empty((nrows, len(terms)), dtype=np.int64)
+            fvals = np.empty((nrows, len(terms)), dtype=np.float64)
+            keep = np.ones((nrows, len(terms)), dtype=bool)
+            for k, term in enumerate(terms):
+                fcols[:, k] = term[0]
+                fvals[:, k] = term[1]
+                if len(term) > 2:
+                    keep[:, k] = term[2]
+            frows = np.broadcast_to((np.arange(nrows) * nfam + f)[:, None], keep.shape)
+            rows.append(frows[keep])
+            cols.append(fcols[keep])
+            vals.append(fvals[keep])
+            lb[f::nfam] = flb
+            ub[f::nfam] = fub
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        vals = np.concatenate(vals)
+        if nfam > 1:
+            # Stable sort on rows keeps the elements of each row in term order.
+            order = np.argsort(rows, kind="stable")
+            rows, cols, vals = rows[order], cols[order], vals[order]
+
+        return self.addBlock(nrows * nfam, rows, cols, vals, lb, ub, tags)
+
     def keys(self):
         """
         Return list of MOSEK-style bound keys for each constraint row.
@@ -135,15 +309,26 @@ class ConstraintMatrix:
         Avoids the dense O(ncons × nvars) matrix allocation used by arrays().
         Returns (a_start, a_index, a_value) as int32 / float64 numpy arrays,
         where a_start[i] is the index of the first non-zero in row i (length = ncons).
+        The arrays are cached until the matrix changes, and returned read-only: copy
+        them before modifying.
         """
-        from itertools import chain
-
-        lengths = [len(row) for row in self.Aind]
-        num_nz = sum(lengths)
-        a_start = np.concatenate([[0], np.cumsum(lengths)[:-1]]).astype(np.int32)
-        a_index = np.fromiter(chain.from_iterable(self.Aind), dtype=np.int32, count=num_nz)
-        a_value = np.fromiter(chain.from_iterable(self.Aval), dtype=np.float64, count=num_nz)
-        return a_start, a_index, a_value
+        if self._csr is None:
+            rows = self._rows[: self.nnz]
+            a_index = self._cols[: self.nnz]
+            a_value = self._vals[: self.nnz]
+            if not self._sorted:
+                # Stable sort keeps elements of a row in insertion order.
+                order = np.argsort(rows, kind="stable")
+                a_index = a_index[order]
+                a_value = a_value[order]
+            counts = np.bincount(rows, minlength=self.ncons)
+            a_start = np.zeros(self.ncons, dtype=np.int32)
+            np.cumsum(counts[:-1], out=a_start[1:])
+            self._csr = (a_start, a_index.copy(), a_value.copy())
+            for a in self._csr:
+                a.flags.writeable = False
+
+        return self._csr
 
     def lists(self):
         """
@@ -156,37 +341,113 @@ class ConstraintMatrix:
         Return full arrays for Scipy/HiGHS.
         """
         Alu = np.zeros((self.ncons, self.nvars))
-        lb = np.array(self.lb)
-        ub = np.array(self.ub)
-        for ii in range(self.ncons):
-            Alu[ii, self.Aind[ii]] = self.Aval[ii]
+        np.add.at(Alu, (self._rows[: self.nnz], self._cols[: self.nnz]), self._vals[: self.nnz])
 
-        return Alu, lb, ub
+        return Alu, self.lb.copy(), self.ub.copy()
+
+    def copy(self):
+        """
+        Return an independent copy of this matrix, trimmed to its current size.
+        """
+        other = ConstraintMatrix(self.nvars, self.nnz, self.ncons)
+        other._rows[: self.nnz] = self._rows[: self.nnz]
+        other._cols[: self.nnz] = self._cols[: self.nnz]
+        other._vals[: self.nnz] = self._vals[: self.nnz]
+        other._lb[: self.ncons] = self.lb
+        other._ub[: self.ncons] = self.ub
+        other.nnz = self.nnz
+        other.ncons = self.ncons
+        other.tags = list(self.tags)
+        other._sorted = self._sorted
+
+        return other
+
+    def patch(self, other, row, pos):
+        """
+        Overwrite the coefficients and bounds of the rows starting at index ``row``,
+        whose elements start at storage position ``pos``, with those of matrix
+        ``other``. Both must share the same layout: same number of rows, and
+        the same tags and columns in the same order.
+        Raise ValueError if the layouts differ.
+        """
+        nrows, k = other.ncons, other.nnz
+        if row + nrows > self.ncons or pos + k > self.nnz:
+            raise ValueError("Patch extends beyond the end of the matrix.")
+        if (
+            self.tags[row : row + nrows] != other.tags
+            or not np.array_equal(self._rows[pos : pos + k] - row, other._rows[:k])
+            or not np.array_equal(self._cols[pos : pos + k], other._cols[:k])
+        ):
+            raise ValueError("Patch does not match the layout of the matrix.")
+        self._vals[pos : pos + k] = other._vals[:k]
+        self._lb[row : row + nrows] = other.lb
+        self._ub[row : row + nrows] = other.ub
+        self._csr = None
+
+    def rowCounts(self):
+        """
+        Return the number of stored elements in each constraint row.
+        """
+        return np.bincount(self._rows[: self.nnz], minlength=self.ncons)
+
+    def activity(self, x):
+        """
+        Return the row activities A @ x for a solution vector x.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        rows = self._rows[: self.nnz]
+        return np.bincount(rows, weights=self._vals[: self.nnz] * x[self._cols[: self.nnz]], minlength=self.ncons)
 
 
 class Bounds:
     """
     Solver-neutral API for bounds on variables.
+
+    Bounds are recorded in the order they are set, so that a later setting
+    on the same variable overrides an earlier one.
     """
 
     def __init__(self, nvars, nbins):
         self.nvars = nvars
         self.nbins = nbins
-        self.ind = []
-        self.lb = []
-        self.ub = []
-        self.key = []
         self.integrality = []
+        self._n = 0
+        self._ind = np.empty(max(2 * nvars, 16), dtype=np.int64)
+        self._lb = np.empty(len(self._ind), dtype=np.float64)
+        self._ub = np.empty(len(self._ind), dtype=np.float64)
         for ii in range(nvars - nbins, nvars):
             self.setBinary(ii)
 
+    @property
+    def ind(self):
+        return self._ind[: self._n]
+
+    @property
+    def lb(self):
+        return self._lb[: self._n]
+
+    @property
+    def ub(self):
+        return self._ub[: self._n]
+
+    @property
+    def key(self):
+        return _bound_keys(self.lb, self.ub)
+
+    def _append(self, ind, lb, ub):
+        k = len(ind)
+        self._ind = _grow(self._ind, self._n + k)
+        self._lb = _grow(self._lb, self._n + k)
+        self._ub = _grow(self._ub, self._n + k)
+        self._ind[self._n : self._n + k] = ind
+        self._lb[self._n : self._n + k] = lb
+        self._ub[self._n : self._n + k] = ub
+        self._n += k
+
     def setBinary(self, ii):
         if not (0 <= ii < self.nvars):
             raise ValueError(f"Index {ii} out of range.")
-        self.ind.append(ii)
-        self.lb.append(0)
-        self.ub.append(1)
-        self.key.append("ra")
+        self._append([ii], 0, 1)
         self.integrality.append(ii)
 
     def setRange(self, ii, lb, ub):
@@ -194,16 +455,53 @@ class Bounds:
             raise ValueError(f"Index {ii} out of range.")
         if lb > ub:
             raise ValueError(f"Lower bound {lb} > upper bound {ub}.")
-        self.ind.append(ii)
-        self.lb.append(lb)
-        self.ub.append(ub)
-        self.key.append(_bound_key(lb, ub))
+        self._append([ii], lb, ub)
+
+    def setRanges(self, ind, lb, ub):
+        """
+        Vectorized setRange(): set bounds ``lb`` and ``ub`` (scalars or arrays)
+        on all variables in ``ind``, in order.
+        """
+        ind, lb, ub = np.broadcast_arrays(
+            np.asarray(ind), np.asarray(lb, dtype=np.float64), np.asarray(ub, dtype=np.float64)
+        )
+        ind = ind.ravel()
+        lb = lb.ravel()
+        ub = ub.ravel()
+        _check_indices(ind, self.nvars)
+        bad = lb > ub
+        if bad.any():
+            k = np.argmax(bad)
+            raise ValueError(f"Lower bound {lb[k]} > upper bound {ub[k]}.")
+        self._append(ind, lb, ub)
+
+    def copy(self):
+        """
+        Return an independent copy of these bounds.
+        """
+        other = Bounds(self.nvars, 0)
+        other.nbins = self.nbins
+        other.integrality = list(self.integrality)
+        other._append(self.ind, self.lb, self.ub)
+
+        return other
+
+    def patch(self, other, pos):
+        """
+        Overwrite the bounds recorded from position ``pos`` with those of ``other``,
+        which must set the same variables in the same order and no binaries.
+        Raise ValueError if they differ.
+        """
+        k = other._n
+        if other.integrality or pos + k > self._n or not np.array_equal(self._ind[pos : pos + k], other.ind):
+            raise ValueError("Patch does not match the recorded bounds.")
+        self._lb[pos : pos + k] = other.lb
+        self._ub[pos : pos + k] = other.ub
 
     def keys(self):
-        keys = ["lo"] * self.nvars
-        for idx, key in zip(self.ind, self.key, strict=True):
-            keys[idx] = key
-        return keys
+        keys = np.full(self.nvars, "lo", dtype="<U2")
+        keys[self.ind] = self.key
+        return keys.tolist()
 
     def arrays(self):
         lb = np.zeros(self.nvars)
@@ -253,3 +551,51 @@ class Objective:
         Return lists for Mosek sparse representation.
         """
         return self.ind, self.val
+
+
+class TemplateCache:
+    """
+    Thread-safe store of constraint templates keyed by a structural signature.
+
+    A template is whatever the caller needs to rebuild a model of the same structure
+    quickly, typically copies of a ConstraintMatrix and Bounds. Templates are read
+    shared: callers must copy them before modifying. The least recently used template
+    is dropped when more than ``maxsize`` are held.
+    """
+
+    def __init__(self, maxsize=16):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._store = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._store)
+
+    def __deepcopy__(self, memo):
+        # Deep copies of a plan, such as scenario clones, share its templates.
+        return self
+
+    def __reduce__(self):
+        # Templates do not travel between processes; each one starts empty.
+        return (TemplateCache, (self.maxsize,))
+
+    def get(self, signature):
+        """Return the template stored under ``signature``, or None."""
+        with self._lock:
+            template = self._store.get(signature)
+            if template is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._store.move_to_end(signature)
+            return template
+
+    def put(self, signature, template):
+        """Store ``template`` under ``signature``."""
+        with self._lock:
+            self._store[signature] = template
+            self._store.move_to_end(signature)
+            while len(self._store) > self.maxsize:
+                self._store.popitem(last=False)
@@ -127,12 +127,11 @@ def max_row_violation(x, A, col_lb=None, col_ub=None):
     incumbent's own residual rather than against zero.
     """
     worst = 0.0
-    for ii in range(A.ncons):
-        ind = A.Aind[ii]
-        if not ind:
-            continue
-        val = float(np.dot(np.asarray(A.Aval[ii]), x[np.asarray(ind)]))
-        worst = max(worst, A.lb[ii] - val, val - A.ub[ii])
+    if A.ncons > 0:
+        val = A.activity(x)
+        nonempty = A.rowCounts() > 0
+        worst = max(worst, float(np.max((A.lb - val)[nonempty], initial=0.0)),
+                    float(np.max((val - A.ub)[nonempty], initial=0.0)))
     if col_lb is not None:
         worst = max(worst, float(np.max(col_lb - x)))
     if col_ub is not None:
@@ -598,13 +598,15 @@ def _build_opts(plan, solver, max_time, verbose_flag, solver_opts_raw):
     return parse_solver_options(opts)
 
 
-def _solve_blocking(diconf, dirname, solver, max_time, seed, solver_opts_raw):
+def _solve_blocking(diconf, dirname, solver, max_time, seed, solver_opts_raw, use_cache=True):
     """Load, configure, solve, and return the Plan. Runs in a thread executor."""
+    from owlplanner.solvecache import cached_solve
+
     plan = config_to_plan(diconf, dirname, verbose=True, logstreams=[sys.stderr], loadHFP=True)
     if seed is not None:
         plan.setReproducible(True, seed=seed)
     opts = _build_opts(plan, solver, max_time, None, solver_opts_raw)
-    plan.solve(plan.objective, opts)
+    cached_solve(plan, plan.objective, opts, use_cache=use_cache)
     return plan
 
 
@@ -623,6 +625,10 @@ async def run_case(
         int | None,
         Field(description="Random seed for stochastic rate methods."),
     ] = None,
+    use_cache: Annotated[
+        bool,
+        Field(description="Reuse the solution of an identical earlier solve, if the server keeps a solve cache."),
+    ] = True,
 ) -> str:
     """Solve a retirement planning case and return structured JSON results.
 
@@ -635,6 +641,8 @@ async def run_case(
         solver:    "HiGHS", "MOSEK", or "default" (default picks best available).
         max_time:  Solver time limit in seconds.
         seed:      Random seed for stochastic rate methods.
+        use_cache: False to solve afresh even if the same case was solved before. Solves are
+                   only cached when the server sets OWL_SOLVE_CACHE_DIR.
     """
     overrides = _norm_overrides(overrides)
     try:
@@ -658,6 +666,7 @@ async def run_case(
             max_time,
             seed,
             [],
+            use_cache,
         )
     except Exception as e:
         return json.dumps({"error": f"Solver error: {e}"})
@@ -1201,7 +1210,10 @@ def _run_from_params_blocking(
     liquidation_tax_rate=None,
     liquidation_capgains_rate=None,
     assumed=None,
+    use_cache=True,
 ):
+    from owlplanner.solvecache import cached_solve
+
     plan = _build_plan_from_params(
         names,
         birth_dates,
@@ -1286,7 +1298,7 @@ def _run_from_params_blocking(
         inames=plan.inames,
     )
     _scrub_optimized_ss_ages(assumed, opts)
-    plan.solve(objective, opts)
+    cached_solve(plan, objective, opts, use_cache=use_cache)
     return plan
 
 
@@ -1392,6 +1404,10 @@ async def run_from_params(
             "liquid balance sheet (default 15)."
         ),
     ] = None,
+    use_cache: Annotated[
+        bool,
+        Field(description="Reuse the solution of an identical earlier solve, if the server keeps a solve cache."),
+    ] = True,
 ) -> str:
     """Build and solve a retirement plan from structured parameters — no TOML file needed.
 
@@ -1638,6 +1654,8 @@ async def run_from_params(
         liquidation_capgains_rate: Assumed capital-gains tax rate (%) on fixed-asset
                         disposition (commission plus gains tax) for the liquid
                         balance sheet (default 15).
+        use_cache:      False to solve afresh even if the same plan was solved before.
+                        Solves are only cached when the server sets OWL_SOLVE_CACHE_DIR.
 
     slcsp:          Annual ACA Silver benchmark premium in $/year (today's $) for
                     individuals under 65 not yet on Medicare.  Omit if covered by
@@ -1719,6 +1737,7 @@ async def run_from_params(
             liquidation_tax_rate,
             liquidation_capgains_rate,
             assumed,
+            use_cache,
         )
     except Exception as e:
         return json.dumps({"error": f"Plan build/solve error: {e}"})
@@ -2661,7 +2680,7 @@ def _build_stochastic_json(plan, result, target_success_rate_pct, scenario_metho
     g_target, _ = g_for_success_rate(target_success_rate_pct, lambdas, frontier_g, frontier_prob)
 
     # Achieved success rate at that frontier point
-    target_shortfall = 1.0 - target_success_rate_pct / 100.0
+    target_shortfall = (100.0 - target_success_rate_pct) / 100.0
     candidates = np.where(frontier_prob <= target_shortfall)[0]
     achieved_success_pct = round(100.0 * (1.0 - float(frontier_prob[candidates[0] if len(candidates) else -1])), 2)
 
@@ -2756,9 +2775,14 @@ def _build_distribution_json(plan, results, objective, scenario_method, n_attemp
 
 
 def _historical_blocking(plan, objective, opts, ystart, yend, augmented, reverse, roll):
-    """Solve plan across historical year sequences; returns (plan, n_attempted, results)."""
+    """
+    Solve plan across historical year sequences; returns (plan, n_attempted, results,
+    ystart, yend, n_solves). Sequences repeating the rates of an earlier one reuse its
+    solve, so n_solves is the number of distinct ones.
+    """
     from itertools import product as iproduct
     from owlplanner.rates import FROM, TO
+    from owlplanner.stresstests import _distinct_rate_sequences, _set_historical_rates
 
     _ystart = int(ystart) if ystart is not None else FROM
     _yend = int(yend) if yend is not None else TO
@@ -2774,25 +2798,35 @@ def _historical_blocking(plan, objective, opts, ystart, yend, augmented, reverse
     else:
         pairs = [(bool(reverse), int(roll))]
 
-    n_attempted = (_yend - _ystart + 1) * len(pairs)
-    results = []
+    scenarios = [(year, rev, rll) for year in range(_ystart, _yend + 1) for rev, rll in pairs]
+    distinct, which = _distinct_rate_sequences(plan.N_n, scenarios)
 
-    for year in range(_ystart, _yend + 1):
-        for rev, rll in pairs:
-            plan.setRates("historical", year, reverse=rev, roll=rll)
-            plan.solve(objective, opts)
-            if plan.caseStatus == "solved":
-                val = float(plan.basis) if objective == "maxSpending" else float(plan.bequest)
-                entry = {"value": val, "gamma_n_end": float(plan.gamma_n[-1])}
-                if not augmented:
-                    entry["year"] = year
-                results.append(entry)
+    solved = []
+    for scenario in distinct:
+        _set_historical_rates(plan, scenario)
+        plan.solve(objective, opts)
+        if plan.caseStatus == "solved":
+            val = float(plan.basis) if objective == "maxSpending" else float(plan.bequest)
+            solved.append({"value": val, "gamma_n_end": float(plan.gamma_n[-1])})
+        else:
+            solved.append(None)
 
-    return plan, n_attempted, results, _ystart, _yend
+    results = []
+    for (year, _, _), d in zip(scenarios, which):
+        if solved[d] is not None:
+            entry = dict(solved[d])
+            if not augmented:
+                entry["year"] = year
+            results.append(entry)
+
+    return plan, len(scenarios), results, _ystart, _yend, len(distinct)
 
 
-def _monte_carlo_blocking(plan, objective, opts, n_scenarios, seed):
-    """Solve plan across Monte Carlo rate draws; returns (plan, n_attempted, results)."""
+def _monte_carlo_blocking(plan, objective, opts, n_scenarios, seed, stop=None):
+    """
+    Solve plan across Monte Carlo rate draws; returns (plan, n_attempted, results).
+    With an AdaptiveStop rule, n_scenarios is a maximum and the draws stop once it is met.
+    """
     from owlplanner.stresstests import MC_TIME_LIMIT
 
     if getattr(plan, "rateModel", None) is None or getattr(plan.rateModel, "deterministic", True):
@@ -2811,14 +2845,22 @@ def _monte_carlo_blocking(plan, objective, opts, n_scenarios, seed):
 
     if plan.reproducibleRates and hasattr(plan.rateModel, "_rng"):
         plan.rateModel._rng = np.random.default_rng(plan.rateSeed)
+    if hasattr(plan.rateModel, "reset_sampling"):
+        plan.rateModel.reset_sampling()
 
     results = []
-    for _ in range(int(n_scenarios)):
+    values = []  # every attempt, 0 for a failed solve, for the stopping rule
+    for n in range(1, int(n_scenarios) + 1):
         plan.regenRates(override_reproducible=True)
         plan.solve(objective, myopts)
         if plan.caseStatus == "solved":
             val = float(plan.basis) if objective == "maxSpending" else float(plan.bequest)
             results.append({"value": val, "gamma_n_end": float(plan.gamma_n[-1])})
+            values.append(val)
+        else:
+            values.append(0.0)
+        if stop is not None and (n % stop.batch == 0 or n == int(n_scenarios)) and stop.done(values):
+            return plan, n, results
 
     return plan, int(n_scenarios), results
 
@@ -4640,7 +4682,7 @@ async def run_historical(
 
     _scrub_optimized_ss_ages(assumed, opts)
     try:
-        plan, n_attempted, results, ystart_actual, yend_actual = await asyncio.get_running_loop().run_in_executor(
+        outcome = await asyncio.get_running_loop().run_in_executor(
             None,
             _historical_blocking,
             plan,
@@ -4654,6 +4696,7 @@ async def run_historical(
         )
     except Exception as e:
         return json.dumps({"error": f"Historical run error: {e}"})
+    plan, n_attempted, results, ystart_actual, yend_actual, n_solves = outcome
 
     if not results:
         return json.dumps({"error": "No scenarios solved successfully."})
@@ -4662,6 +4705,7 @@ async def run_historical(
     out["ystart_used"] = ystart_actual
     out["yend_used"] = yend_actual
     out["augmented"] = augmented
+    out["n_distinct_solves"] = n_solves
     if assumed:
         out["assumed_defaults"] = assumed
     return json.dumps(out, indent=2, cls=_NumpyEncoder)
@@ -4735,6 +4779,9 @@ async def run_monte_carlo(
     solver: str | None = None,
     max_time: float | None = None,
     seed: int | None = None,
+    precision_pct: float | None = None,
+    target_success_rate_pct: float = 90.0,
+    time_budget: float | None = None,
 ) -> str:
     """Run Monte Carlo simulations and return a distribution of optimal outcomes.
 
@@ -4840,10 +4887,19 @@ async def run_monte_carlo(
                           Couples only.
         obbba_expiration_year: Year OBBBA rates sunset to pre-TCJA levels (default 2032).
         dividend_rate:    Annual dividend yield for taxable accounts in % (default 1.8).
-        n_scenarios:      Number of Monte Carlo trials (default 200).
+        n_scenarios:      Number of Monte Carlo trials (default 200); the maximum when
+                          precision_pct or time_budget is given.
         solver:           "HiGHS", "MOSEK", or None (auto-select).
         max_time:         Per-scenario solver time limit in seconds.
         seed:             Random seed for reproducible results.
+        precision_pct:    Stop early, checking every 50 trials, once the outcome at
+                          target_success_rate_pct (95% confidence, in % of its value) and
+                          its success rate (in percentage points) are both known within
+                          this half-width, e.g. 1.0 for ±1%.  The achieved precision is
+                          returned under "precision".
+        target_success_rate_pct: Success rate whose outcome precision_pct applies to
+                          (default 90).
+        time_budget:      Stop early after this many seconds in total.
     """
     assumed: list[dict] = []
     overrides = _norm_overrides(overrides)
@@ -4961,6 +5017,16 @@ async def run_monte_carlo(
         opts = _merge_case_opts(plan, opts)
 
     _scrub_optimized_ss_ages(assumed, opts)
+    stop = None
+    if precision_pct is not None or time_budget is not None:
+        from owlplanner.stresstests import AdaptiveStop
+
+        try:
+            stop = AdaptiveStop(
+                precision_pct, target_success_rate_pct=target_success_rate_pct, time_budget=time_budget
+            )
+        except ValueError as e:
+            return json.dumps({"error": str(e)})
     try:
         plan, n_attempted, results = await asyncio.get_running_loop().run_in_executor(
             None,
@@ -4970,6 +5036,7 @@ async def run_monte_carlo(
             opts,
             n_scenarios,
             seed,
+            stop,
         )
     except Exception as e:
         return json.dumps({"error": f"Monte Carlo run error: {e}"})
@@ -4979,6 +5046,8 @@ async def run_monte_carlo(
 
     out = _build_distribution_json(plan, results, objective, "mc", n_attempted)
     out["rate_method"] = plan.rateMethod if hasattr(plan, "rateMethod") else rate_method
+    if stop is not None:
+        out["precision"] = stop.report()
     if assumed:
         out["assumed_defaults"] = assumed
     return json.dumps(out, indent=2, cls=_NumpyEncoder)
@@ -0,0 +1,142 @@
+"""
+Append-only checkpoints of long scenario runs.
+
+A regret sweep or a large stochastic spending run can take hours, and a crash or a
+laptop going to sleep would lose all of it. Given a checkpoint file, such a run appends
+the result of each scenario to it, as one line of JSON, as soon as the scenario
+completes. Run again with the same file, it only solves the scenarios missing from it.
+
+The first line of the file is a header holding a fingerprint of the run: the plan as
+solvecache.plan_fingerprint() hashes it, the solver options and the parameters that
+choose the scenarios. A checkpoint of another run is refused rather than mixed in. The
+parameters only say how scenarios are drawn, so a run drawing them afresh each time,
+from an unseeded generator, cannot be checkpointed.
+Lines are written by the thread that collects the results, one write and one flush
+each: workers never touch the file. A line cut short by a crash is ignored.
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from .solvecache import IGNORED_OPTIONS, plan_fingerprint
+
+CHECKPOINT_FORMAT = 1
+
+
+def run_fingerprint(plan, kind, options, **params):
+    """
+    Hash of a scenario run of type ``kind``: plan, solver options and the run's
+    parameters ``params``, which must be JSON-ready or numpy values.
+    """
+    opts = {k: v for k, v in (options or {}).items() if k not in IGNORED_OPTIONS}
+    return plan_fingerprint(plan, {"run": kind, "options": opts, "params": params})
+
+
+def _json_default(value):
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} cannot be written to a checkpoint.")
+
+
+class ScenarioCheckpoint:
+    """
+    Results of the scenarios of one run, read from and appended to a JSONL file.
+
+    ``results`` maps the key of each scenario already done -- an int or str, a start year
+    or a scenario index say -- to its result, as JSON read it back: tuples become lists.
+    record() adds one. Opening the checkpoint of a run with another fingerprint raises
+    ValueError.
+    """
+
+    def __init__(self, filename, fingerprint):
+        self.filename = str(filename)
+        self.fingerprint = fingerprint
+        self.results = {}
+        self._file = None
+        if self._read():
+            self._file = open(self.filename, "a", encoding="utf-8")
+        else:
+            self._file = open(self.filename, "w", encoding="utf-8")
+            self._write({"format": CHECKPOINT_FORMAT, "fingerprint": fingerprint})
+
+    def _read(self):
+        """Load the results of an existing checkpoint; return False if there is none."""
+        try:
+            with open(self.filename, encoding="utf-8") as f:
+                lines = f.read().split("\n")
+        except FileNotFoundError:
+            return False
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            # Not even a complete header: the run stopped before it recorded anything.
+            return False
+        if header.get("fingerprint") != self.fingerprint:
+            raise ValueError(
+                f"Checkpoint {self.filename} holds the results of another run:"
+                " remove it, or give this run another file."
+            )
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self.results[entry["key"]] = entry["result"]
+        if lines[-1]:
+            # Complete the line cut short, which the next record would otherwise extend.
+            with open(self.filename, "a", encoding="utf-8") as f:
+                f.write("\n")
+        return True
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, default=_json_default) + "\n")
+        self._file.flush()
+
+    def __contains__(self, key):
+        return key in self.results
+
+    def __len__(self):
+        return len(self.results)
+
+    def record(self, key, result):
+        """Append the result of scenario key."""
+        self.results[key] = result
+        self._write({"key": key, "result": result})
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_checkpoint(filename, plan, kind, options, **params):
+    """Return the ScenarioCheckpoint of this run in filename, or None without a filename."""
+    if filename is None:
+        return None
+    checkpoint = ScenarioCheckpoint(os.fspath(filename), run_fingerprint(plan, kind, options, **params))
+    if len(checkpoint):
+        plan.mylog.print(f"Checkpoint {checkpoint.filename}: {len(checkpoint)} scenario(s) already done.")
+    return checkpoint
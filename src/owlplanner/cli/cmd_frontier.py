@@ -29,7 +29,7 @@ from pathlib import Path
 
 from owlplanner.config import load_toml, config_to_plan
 from owlplanner.config.schema import CLI_SOLVER_OVERRIDE_MAP, parse_solver_options
-from owlplanner.stresstests import run_spending_bequest_frontier, summarize_spending_bequest_frontier
+from owlplanner.stresstests import RatePathBank, run_spending_bequest_frontier, summarize_spending_bequest_frontier
 
 from .cmd_run import _parse_solver_opts, validate_toml
 from .set_override import apply_overrides
@@ -46,6 +46,19 @@ def _parse_float_list(value, what):
     return out
 
 
+def _rate_bank(plan, path, scenario_method, num_scenarios, seed):
+    """Load the rate-path bank at path, or draw num_scenarios paths from plan and save them there."""
+    if scenario_method != "mc":
+        raise ValueError("--rate-bank only applies to --scenario-method mc.")
+    if path.exists():
+        click.echo(f"Reading rate paths from {path}.", err=True)
+        return RatePathBank.load(path)
+    # Seeded as the frontier seeds its own draws, so that a rerun draws the same bank.
+    plan.setReproducible(True, seed=0 if seed is None else seed)
+    click.echo(f"Saving {num_scenarios} rate paths to {path}.", err=True)
+    return RatePathBank.create(plan, num_scenarios, path)
+
+
 @click.command(
     name="frontier",
     epilog="Bequest levels are in the case's solver units (k by default). "
@@ -118,6 +131,14 @@ def _parse_float_list(value, what):
     help="Override any TOML parameter before solving. Repeat for multiple.",
 )
 @click.option("--seed", type=int, default=None, help="Random seed for the Monte Carlo draws.")
+@click.option(
+    "--rate-bank",
+    "rate_bank",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="Monte Carlo rate paths file (.npy). Drawn and saved there if it does not exist, "
+    "reused if it does, so that runs on variants of a case meet the same scenarios.",
+)
 @click.option(
     "--with-duals",
     "with_duals",
@@ -126,6 +147,15 @@ def _parse_float_list(value, what):
     help="Also compute the bequest shadow price, at one extra LP re-solve per level. "
     "Only surfaces under --output-format json; the text table reports the measured rate.",
 )
+@click.option(
+    "--warm-start/--cold-start",
+    "warm_start",
+    default=False,
+    show_default=True,
+    help="Start each solve from the solve of the same scenario at the level below, "
+    "or solve every level from scratch. Warm starts take fewer iterations, but a point "
+    "can land slightly off the cold frontier.",
+)
 @click.option(
     "--output-format",
     "output_format",
@@ -156,7 +186,9 @@ def cmd_frontier(
     solver_opts,
     set_overrides,
     seed,
+    rate_bank,
     with_duals,
+    warm_start,
     output_format,
     use_loguru,
 ):
@@ -191,6 +223,9 @@ def cmd_frontier(
 
     try:
         opts = parse_solver_options(opts)
+        bank = None
+        if rate_bank is not None:
+            bank = _rate_bank(plan, rate_bank, scenario_method.lower(), num_scenarios, seed)
         result = run_spending_bequest_frontier(
             plan,
             opts,
@@ -202,6 +237,8 @@ def cmd_frontier(
             success_rates=rates_pct,
             seed=seed,
             with_duals=with_duals,
+            bank=bank,
+            warm_start=warm_start,
         )
         summary = summarize_spending_bequest_frontier(
             result, target_success_rate_pct=target_success_rate
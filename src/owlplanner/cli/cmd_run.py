@@ -27,6 +27,7 @@ from pathlib import Path
 
 from owlplanner.config import load_toml, config_to_plan
 from owlplanner.config.schema import CLI_SOLVER_OVERRIDE_MAP, parse_solver_options
+from owlplanner.solvecache import cached_solve
 
 from .formatters import plan_to_json
 from .params_help import print_solver_options_help
@@ -162,6 +163,14 @@ def _parse_solver_opts(value):
     default=False,
     help="Route plan logs through loguru instead of the default stream handler.",
 )
+@click.option(
+    "--no-cache",
+    "no_cache",
+    is_flag=True,
+    default=False,
+    help="Solve afresh rather than reuse a cached solution. Solves are only cached when "
+    "OWL_SOLVE_CACHE_DIR names a directory.",
+)
 def cmd_run(
     filename: Path,
     with_config: str,
@@ -174,6 +183,7 @@ def cmd_run(
     set_overrides,
     output_format,
     use_loguru,
+    no_cache,
 ):
     """Run the retirement planning optimizer on an OWL case file.
 
@@ -211,7 +221,7 @@ def cmd_run(
     except Exception as e:
         raise click.BadParameter(str(e)) from e
 
-    plan.solve(plan.objective, opts)
+    cached_solve(plan, plan.objective, opts, use_cache=not no_cache)
 
     if output_format == "json":
         if plan.caseStatus == "solved":
@@ -540,7 +540,9 @@ def plan_to_config(myplan: "Plan") -> dict:
     return diconf
 
 
-def clone(plan: "Plan", newname=None, *, expectancy=None, verbose=True, logstreams=None) -> "Plan":
+def clone(
+    plan: "Plan", newname=None, *, expectancy=None, verbose=True, logstreams=None, shallow=False
+) -> "Plan":
     """
     Return a copy of plan, optionally with a new life expectancy.
 
@@ -566,13 +568,23 @@ def clone(plan: "Plan", newname=None, *, expectancy=None, verbose=True, logstrea
         Verbosity for the cloned plan's logger (ignored when expectancy is None).
     logstreams : optional
         Log streams for the cloned plan (ignored when expectancy is None).
+    shallow : bool
+        If True, return ``plan.scenario_view()``, which shares the plan's inputs
+        instead of copying them, for solving the plan on other rates.  Cannot be
+        combined with *expectancy*.
 
     Returns
     -------
     Plan
         A fresh copy of the plan.
     """
-    if expectancy is None:
+    if shallow:
+        if expectancy is not None:
+            raise ValueError("A shallow clone shares the horizon of its plan: expectancy cannot be changed.")
+        newplan = plan.scenario_view()
+        if logstreams is not None:
+            newplan.setLogstreams(verbose, logstreams)
+    elif expectancy is None:
         # logger __deepcopy__ sets the logstreams of new logger to None
         newplan = copy.deepcopy(plan)
 
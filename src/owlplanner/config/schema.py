@@ -200,6 +200,13 @@ class RatesSelection(BaseModel):
             "(historical_gaussian, historical_lognormal, historical_copula, garch_dcc, gmm, hmm)"
         ),
     )
+    sampling: Optional[Literal["random", "antithetic", "lhs", "sobol"]] = Field(
+        default=None,
+        description=(
+            "Variance reduction across Monte Carlo scenarios: random, antithetic, lhs or sobol "
+            "(gaussian, lognormal, historical_gaussian, historical_lognormal, historical_copula, garch_dcc, vector_ar)"
+        ),
+    )
 
 
 class AssetAllocation(BaseModel):
@@ -376,6 +383,7 @@ class SolverOptions(BaseModel):
     withDecomposition: Optional[str] = None
     withSSAges: Optional[Union[str, List[str]]] = None
     withDuals: Optional[bool] = None
+    withHotStart: Optional[bool] = None
     withdrawalOrder: Optional[str] = None
 
     # Other
@@ -0,0 +1,273 @@
+"""
+Persistent HiGHS model for the self-consistent loop.
+
+Between two iterations of the self-consistent loop the constraint matrix keeps its
+sparsity pattern: only the row bounds, a few coefficients, and some column bounds
+change (see Plan._buildConstraints). Passing the whole model to a new HiGHS instance
+on every iteration throws away the simplex basis of the previous solve.
+
+A :class:`HighsSession` keeps one ``highspy.Highs`` instance alive across solves. When
+the model passed to :meth:`HighsSession.solve` has the same structure as the previous
+one, only the differences are sent to HiGHS, through changeColsCost,
+changeColsBounds, changeRowsBounds and changeCoeff. HiGHS keeps the basis of the last
+solve through these changes, so an LP re-solve becomes a short dual-simplex hot start.
+A MIP is re-solved by branch and bound as before, with the previous solution passed
+as a hint.
+
+The loop only keeps a session with the ``withHotStart`` solver option, or when it starts
+from a neighbouring case's basis. Where an LP optimum is degenerate, a hot start can
+return another optimal vertex than a cold solve, and an oscillating loop can then settle
+on another fixed point: by default every iteration is solved cold, by a one-shot session.
+
+A session can also start from the basis of another session, saved with basis(): a
+neighbouring case, solved just before, whose model only differs in a few bounds.
+
+Given an ``interrupt`` callable, the simplex, interior-point and branch-and-bound loops
+of HiGHS poll it and stop the solve once it returns True. An interrupted solve fails.
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import time
+
+import numpy as np
+
+# Above this fraction of changed coefficients, re-passing the model is cheaper than
+# sending the changes one coefficient at a time.
+MAX_COEFF_CHANGES = 0.1
+
+
+def _finite(vec, inf):
+    """Map numpy infinities to HiGHS infinity."""
+    vec = np.asarray(vec, dtype=np.float64)
+    return np.where(np.isneginf(vec), -inf, np.where(np.isposinf(vec), inf, vec))
+
+
+class HighsSession:
+    """
+    One HiGHS instance reused across solves of models sharing the same structure.
+
+    Each call to solve() records a (mode, seconds, simplex iterations) entry in
+    ``history``, where mode is "cold" when the model was passed in full, "hot" when it
+    was updated in place, and "interrupted" when the interrupt stopped it from starting.
+
+    ``basis``, as returned by basis(), is the simplex basis the first LP solve starts from.
+    ``interrupt``, if given, is called during every solve, which stops once it returns True.
+    """
+
+    def __init__(self, basis=None, interrupt=None):
+        self.h = None
+        self.history = []
+        self._model = None
+        self._basis = basis
+        self._interrupt = interrupt
+
+    def close(self):
+        """Release the HiGHS instance."""
+        self.h = None
+        self._model = None
+
+    def basis(self):
+        """
+        Return the basis of the last solve as a pair of int8 arrays of column and row
+        statuses, which can start another session; None without a valid basis.
+        """
+        if self.h is None:
+            return None
+        basis = self.h.getBasis()
+        if not basis.valid:
+            return None
+        return (
+            np.array([int(st) for st in basis.col_status], dtype=np.int8),
+            np.array([int(st) for st in basis.row_status], dtype=np.int8),
+        )
+
+    def _setBasis(self, highspy, basis, ncols, nrows):
+        """Start the next solve from basis, as returned by basis(), if it fits the model."""
+        cols, rows = basis
+        if len(cols) != ncols or len(rows) != nrows:
+            return
+        basis = highspy.HighsBasis()
+        basis.col_status = [highspy.HighsBasisStatus(int(st)) for st in cols]
+        basis.row_status = [highspy.HighsBasisStatus(int(st)) for st in rows]
+        basis.valid = True
+        self.h.setBasis(basis)
+
+    def _sameStructure(self, c, a_start, a_index, integrality):
+        m = self._model
+        return (
+            m is not None
+            and len(c) == len(m["c"])
+            and len(a_start) == len(m["a_start"])
+            and len(a_index) == len(m["a_index"])
+            and np.array_equal(a_start, m["a_start"])
+            and np.array_equal(a_index, m["a_index"])
+            and np.array_equal(integrality, m["integrality"])
+        )
+
+    def _passModel(self, highspy, model):
+        h = highspy.Highs()
+        h.passModel(
+            len(model["c"]),
+            len(model["row_lb"]),
+            len(model["a_value"]),
+            int(highspy.MatrixFormat.kRowwise),  # 2 — NOT 1 (kColwise)
+            int(highspy.ObjSense.kMinimize),  # 1
+            0.0,  # offset
+            model["c"],
+            model["col_lb"],
+            model["col_ub"],
+            model["row_lb"],
+            model["row_ub"],
+            model["a_start"],
+            model["a_index"],
+            model["a_value"],
+            model["integrality"],
+        )
+        if self._interrupt is not None:
+            for name in ("cbSimplexInterrupt", "cbIpmInterrupt", "cbMipInterrupt"):
+                getattr(h, name).subscribe(self._poll)
+        self.h = h
+
+    def _poll(self, event):
+        if self._interrupt():
+            event.interrupt()
+
+    def _update(self, model):
+        """
+        Send the differences between ``model`` and the model held by HiGHS.
+        Return False when too many coefficients changed for an in-place update.
+        """
+        old = self._model
+        changed = np.flatnonzero(model["a_value"] != old["a_value"])
+        if len(changed) > MAX_COEFF_CHANGES * max(len(model["a_value"]), 1):
+            return False
+
+        h = self.h
+        idx = np.flatnonzero(model["c"] != old["c"]).astype(np.int32)
+        if len(idx):
+            h.changeColsCost(len(idx), idx, model["c"][idx])
+        idx = np.flatnonzero((model["col_lb"] != old["col_lb"]) | (model["col_ub"] != old["col_ub"])).astype(np.int32)
+        if len(idx):
+            h.changeColsBounds(len(idx), idx, model["col_lb"][idx], model["col_ub"][idx])
+        idx = np.flatnonzero((model["row_lb"] != old["row_lb"]) | (model["row_ub"] != old["row_ub"])).astype(np.int32)
+        if len(idx):
+            h.changeRowsBounds(len(idx), idx, model["row_lb"][idx], model["row_ub"][idx])
+        if len(changed):
+            counts = np.diff(np.append(model["a_start"], len(model["a_value"])))
+            rows = np.repeat(np.arange(len(counts)), counts)[changed]
+            for row, col, val in zip(rows, model["a_index"][changed], model["a_value"][changed], strict=True):
+                h.changeCoeff(int(row), int(col), float(val))
+
+        return True
+
+    def solve(
+        self,
+        c,
+        Lb,
+        Ub,
+        lbvec,
+        ubvec,
+        a_start,
+        a_index,
+        a_value,
+        integrality,
+        time_limit,
+        gap,
+        verbose=False,
+        warm_x=None,
+    ):
+        """
+        Solve the model described by the arrays of Plan._run_highs(), updating the
+        previous model in place when the structure is unchanged. Arguments ``time_limit``
+        (seconds) and ``gap`` (relative MIP gap) are applied to every solve.
+
+        Returns (objfn, xx, success, msg, gap) matching the _milpSolve contract.
+        """
+        import highspy
+
+        if self._interrupt is not None and self._interrupt():
+            self.close()
+            self.history.append(("interrupted", 0.0, 0))
+            return None, np.zeros(len(c)), False, "Interrupted by user", -1.0
+
+        inf = highspy.kHighsInf
+        model = {
+            "c": np.asarray(c, dtype=np.float64),
+            "col_lb": _finite(Lb, inf),
+            "col_ub": _finite(Ub, inf),
+            "row_lb": _finite(lbvec, inf),
+            "row_ub": _finite(ubvec, inf),
+            "a_start": np.asarray(a_start, dtype=np.int32),
+            "a_index": np.asarray(a_index, dtype=np.int32),
+            "a_value": np.asarray(a_value, dtype=np.float64),
+            "integrality": np.asarray(integrality, dtype=np.int32),
+        }
+
+        hot = self.h is not None and self._sameStructure(
+            model["c"], model["a_start"], model["a_index"], model["integrality"]
+        )
+        if not (hot and self._update(model)):
+            hot = False
+            self._passModel(highspy, model)
+        self._model = model
+
+        h = self.h
+        h.setOptionValue("output_flag", bool(verbose))
+        h.setOptionValue("mip_rel_gap", float(gap))
+        h.setOptionValue("time_limit", float(time_limit))
+        h.setOptionValue("mip_max_nodes", 1_000_000)
+        h.setOptionValue("presolve", "on")
+
+        if warm_x is not None:
+            all_idx = np.arange(len(c), dtype=np.int32)
+            h.setSolution(len(c), all_idx, np.asarray(warm_x, dtype=np.float64))
+        # Only the first solve of the session, and only an LP: branch and bound has its own
+        # start. Set after the solution, so that the simplex starts from this basis.
+        basis, self._basis = self._basis, None
+        if basis is not None and not hot and not model["integrality"].any():
+            self._setBasis(highspy, basis, len(c), len(model["row_lb"]))
+
+        t0 = time.perf_counter()
+        h.run()
+        elapsed = time.perf_counter() - t0
+        self.history.append(("hot" if hot else "cold", elapsed, int(h.getInfoValue("simplex_iteration_count")[1])))
+
+        ms = h.getModelStatus()
+        _, pstatus = h.getInfoValue("primal_solution_status")
+        # An interrupted MIP can hold a feasible solution, but not one to rely on.
+        success = ms != highspy.HighsModelStatus.kInterrupt and (
+            ms in (highspy.HighsModelStatus.kOptimal, highspy.HighsModelStatus.kObjectiveBound)
+            or pstatus == highspy.kSolutionStatusFeasible
+        )
+
+        if success:
+            sol = h.getSolution()
+            xx = np.array(sol.col_value, dtype=np.float64)
+            obj_val = float(h.getObjectiveValue())
+            # mip_gap is meaningless on a pure LP; -1 is the convention for those solves.
+            achieved = h.getInfoValue("mip_gap")[1] if model["integrality"].any() else -1.0
+        else:
+            xx = np.zeros(len(c))
+            obj_val = None
+            achieved = -1.0
+
+        msg = h.modelStatusToString(ms)
+        if not success:
+            # Do not hot start from a failed solve.
+            self.close()
+
+        return obj_val, xx, success, msg, float(achieved)
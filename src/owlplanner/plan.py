@@ -22,6 +22,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 ###########################################################################
+import copy
 import numpy as np
 import pandas as pd
 from datetime import date, datetime
@@ -33,6 +34,7 @@ import time
 import textwrap
 
 from . import amorepair
+from . import highssession
 from . import utils as u
 from . import tax_federal as tx
 from . import tax_state
@@ -50,8 +52,11 @@ from . import mylogging as log
 from .config.plan_bridge import clone  # noqa: F401
 from .config.schema import REMOVED_OPTIONS
 from .plotting.factory import PlotFactory
-from .rate_models.constants import CONSTRAIN_MEAN_METHODS, HISTORICAL_RANGE_METHODS
-from .stresstests import run_historical_range, run_mc, run_spending_bequest_frontier, run_stochastic_spending
+from .rate_models.constants import CONSTRAIN_MEAN_METHODS, HISTORICAL_RANGE_METHODS, SAMPLING_METHODS
+from .stresstests import iter_scenarios, iter_spending_bequest_frontier, run_historical_range, run_mc
+from .stresstests import run_spending_bequest_frontier
+from .stresstests import STREAM_BINS, run_stochastic_spending
+from .trajectories import DEFAULT_PERCENTILES, TRAJECTORY_FIELDS
 from .varmap import VarMap
 
 
@@ -99,6 +104,36 @@ EPSILON = 1e-8
 MIP_TIEBREAK = 1e-4
 LTCG_CONSISTENCY_MAX_PASSES = 5  # max monolithic re-solves to clear stale LTCG bracket room
 LTCG_CONSISTENCY_TOL = 1.0  # allowed U_n - 0.20*Q_n slack ($) before a re-solve is needed
+# What the rows and bounds of a constraint emitter depend on; see _constraintEmitters().
+EMIT_FIXED = 0  # plan inputs and solver options only
+EMIT_RATES = 1  # also the rates: tau_kn, gamma_n, and the inflation-indexed parameters
+EMIT_LOOP = 2  # also the parameters updated by the self-consistent loop
+# Loop parameters a warm start hands over: those the constraints of the first LP are built
+# from. See setWarmStart().
+WARM_START_PARAMS = ("Psi_n", "M_n", "J_n", "ACA_n", "MAGI_n", "MAGI_aca_n", "G_n", "gain_fraction_in")
+
+# Plan inputs that solving only reads: scenario views share them with their plan.
+# Only setters change them in place (setAllocationRatios, readHFP, setContributions...).
+SCENARIO_SHARED = frozenset(
+    {
+        "timeLists",
+        "houseLists",
+        "rawHFP",
+        "alpha_ijkn",
+        "omega_in",
+        "other_inc_in",
+        "netinv_in",
+        "Lambda_in",
+        "kappa_ijn",
+        "zeta_in",
+        "pi_in",
+        "xi_n",
+        "yobs",
+        "mobs",
+        "horizons",
+        "year_n",
+    }
+)
 
 
 ############################################################################
@@ -372,6 +407,9 @@ class Plan:
 
         # Initialize guardrails to ensure proper configuration.
         self._adjustedParameters = False
+        self._modelTemplates = None  # Shared constraint templates; see setModelTemplateCache()
+        self._warmStartIn = None  # Neighbouring solve to start the next solve() from; see setWarmStart()
+        self._solveInterrupt = None  # Stops HiGHS solves once it returns True; see setSolveInterrupt()
         self.hfpFileName = "None"
         self.timeLists = {}
         self.houseLists = {}
@@ -1077,6 +1115,77 @@ class Plan:
             # setRates() will generate a new seed each time it's called
             self.rateSeed = None
 
+    def scenario_view(self):
+        """
+        Return a lightweight copy of this plan for solving it on other rates.
+
+        Inputs listed in SCENARIO_SHARED are shared with this plan as read-only views;
+        other arrays, dicts and lists are copied one level deep, and all other objects
+        (rate model, logger, plotter, template cache) are shared. A view costs little more
+        than copying the plan's attribute dictionary, where clone() deep-copies everything.
+        Setting rates, options, or pinned Roth conversions on a view and solving it leaves
+        this plan unchanged, but setters that rewrite the shared inputs cannot be used on it.
+        """
+        view = copy.copy(self)
+        for name, value in self.__dict__.items():
+            if name in SCENARIO_SHARED:
+                if isinstance(value, np.ndarray):
+                    value = value.view()
+                    value.flags.writeable = False
+                    setattr(view, name, value)
+            elif isinstance(value, np.ndarray):
+                setattr(view, name, value.copy())
+            elif isinstance(value, (dict, list)):
+                setattr(view, name, copy.copy(value))
+
+        return view
+
+    def setModelTemplateCache(self, templates):
+        """
+        Attach a cache of model templates, or detach it with None.
+
+        A model template holds the constraint matrix and bounds of one plan structure,
+        from which a solve on other rates only re-runs the constraint emitters that depend
+        on rates. Scenario engines that solve the same plan under many rate sequences share
+        one abcapi.TemplateCache between the plan and its clones.
+        """
+        self._modelTemplates = templates
+
+    def setSolveInterrupt(self, interrupt):
+        """
+        Stop the HiGHS solves of this plan once interrupt() returns True, or never if None.
+
+        HiGHS polls interrupt from its simplex, interior-point and branch-and-bound loops.
+        An interrupted solve fails, and so does the solve() it was part of. Scenario engines
+        use it to abort the solves in flight when a run is out of time or cancelled. MOSEK
+        solves cannot be interrupted.
+        """
+        self._solveInterrupt = interrupt
+
+    def setWarmStart(self, warm):
+        """
+        Start the next solve() from warm, the state getWarmStart() returned for a
+        neighbouring case, or from scratch if warm is None.
+
+        Cases that differ by little -- one bequest floor, say -- converge to nearly the
+        same loop parameters and solution. The next solve then builds its first LP with
+        the parameters warm converged to rather than the defaults, passes its solution
+        to HiGHS as a MIP hint, and starts the simplex from its basis. The answer is
+        still a fixed point of this case's self-consistent loop; only the path to it is
+        shorter. A warm start from a model of another size is ignored. It is used once.
+        """
+        self._warmStartIn = warm
+
+    def getWarmStart(self):
+        """
+        Return the state a neighbouring case can start its solve() from through
+        setWarmStart(), or None if this plan is not solved: the accepted solution
+        vector, the loop parameters its LP was built with, and the final HiGHS basis.
+        """
+        if self.caseStatus != "solved":
+            return None
+        return getattr(self, "_warmStartOut", None)
+
     def setRates(
         self,
         method,
@@ -1155,6 +1264,12 @@ class Plan:
                 f"Supported methods: {', '.join(CONSTRAIN_MEAN_METHODS)}.",
                 tag="WARNING",
             )
+        if model_config.get("sampling", "random") != "random" and method not in SAMPLING_METHODS:
+            self.mylog.print(
+                f"sampling='{model_config['sampling']}' has no effect for rate method '{method}'. "
+                f"Supported methods: {', '.join(SAMPLING_METHODS)}.",
+                tag="WARNING",
+            )
 
         if method == "dataframe":
             model_config["n_years"] = self.N_n
@@ -2228,45 +2343,160 @@ class Plan:
         """
         Utility function that builds constraint matrix and vectors.
         Refactored for clarity and maintainability.
+        Inside the self-consistent loop, only the first call assembles everything;
+        later calls patch the rows and bounds that depend on loop parameters.
         """
         # Ensure parameters are adjusted for inflation and MAGI.
         # OBBBA 65+ senior-deduction phaseout uses the AGI-basis MAGI (taxable SS only).
         self._adjustParameters(self.gamma_n, self.MAGI_n)
         self.other_medical_n = self.other_medical_k * self.gamma_n[:-1]
 
-        self.A = abc.ConstraintMatrix(self.nvars)
-        self.B = abc.Bounds(self.nvars, self.nbins)
+        emitters = self._constraintEmitters(objective, options)
+        key = (objective, id(options))
+        pattern = self._lpPattern
+        if pattern is None or pattern["key"] != key or not self._patchConstraints(pattern, emitters, EMIT_LOOP):
+            segments = self._templateConstraints(objective, options, emitters)
+            if self._reuseLpPattern:
+                self._lpPattern = {"A": self.A.copy(), "B": self.B.copy(), "segments": segments, "key": key}
+        self._build_objective_vector(objective, options)
 
-        self._add_rmd_inequalities()
-        self._add_tax_bracket_bounds()
-        self._add_standard_exemption_bounds()
+    def _constraintEmitters(self, objective, options):
+        """
+        Return the constraint emitters in build order as (method, args, level) tuples.
+        The level tells what the rows or bounds an emitter adds depend on:
+        EMIT_LOOP for quantities the self-consistent loop updates between iterations
+        (M_n, J_n, ACA_n, Psi_n, I_n, G_n, the MAGI-dependent tax parameters, gain
+        fractions, and claiming-age benefits), EMIT_RATES for the rates and everything
+        indexed by inflation, and EMIT_FIXED for plan inputs and options alone.
+        """
+        emitters = [
+            (self._add_rmd_inequalities, (), EMIT_FIXED),
+            (self._add_tax_bracket_bounds, (), EMIT_RATES),
+            (self._add_standard_exemption_bounds, (), EMIT_LOOP),
+        ]
         if self._st_lp:
-            self._add_state_tax_bounds()
-        self._add_defunct_constraints()
-        self._add_roth_conversion_constraints(options)
-        self._add_safety_net(options)
-        self._add_roth_maturation_constraints()
-        self._add_withdrawal_limits()
-        self._add_withdrawal_ordering(options)
-        self._add_objective_constraints(objective, options)
-        self._add_initial_balances()
-        self._add_surplus_deposit_linking(options)
-        self._add_account_balance_carryover()
-        self._add_net_cash_flow(options)
-        self._add_income_profile(objective)
-        self._add_taxable_income(options)
+            emitters.append((self._add_state_tax_bounds, (), EMIT_RATES))
+        emitters += [
+            (self._add_defunct_constraints, (), EMIT_FIXED),
+            (self._add_roth_conversion_constraints, (options,), EMIT_FIXED),
+            (self._add_safety_net, (options,), EMIT_RATES),
+            (self._add_roth_maturation_constraints, (), EMIT_RATES),
+            (self._add_withdrawal_limits, (), EMIT_LOOP),
+            (self._add_withdrawal_ordering, (options,), EMIT_RATES),
+            (self._add_objective_constraints, (objective, options), EMIT_RATES),
+            (self._add_initial_balances, (), EMIT_RATES),
+            (self._add_surplus_deposit_linking, (options,), EMIT_FIXED),
+            (self._add_account_balance_carryover, (), EMIT_RATES),
+            (self._add_net_cash_flow, (options,), EMIT_LOOP),
+            (self._add_income_profile, (objective,), EMIT_RATES),
+            (self._add_taxable_income, (options,), EMIT_LOOP),
+        ]
         if self._st_lp:
-            self._add_state_taxable_income()
-        self._configure_ss_taxability_lp(options)
-        self._configure_ss_age_variables()
-        self._configure_ltcg_constraints()
-        self._configure_Medicare_binary_variables(options)
-        self._add_Medicare_costs(options)
-        self._configure_ACA_binary_variables(options)
-        self._add_ACA_costs(options)
-        self._add_magi_lp(options)
-        self._configure_NIIT_binary_variables(options)
-        self._build_objective_vector(objective, options)
+            emitters.append((self._add_state_taxable_income, (), EMIT_LOOP))
+        emitters += [
+            (self._configure_ss_taxability_lp, (options,), EMIT_LOOP),
+            (self._configure_ss_age_variables, (), EMIT_LOOP),
+            (self._configure_ltcg_constraints, (), EMIT_LOOP),
+            (self._configure_Medicare_binary_variables, (options,), EMIT_LOOP),
+            (self._add_Medicare_costs, (options,), EMIT_RATES),
+            (self._configure_ACA_binary_variables, (options,), EMIT_LOOP),
+            (self._add_ACA_costs, (options,), EMIT_RATES),
+            (self._add_magi_lp, (options,), EMIT_FIXED),
+            (self._configure_NIIT_binary_variables, (options,), EMIT_LOOP),
+        ]
+
+        return emitters
+
+    def _assembleConstraints(self, emitters):
+        """
+        Build A and B from scratch by running all emitters. Return the segments that
+        locate in A and B what each emitter not at EMIT_FIXED level added, as
+        (name, start, end, level) tuples with (row, element, bound) offsets.
+        """
+        self.A = abc.ConstraintMatrix(self.nvars)
+        self.B = abc.Bounds(self.nvars, self.nbins)
+        segments = []
+        for method, args, level in emitters:
+            start = (self.A.ncons, self.A.nnz, len(self.B.ind))
+            method(*args)
+            if level > EMIT_FIXED:
+                end = (self.A.ncons, self.A.nnz, len(self.B.ind))
+                segments.append((method.__name__, start, end, level))
+
+        return segments
+
+    def _patchConstraints(self, pattern, emitters, level):
+        """
+        Rebuild A and B from a pattern holding a copy of A and B and their segments
+        by re-running only the emitters at or above ``level`` and patching their
+        coefficients and bounds in place, matched row by row on tags. Return False,
+        leaving a full rebuild to the caller, if the emitters no longer match the pattern.
+        Patterns recorded at EMIT_LOOP level are only valid for the solve that recorded
+        them, as objective and options are part of what they assume fixed.
+        """
+        rerun = [(method, args) for method, args, lvl in emitters if lvl >= level]
+        segments = [seg for seg in pattern["segments"] if seg[3] >= level]
+        if [method.__name__ for method, _ in rerun] != [name for name, _, _, _ in segments]:
+            return False
+
+        A = pattern["A"].copy()
+        B = pattern["B"].copy()
+        try:
+            for (method, args), (_, start, end, _) in zip(rerun, segments, strict=True):
+                self.A = abc.ConstraintMatrix(self.nvars)
+                self.B = abc.Bounds(self.nvars, 0)
+                method(*args)
+                if (self.A.ncons, self.A.nnz, len(self.B.ind)) != tuple(e - s for s, e in zip(start, end, strict=True)):
+                    raise ValueError(f"{method.__name__} changed size.")
+                A.patch(self.A, start[0], start[1])
+                B.patch(self.B, start[2])
+        except ValueError as e:
+            self.mylog.vprint(f"Rebuilding constraints: {e}")
+            return False
+
+        self.A = A
+        self.B = B
+        return True
+
+    def _modelSignature(self, objective, options):
+        """
+        Return a key identifying everything the constraint layout and the rows of
+        EMIT_FIXED emitters depend on. Two solves sharing it only differ by rates or
+        by loop parameters, so they can share a model template.
+        """
+        return (
+            objective,
+            repr(sorted(options.items())),
+            self.vm.signature,
+            int(self.year_n[0]),
+            self.N_n,
+            self.n_d,
+            self.i_d,
+            self.i_s,
+            self.eta,
+            tuple(int(h) for h in self.horizons),
+            abc.digest(self.beta_ij, self.rho_in, self.myRothX_in),
+        )
+
+    def _templateConstraints(self, objective, options, emitters):
+        """
+        Build A and B, starting from the model template of this structure when a template
+        cache is attached to the plan (see setModelTemplateCache()): the rows of EMIT_FIXED
+        emitters are then copied, and only the emitters depending on rates are re-run.
+        Return the segments of the non-fixed emitters, as _assembleConstraints() does.
+        """
+        templates = self._modelTemplates
+        if templates is None:
+            return self._assembleConstraints(emitters)
+
+        signature = self._modelSignature(objective, options)
+        template = templates.get(signature)
+        if template is not None and self._patchConstraints(template, emitters, EMIT_RATES):
+            return template["segments"]
+
+        segments = self._assembleConstraints(emitters)
+        templates.put(signature, {"A": self.A.copy(), "B": self.B.copy(), "segments": segments})
+        return segments
 
     def _add_rmd_inequalities(self):
         """
@@ -2285,34 +2515,33 @@ class Plan:
         """
         for i in range(self.N_i):
             if self.beta_ij[i, 1] > 0:
-                for n in range(self.horizons[i]):
-                    rowDic = {
-                        self.vm["w"].idx(i, 1, n): 1,
-                        self.vm["b"].idx(i, 1, n): -self.rho_in[i, n],
-                    }
-                    self.A.addNewRow(rowDic, 0, np.inf, tag=("rmd", i, n))
+                h = self.horizons[i]
+                nn = np.arange(h)
+                self.A.addRows(
+                    h,
+                    [(self.vm["w"].idx(i, 1, nn), 1), (self.vm["b"].idx(i, 1, nn), -self.rho_in[i, :h])],
+                    0,
+                    np.inf,
+                    tags=[("rmd", i, n) for n in range(h)],
+                )
 
     def _add_tax_bracket_bounds(self):
-        for t in range(self.N_t):
-            for n in range(self.N_n):
-                self.B.setRange(self.vm["f"].idx(t, n), 0, self.DeltaBar_tn[t, n])
+        tt, nn = np.ogrid[: self.N_t, : self.N_n]
+        self.B.setRanges(self.vm["f"].idx(tt, nn), 0, self.DeltaBar_tn[:, : self.N_n])
 
     def _add_standard_exemption_bounds(self):
-        for n in range(self.N_n):
-            self.B.setRange(self.vm["e"].idx(n), 0, self.sigmaBar_n[n])
+        self.B.setRanges(self.vm["e"].idx(np.arange(self.N_n)), 0, self.sigmaBar_n[: self.N_n])
 
     def _add_state_tax_bounds(self):
         """Set variable bounds for state income tax LP variables."""
         vm = self.vm
-        for t in range(self.N_st):
-            for n in range(self.N_n):
-                self.B.setRange(vm["st_f"].idx(t, n), 0, self.st_DeltaBar_tn[t, n])
-        for n in range(self.N_n):
-            self.B.setRange(vm["st_e"].idx(n), 0, self.st_sigmaBar_n[n])
+        tt, nn = np.ogrid[: self.N_st, : self.N_n]
+        self.B.setRanges(vm["st_f"].idx(tt, nn), 0, self.st_DeltaBar_tn[:, : self.N_n])
+        nn = np.arange(self.N_n)
+        self.B.setRanges(vm["st_e"].idx(nn), 0, self.st_sigmaBar_n[: self.N_n])
         if "st_re" in vm:
-            for n in range(self.N_n):
-                cap = self.st_re_cap_n[n]
-                self.B.setRange(vm["st_re"].idx(n), 0, cap if np.isfinite(cap) else 1e9)
+            cap = self.st_re_cap_n[: self.N_n]
+            self.B.setRanges(vm["st_re"].idx(nn), 0, np.where(np.isfinite(cap), cap, 1e9))
 
     def _add_state_taxable_income(self):
         """Equality constraint: state bracket allocations = state AGI - deductions.
@@ -2326,42 +2555,35 @@ class Plan:
         exemption (st_re), with st_e and st_re bounded to prevent negative state tax.
         """
         vm = self.vm
-        for n in range(self.N_n):
-            # SS adjustment: federal G_n contains Psi_n * zetaBar; remove if state excludes SS.
-            ss_excl = 0.0 if self.st_tax_ss else self.Psi_n[n] * float(np.sum(self.zetaBar_in[:, n]))
-            # Pension exemption (parameter): cap = per-person; N_i persons.
-            pe_total = float(np.sum(self.piBar_in[:, n]))
-            pe_cap = float(self.st_pe_cap_n[n]) if np.isfinite(self.st_pe_cap_n[n]) else pe_total
-            pe_adj = min(pe_total, pe_cap * self.N_i)
-            rhs = -ss_excl - pe_adj
-
-            row = self.A.newRow()
-            for t in range(self.N_st):
-                row.addElem(vm["st_f"].idx(t, n), 1)  # state brackets (sum = state taxable income)
-            row.addElem(vm["st_e"].idx(n), 1)  # state standard deduction
-            if "st_re" in vm:
-                row.addElem(vm["st_re"].idx(n), 1)  # retirement income exemption
-            for t in range(self.N_t):
-                row.addElem(vm["f"].idx(t, n), -1)  # subtract G_n (federal ordinary income)
-            for p in range(self.N_p):
-                row.addElem(vm["q"].idx(p, n), -1)  # subtract Q_n (capital gains)
-            self.A.addRow(row, rhs, rhs, tag=("state_taxable_income", n))
+        N_n = self.N_n
+        nn = np.arange(N_n)
+        # SS adjustment: federal G_n contains Psi_n * zetaBar; remove if state excludes SS.
+        ss_excl = 0.0 if self.st_tax_ss else self.Psi_n[:N_n] * np.sum(self.zetaBar_in[:, :N_n], axis=0)
+        # Pension exemption (parameter): cap = per-person; N_i persons.
+        pe_total = np.sum(self.piBar_in[:, :N_n], axis=0)
+        pe_cap = np.where(np.isfinite(self.st_pe_cap_n[:N_n]), self.st_pe_cap_n[:N_n], pe_total)
+        pe_adj = np.minimum(pe_total, pe_cap * self.N_i)
+        rhs = -ss_excl - pe_adj
+
+        terms = [(vm["st_f"].idx(t, nn), 1) for t in range(self.N_st)]  # state brackets (sum = taxable income)
+        terms.append((vm["st_e"].idx(nn), 1))  # state standard deduction
+        if "st_re" in vm:
+            terms.append((vm["st_re"].idx(nn), 1))  # retirement income exemption
+        terms += [(vm["f"].idx(t, nn), -1) for t in range(self.N_t)]  # subtract G_n (federal ordinary income)
+        terms += [(vm["q"].idx(p, nn), -1) for p in range(self.N_p)]  # subtract Q_n (capital gains)
+        self.A.addRows(N_n, terms, rhs, rhs, tags=[("state_taxable_income", n) for n in range(N_n)])
 
         # IRA withdrawal cap: can't exempt more IRA income than actually withdrawn.
         if "st_re" in vm:
-            for n in range(self.N_n):
-                row = self.A.newRow({vm["st_re"].idx(n): 1})
-                for i in range(self.N_i):
-                    row.addElem(vm["w"].idx(i, 1, n), -1)
-                self.A.addRow(row, -np.inf, 0, tag=("state_ret_exempt_cap", n))
+            terms = [(vm["st_re"].idx(nn), 1)] + [(vm["w"].idx(i, 1, nn), -1) for i in range(self.N_i)]
+            self.A.addRows(N_n, terms, -np.inf, 0, tags=[("state_ret_exempt_cap", n) for n in range(N_n)])
 
     def _add_defunct_constraints(self):
         if self.N_i == 2:
-            for n in range(self.n_d, self.N_n):
-                self.B.setRange(self.vm["d"].idx(self.i_d, n), 0, 0)
-                self.B.setRange(self.vm["x"].idx(self.i_d, n), 0, 0)
-                for j in range(self.N_j):
-                    self.B.setRange(self.vm["w"].idx(self.i_d, j, n), 0, 0)
+            nn = np.arange(self.n_d, self.N_n)
+            jj = np.arange(self.N_j)[None, :]
+            idx = np.column_stack((self.vm["d"].idx(self.i_d, nn), self.vm["x"].idx(self.i_d, nn)))
+            self.B.setRanges(np.hstack((idx, self.vm["w"].idx(self.i_d, jj, nn[:, None]))), 0, 0)
 
     def _add_roth_maturation_constraints(self):
         """
@@ -2387,30 +2609,35 @@ class Plan:
         oldTau1 = 1.10
         for i in range(self.N_i):
             h = self.horizons[i]
-            for n in range(h):
-                rhs = 0
-                # To add compounded gains to cumulative amounts. Always keep cgains >= 1.
-                cgains = 1
-                row = self.A.newRow()
-                row.addElem(self.vm["b"].idx(i, 2, n), 1)
-                row.addElem(self.vm["w"].idx(i, 2, n), -1)
-                for dn in range(1, 6):
-                    nn = n - dn
-                    if nn >= 0:  # Past of future is now or in the future: use variables or parameters.
-                        Tau1 = 1 + np.sum(self.alpha_ijkn[i, 2, :, nn] * self.tau_kn[:, nn], axis=0)
-                        # Ignore market downs.
-                        cgains *= max(1, Tau1)
-                        row.addElem(self.vm["x"].idx(i, nn), -cgains)
-                        # If a contribution, it has only penalty on gains, not on deposited amount.
-                        rhs += (cgains - 1) * self.kappa_ijn[i, 2, nn]
-                    else:  # Past of future is in the past:
-                        cgains *= oldTau1
-                        # Past years are stored at the end of contributions and conversions arrays.
-                        # Use negative index to access tail of array.
-                        # Past years are stored at the end of arrays, accessed via negative indexing
-                        rhs += (cgains - 1) * self.kappa_ijn[i, 2, nn] + cgains * self.myRothX_in[i, nn]
-
-                self.A.addRow(row, rhs, np.inf, tag=("roth_maturation", i, n))
+            n = np.arange(h)
+            # Ignore market downs.
+            Tau1_n = np.maximum(1, 1 + np.sum(self.alpha_ijkn[i, 2, :, :h] * self.tau_kn[:, :h], axis=0))
+            # Lookback years nn = n - dn for dn = 1..5, one column per dn.
+            nn = n[:, None] - np.arange(1, 6)
+            future = nn >= 0  # Past of future is now or in the future: use variables or parameters.
+            # To add compounded gains to cumulative amounts. Always keep cgains >= 1.
+            # Past years compound at oldTau1.
+            cgains = np.cumprod(np.where(future, Tau1_n[np.maximum(nn, 0)], oldTau1), axis=1)
+            rhs = np.zeros(h)
+            for dn in range(5):
+                # If a contribution, it has only penalty on gains, not on deposited amount.
+                # Past years are stored at the end of contributions and conversions arrays,
+                # accessed via negative indexing.
+                past = np.where(future[:, dn], 0.0, cgains[:, dn] * self.myRothX_in[i, nn[:, dn]])
+                rhs += (cgains[:, dn] - 1) * self.kappa_ijn[i, 2, nn[:, dn]] + past
+
+            cols = np.column_stack((self.vm["b"].idx(i, 2, n), self.vm["w"].idx(i, 2, n), self.vm["x"].idx(i, nn)))
+            vals = np.column_stack((np.ones(h), -np.ones(h), -cgains))
+            keep = np.column_stack((np.ones((h, 2), dtype=bool), future))
+            self.A.addBlock(
+                h,
+                np.broadcast_to(n[:, None], keep.shape)[keep],
+                cols[keep],
+                vals[keep],
+                rhs,
+                np.inf,
+                tags=[("roth_maturation", i, k) for k in range(h)],
+            )
 
     def _add_roth_conversion_constraints(self, options):
         """
@@ -2433,8 +2660,7 @@ class Plan:
                 i_xcluded = self.inames.index(rhsopt)
             except ValueError as e:
                 raise ValueError(f"Unknown individual '{rhsopt}' for noRothConversions:") from e
-            for n in range(self.horizons[i_xcluded]):
-                self.B.setRange(self.vm["x"].idx(i_xcluded, n), 0, 0)
+            self.B.setRanges(self.vm["x"].idx(i_xcluded, np.arange(self.horizons[i_xcluded])), 0, 0)
 
         if "maxRothConversion" in options:
             rhsopt = u.get_monetary_option(options, "maxRothConversion", 0)
@@ -2443,9 +2669,8 @@ class Plan:
                 for i in range(self.N_i):
                     if i == i_xcluded:
                         continue
-                    for n in range(self.horizons[i]):
-                        # Apply the cap per individual.
-                        self.B.setRange(self.vm["x"].idx(i, n), 0, rhsopt)
+                    # Apply the cap per individual.
+                    self.B.setRanges(self.vm["x"].idx(i, np.arange(self.horizons[i])), 0, rhsopt)
 
         if "startRothConversions" in options:
             rhsopt = int(u.get_numeric_option(options, "startRothConversions", 0))
@@ -2455,8 +2680,7 @@ class Plan:
                 if i == i_xcluded:
                     continue
                 nstart = min(yearn, self.horizons[i])
-                for n in range(0, nstart):
-                    self.B.setRange(self.vm["x"].idx(i, n), 0, 0)
+                self.B.setRanges(self.vm["x"].idx(i, np.arange(nstart)), 0, 0)
 
         if "swapRothConverters" in options and i_xcluded == -1:
             rhsopt = int(u.get_numeric_option(options, "swapRothConverters", 0))
@@ -2468,19 +2692,16 @@ class Plan:
                 i_y = (i_x + 1) % 2
 
                 transy = min(yearn, self.horizons[i_y])
-                for n in range(0, transy):
-                    self.B.setRange(self.vm["x"].idx(i_y, n), 0, 0)
+                self.B.setRanges(self.vm["x"].idx(i_y, np.arange(transy)), 0, 0)
 
                 transx = min(yearn, self.horizons[i_x])
-                for n in range(transx, self.horizons[i_x]):
-                    self.B.setRange(self.vm["x"].idx(i_x, n), 0, 0)
+                self.B.setRanges(self.vm["x"].idx(i_x, np.arange(transx, self.horizons[i_x])), 0, 0)
 
         # Disallow Roth conversions in last two years alive.
         for i in range(self.N_i):
             if i == i_xcluded:
                 continue
-            for n in range(max(0, self.horizons[i] - 2), self.horizons[i]):
-                self.B.setRange(self.vm["x"].idx(i, n), 0, 0)
+            self.B.setRanges(self.vm["x"].idx(i, np.arange(max(0, self.horizons[i] - 2), self.horizons[i])), 0, 0)
 
         # Per-cell overrides from the "Roth conv" column take precedence over all
         # policy constraints above: positive values pin x[i,n] to that exact amount
@@ -2489,12 +2710,10 @@ class Plan:
             for i in range(self.N_i):
                 if i == i_xcluded:
                     continue
-                for n in range(self.horizons[i]):
-                    v = self.myRothX_in[i][n]
-                    if v > 0:
-                        self.B.setRange(self.vm["x"].idx(i, n), v, v)
-                    elif v < 0:
-                        self.B.setRange(self.vm["x"].idx(i, n), 0, 0)
+                v = self.myRothX_in[i, : self.horizons[i]]
+                nn = np.flatnonzero((v > 0) | (v < 0))
+                v = np.maximum(v[nn], 0)
+                self.B.setRanges(self.vm["x"].idx(i, nn), v, v)
 
     def _add_safety_net(self, options):
         """
@@ -2511,20 +2730,27 @@ class Plan:
                 continue
             # From year 2 onward; last year = min(horizons[i], N_n) for survivor,
             # horizons[i]-1 for deceased (last year alive)
-            for n in range(1, self.horizons[i]):
-                rhs = min_dollar * self.gamma_n[n]
-                self.B.setRange(self.vm["b"].idx(i, 0, n), rhs, np.inf)
+            nn = np.arange(1, self.horizons[i])
+            self.B.setRanges(self.vm["b"].idx(i, 0, nn), min_dollar * self.gamma_n[nn], np.inf)
 
     def _add_withdrawal_limits(self):
         for i in range(self.N_i):
             # Wierdly enough, setting horizons causes a effects on HiGHS and MOSEK
             # for n in range(self.N_n):
-            for n in range(self.horizons[i]):
-                rowDic = {self.vm["w"].idx(i, 1, n): -1, self.vm["x"].idx(i, n): -1, self.vm["b"].idx(i, 1, n): 1}
-                self.A.addNewRow(rowDic, 0, np.inf, tag=("withdrawal_limit", i, 1, n))
-                for j in [0, 2, 3]:
-                    rowDic = {self.vm["w"].idx(i, j, n): -1, self.vm["b"].idx(i, j, n): 1}
-                    self.A.addNewRow(rowDic, 0, np.inf, tag=("withdrawal_limit", i, j, n))
+            h = self.horizons[i]
+            nn = np.arange(h)
+            families = [
+                (
+                    [(self.vm["w"].idx(i, 1, nn), -1), (self.vm["x"].idx(i, nn), -1), (self.vm["b"].idx(i, 1, nn), 1)],
+                    0,
+                    np.inf,
+                )
+            ]
+            for j in [0, 2, 3]:
+                families.append(([(self.vm["w"].idx(i, j, nn), -1), (self.vm["b"].idx(i, j, nn), 1)], 0, np.inf))
+            self.A.addInterleavedRows(
+                h, families, tags=[("withdrawal_limit", i, j, n) for n in range(h) for j in [1, 0, 2, 3]]
+            )
 
         # HSA qualified medical expense cap: sum_i w[i,3,n] - m_n <= M_n[n] + other_medical_n[n]
         # m_n is the Medicare LP variable; fixed to loop-computed value in SC-loop mode.
@@ -2533,11 +2759,11 @@ class Plan:
         # even when trivially satisfied, interfering with Benders cuts and LTCG SC-loop.
         has_hsa = np.any(self.beta_ij[:, 3] > 0) or np.any(self.kappa_ijn[:, 3, :] > 0)
         if has_hsa:
-            for n in range(self.N_n):
-                cap = self.M_n[n] + self.other_medical_n[n]
-                rowDic = {self.vm["w"].idx(i, 3, n): 1 for i in range(self.N_i)}
-                rowDic[self.vm["m"].idx(n)] = -1
-                self.A.addNewRow(rowDic, -np.inf, cap, tag=("hsa_medical_cap", n))
+            nn = np.arange(self.N_n)
+            cap = self.M_n[: self.N_n] + self.other_medical_n[: self.N_n]
+            terms = [(self.vm["w"].idx(i, 3, nn), 1) for i in range(self.N_i)]
+            terms.append((self.vm["m"].idx(nn), -1))
+            self.A.addRows(self.N_n, terms, -np.inf, cap, tags=[("hsa_medical_cap", n) for n in range(self.N_n)])
 
     def _portfolioCeiling(self):
         """Upper bound on total savings in each year, for big-M constraint families.
@@ -2587,36 +2813,51 @@ class Plan:
         # at the generic 5e7 that is hundreds of dollars of balance slipping past a closed
         # gate. Capped by the generic value so this can only ever tighten the formulation.
         ceiling_n = np.minimum(self._portfolioCeiling(), bigM * self.gamma_n[: self.N_n + 1])
-        for n in range(self.N_n):
-            Mn = ceiling_n[n]
-            z1 = self.vm["zo"].idx(0, n)
-            z2 = self.vm["zo"].idx(1, n)
-            for i in range(self.N_i):
-                if n >= self.horizons[i]:
-                    continue
-                # Tax-deferred beyond the RMD only once taxable is exhausted:
-                # w[i,1,n] - rho*b[i,1,n] - M*z1 <= 0  (mirrors the RMD floor row).
-                self.A.addNewRow(
-                    {
-                        self.vm["w"].idx(i, 1, n): 1,
-                        self.vm["b"].idx(i, 1, n): -self.rho_in[i, n],
-                        z1: -Mn,
-                    },
-                    -np.inf,
-                    0,
-                    tag=("wdorder_txdef_gate", i, n),
-                )
-                # Roth withdrawals only once tax-deferred is also exhausted.
-                self.A.addNewRow({self.vm["w"].idx(i, 2, n): 1, z2: -Mn}, -np.inf, 0, tag=("wdorder_roth_gate", i, n))
-            # Gate activation: sum_i b[i,j,n+1] + M*z <= M  (z=1 forces end balance ~ 0).
-            rowDic = {self.vm["b"].idx(i, 0, n + 1): 1 for i in range(self.N_i)}
-            rowDic[z1] = Mn
-            self.A.addNewRow(rowDic, -np.inf, Mn, tag=("wdorder_taxable_exhausted", n))
-            rowDic = {self.vm["b"].idx(i, 1, n + 1): 1 for i in range(self.N_i)}
-            rowDic[z2] = Mn
-            self.A.addNewRow(rowDic, -np.inf, Mn, tag=("wdorder_txdef_exhausted", n))
-            # Full ordering: the Roth gate implies the tax-deferred gate.
-            self.A.addNewRow({z2: 1, z1: -1}, -np.inf, 0, tag=("wdorder_gate_monotone", n))
+        N_n, N_i = self.N_n, self.N_i
+        nn = np.arange(N_n)
+        Mn = ceiling_n[:N_n]
+        z1 = self.vm["zo"].idx(0, nn)
+        z2 = self.vm["zo"].idx(1, nn)
+        # Each year holds two gate rows per individual still alive, then three household rows.
+        alive = nn[:, None] < np.asarray(self.horizons)[None, :N_i]
+        first = np.concatenate(([0], np.cumsum(2 * alive.sum(axis=1) + 3)))
+        rank = np.cumsum(alive, axis=1) - 1
+        nrows = int(first[-1])
+        rows, cols, vals = [], [], []
+        tags = [None] * nrows
+        for i in range(N_i):
+            na = nn[alive[:, i]]
+            r = first[na] + 2 * rank[na, i]
+            # Tax-deferred beyond the RMD only once taxable is exhausted:
+            # w[i,1,n] - rho*b[i,1,n] - M*z1 <= 0  (mirrors the RMD floor row).
+            rows.append(np.repeat(r, 3))
+            cols.append(np.column_stack((self.vm["w"].idx(i, 1, na), self.vm["b"].idx(i, 1, na), z1[na])).ravel())
+            vals.append(np.column_stack((np.ones(len(na)), -self.rho_in[i, na], -Mn[na])).ravel())
+            # Roth withdrawals only once tax-deferred is also exhausted.
+            rows.append(np.repeat(r + 1, 2))
+            cols.append(np.column_stack((self.vm["w"].idx(i, 2, na), z2[na])).ravel())
+            vals.append(np.column_stack((np.ones(len(na)), -Mn[na])).ravel())
+            for n, k in zip(na, r, strict=True):
+                tags[k] = ("wdorder_txdef_gate", i, int(n))
+                tags[k + 1] = ("wdorder_roth_gate", i, int(n))
+        r = first[1:] - 3
+        # Gate activation: sum_i b[i,j,n+1] + M*z <= M  (z=1 forces end balance ~ 0).
+        for k, (j, z) in enumerate(((0, z1), (1, z2))):
+            rows.append(np.repeat(r + k, N_i + 1))
+            cols.append(np.column_stack([self.vm["b"].idx(i, j, nn + 1) for i in range(N_i)] + [z]).ravel())
+            vals.append(np.column_stack([np.ones((N_n, N_i)), Mn]).ravel())
+        # Full ordering: the Roth gate implies the tax-deferred gate.
+        rows.append(np.repeat(r + 2, 2))
+        cols.append(np.column_stack((z2, z1)).ravel())
+        vals.append(np.tile([1.0, -1.0], N_n))
+        ub = np.zeros(nrows)
+        ub[r] = Mn
+        ub[r + 1] = Mn
+        for n in range(N_n):
+            tags[r[n]] = ("wdorder_taxable_exhausted", n)
+            tags[r[n] + 1] = ("wdorder_txdef_exhausted", n)
+            tags[r[n] + 2] = ("wdorder_gate_monotone", n)
+        self.A.addBlock(nrows, np.concatenate(rows), np.concatenate(cols), np.concatenate(vals), -np.inf, ub, tags)
 
     def _add_objective_constraints(self, objective, options):
         if objective == "maxSpending":
@@ -2647,22 +2888,24 @@ class Plan:
         # Back project balances to the beginning of the year.
         yearSpent = 1 - self.yearFracLeft
 
-        for i in range(self.N_i):
-            for j in range(self.N_j):
-                backTau = 1 + yearSpent * np.sum(self.tau_kn[:, 0] * self.alpha_ijkn[i, j, :, 0])
-                rhs = self.beta_ij[i, j] / backTau
-                self.B.setRange(self.vm["b"].idx(i, j, 0), rhs, rhs)
+        backTau = 1 + yearSpent * np.sum(self.tau_kn[:, 0] * self.alpha_ijkn[:, :, :, 0], axis=2)
+        rhs = self.beta_ij / backTau
+        ii, jj = np.ogrid[: self.N_i, : self.N_j]
+        self.B.setRanges(self.vm["b"].idx(ii, jj, 0), rhs, rhs)
 
     def _add_surplus_deposit_linking(self, options):
+        nn = np.arange(self.N_n)
         for i in range(self.N_i):
             fac1 = u.krond(i, 0) * (1 - self.eta) + u.krond(i, 1) * self.eta
-            for n in range(self.n_d):
-                rowDic = {self.vm["d"].idx(i, n): 1, self.vm["s"].idx(n): -fac1}
-                self.A.addNewRow(rowDic, 0, 0, tag=("surplus_deposit", i, n))
             fac2 = u.krond(self.i_s, i)
-            for n in range(self.n_d, self.N_n):
-                rowDic = {self.vm["d"].idx(i, n): 1, self.vm["s"].idx(n): -fac2}
-                self.A.addNewRow(rowDic, 0, 0, tag=("surplus_deposit", i, n))
+            fac = np.where(nn < self.n_d, -fac1, -fac2)
+            self.A.addRows(
+                self.N_n,
+                [(self.vm["d"].idx(i, nn), 1), (self.vm["s"].idx(nn), fac)],
+                0,
+                0,
+                tags=[("surplus_deposit", i, n) for n in range(self.N_n)],
+            )
 
         # Prevent surplus on two last year as they have little tax and/or growth consequence.
         disallow = options.get("noLateSurplus", False)
@@ -2671,165 +2914,207 @@ class Plan:
             self.B.setRange(self.vm["s"].idx(self.N_n - 1), 0, 0)
 
     def _add_account_balance_carryover(self):
-        tau_ijn = np.zeros((self.N_i, self.N_j, self.N_n))
-        for i in range(self.N_i):
-            for j in range(self.N_j):
-                for n in range(self.N_n):
-                    tau_ijn[i, j, n] = np.sum(self.alpha_ijkn[i, j, :, n] * self.tau_kn[:, n], axis=0)
+        N_i, N_j, N_n = self.N_i, self.N_j, self.N_n
+        tau_ijn = np.sum(self.alpha_ijkn[:, :, :, :N_n] * self.tau_kn[:, :N_n], axis=2)
 
         # Weights are normalized on k: sum_k[alpha*(1 + tau)] = 1 + sum_k[alpha*tau]
         Tau1_ijn = 1 + tau_ijn
         Tauh_ijn = 1 + tau_ijn / 2
 
-        for i in range(self.N_i):
-            for j in range(self.N_j):
-                for n in range(self.N_n):
-                    if self.N_i == 2 and self.n_d < self.N_n and i == self.i_d and n == self.n_d - 1:
-                        fac1 = 0
-                    else:
-                        fac1 = 1
-
-                    rhs = fac1 * self.kappa_ijn[i, j, n] * Tauh_ijn[i, j, n]
-                    # SPIA premium: non-taxable IRA rollover — reduces tax-deferred balance directly.
-                    if j == 1:
-                        rhs -= self.spia_premiums_in[i, n]
-
-                    row = self.A.newRow()
-                    row.addElem(self.vm["b"].idx(i, j, n + 1), 1)
-                    row.addElem(self.vm["b"].idx(i, j, n), -fac1 * Tau1_ijn[i, j, n])
-                    row.addElem(self.vm["w"].idx(i, j, n), fac1 * Tau1_ijn[i, j, n])
-                    row.addElem(self.vm["d"].idx(i, n), -fac1 * u.krond(j, 0) * Tau1_ijn[i, 0, n])
-                    row.addElem(
-                        self.vm["x"].idx(i, n),
-                        -fac1 * (self.xnet * u.krond(j, 2) - u.krond(j, 1)) * Tau1_ijn[i, j, n],
+        ii, jj, nn = np.ogrid[:N_i, :N_j, :N_n]
+        kj0 = (jj == 0).astype(int)
+        xfac = self.xnet * (jj == 2) - (jj == 1)
+        split = N_i == 2 and self.n_d < N_n
+        fac1 = np.ones((N_i, 1, N_n), dtype=int)
+        if split:
+            fac1[self.i_d, 0, self.n_d - 1] = 0
+
+        rhs = fac1 * self.kappa_ijn[:, :, :N_n] * Tauh_ijn
+        # SPIA premium: non-taxable IRA rollover — reduces tax-deferred balance directly.
+        rhs[:, 1, :] -= self.spia_premiums_in[:, :N_n]
+
+        shape = (N_i, N_j, N_n)
+        cols = np.stack(
+            [
+                np.broadcast_to(a, shape)
+                for a in (
+                    self.vm["b"].idx(ii, jj, nn + 1),
+                    self.vm["b"].idx(ii, jj, nn),
+                    self.vm["w"].idx(ii, jj, nn),
+                    self.vm["d"].idx(ii, nn),
+                    self.vm["x"].idx(ii, nn),
+                )
+            ],
+            axis=3,
+        )
+        vals = np.stack(
+            [
+                np.broadcast_to(a, shape)
+                for a in (
+                    1,
+                    -fac1 * Tau1_ijn,
+                    fac1 * Tau1_ijn,
+                    -fac1 * kj0 * Tau1_ijn[:, 0:1, :],
+                    -fac1 * xfac * Tau1_ijn,
+                )
+            ],
+            axis=3,
+        )
+        rows = [np.broadcast_to(np.arange(N_i * N_j * N_n).reshape(shape)[..., None], cols.shape).ravel()]
+        cols = [cols.ravel()]
+        vals = [vals.ravel()]
+
+        if split:
+            # Survivor inherits the deceased's accounts in the year of death.
+            i_s, i_d, n = self.i_s, self.i_d, self.n_d - 1
+            fac2 = self.phi_j
+            j = np.arange(N_j)
+            rhs[i_s, :, n] += fac2 * self.kappa_ijn[i_d, :, n] * Tauh_ijn[i_d, :, n]
+            rows.append(np.repeat((i_s * N_j + j) * N_n + n, 4))
+            cols.append(
+                np.column_stack(
+                    (
+                        self.vm["b"].idx(i_d, j, n),
+                        self.vm["w"].idx(i_d, j, n),
+                        np.full(N_j, self.vm["d"].idx(i_d, n)),
+                        np.full(N_j, self.vm["x"].idx(i_d, n)),
                     )
+                ).ravel()
+            )
+            vals.append(
+                np.column_stack(
+                    (
+                        -fac2 * Tau1_ijn[i_d, :, n],
+                        fac2 * Tau1_ijn[i_d, :, n],
+                        -fac2 * kj0[0, :, 0] * Tau1_ijn[i_d, 0, n],
+                        -fac2 * xfac[0, :, 0] * Tau1_ijn[i_d, :, n],
+                    )
+                ).ravel()
+            )
 
-                    if self.N_i == 2 and self.n_d < self.N_n and i == self.i_s and n == self.n_d - 1:
-                        fac2 = self.phi_j[j]
-                        rhs += fac2 * self.kappa_ijn[self.i_d, j, n] * Tauh_ijn[self.i_d, j, n]
-                        row.addElem(self.vm["b"].idx(self.i_d, j, n), -fac2 * Tau1_ijn[self.i_d, j, n])
-                        row.addElem(self.vm["w"].idx(self.i_d, j, n), fac2 * Tau1_ijn[self.i_d, j, n])
-                        row.addElem(self.vm["d"].idx(self.i_d, n), -fac2 * u.krond(j, 0) * Tau1_ijn[self.i_d, 0, n])
-                        row.addElem(
-                            self.vm["x"].idx(self.i_d, n),
-                            -fac2 * (self.xnet * u.krond(j, 2) - u.krond(j, 1)) * Tau1_ijn[self.i_d, j, n],
-                        )
-                    self.A.addRow(row, rhs, rhs, tag=("account_carryover", i, j, n))
+        self.A.addBlock(
+            N_i * N_j * N_n,
+            np.concatenate(rows),
+            np.concatenate(cols),
+            np.concatenate(vals),
+            rhs.ravel(),
+            rhs.ravel(),
+            tags=[("account_carryover", i, j, n) for i in range(N_i) for j in range(N_j) for n in range(N_n)],
+        )
 
     def _add_net_cash_flow(self, options=None):
-        tau_0prev = np.roll(self.tau_kn[0, :], 1)
-        tau_0prev[tau_0prev < 0] = 0
-        for n in range(self.N_n):
-            rhs = -self.M_n[n] - self.ACA_n[n]
-            if not getattr(self, "_niit_lp", False):
-                rhs -= self.J_n[n]
-            # Add fixed assets proceeds (positive cash flow)
+        N_n = self.N_n
+        nn = np.arange(N_n)
+        rhs = -self.M_n[:N_n] - self.ACA_n[:N_n]
+        if not getattr(self, "_niit_lp", False):
+            rhs -= self.J_n[:N_n]
+        # Add fixed assets proceeds (positive cash flow)
+        rhs += (
+            self.fixed_assets_tax_free_n[:N_n]
+            + self.fixed_assets_ordinary_income_n[:N_n]
+            + self.fixed_assets_capital_gains_n[:N_n]
+        )
+        # Subtract debt payments (negative cash flow)
+        rhs -= self.debt_payments_n[:N_n]
+        terms = [(self.vm["g"].idx(nn), 1), (self.vm["s"].idx(nn), 1), (self.vm["m"].idx(nn), 1)]
+        if "maca" in self.vm:
+            terms.append((self.vm["maca"].idx(nn), 1))
+        for i in range(self.N_i):
+            if "ssb" in self.vm:
+                # SS own-benefit is an LP variable; spousal/survivor is a parameter offset.
+                ss_income = self._ssa_spousal_offset[i, :N_n]
+                terms.append((self.vm["ssb"].idx(i, nn), -1))
+            else:
+                ss_income = self.zetaBar_in[i, :N_n]
             rhs += (
-                self.fixed_assets_tax_free_n[n]
-                + self.fixed_assets_ordinary_income_n[n]
-                + self.fixed_assets_capital_gains_n[n]
+                self.omega_in[i, :N_n]
+                + self.other_inc_in[i, :N_n]
+                + self.netinv_in[i, :N_n]
+                + ss_income
+                + self.piBar_in[i, :N_n]
+                + self.spiaBar_in[i, :N_n]
+                + self.Lambda_in[i, :N_n]
             )
-            # Subtract debt payments (negative cash flow)
-            rhs -= self.debt_payments_n[n]
-            row = self.A.newRow({self.vm["g"].idx(n): 1})
-            row.addElem(self.vm["s"].idx(n), 1)
-            row.addElem(self.vm["m"].idx(n), 1)
-            if "maca" in self.vm:
-                row.addElem(self.vm["maca"].idx(n), 1)
-            for i in range(self.N_i):
-                if "ssb" in self.vm:
-                    # SS own-benefit is an LP variable; spousal/survivor is a parameter offset.
-                    ss_income = self._ssa_spousal_offset[i, n]
-                    row.addElem(self.vm["ssb"].idx(i, n), -1)
-                else:
-                    ss_income = self.zetaBar_in[i, n]
-                rhs += (
-                    self.omega_in[i, n]
-                    + self.other_inc_in[i, n]
-                    + self.netinv_in[i, n]
-                    + ss_income
-                    + self.piBar_in[i, n]
-                    + self.spiaBar_in[i, n]
-                    + self.Lambda_in[i, n]
-                )
-                row.addElem(self.vm["w"].idx(i, 0, n), -1)
-                penalty = 0.1 if n < self.n595[i] else 0
-                row.addElem(self.vm["w"].idx(i, 1, n), -1 + penalty)
-                # maturation constraints govern; no 10% penalty
-                row.addElem(self.vm["w"].idx(i, 2, n), -1)
-                # HSA: qualified medical withdrawals are tax-free (simplified model)
-                row.addElem(self.vm["w"].idx(i, 3, n), -1)
+            terms.append((self.vm["w"].idx(i, 0, nn), -1))
+            penalty = np.where(nn < self.n595[i], 0.1, 0)
+            terms.append((self.vm["w"].idx(i, 1, nn), -1 + penalty))
+            # maturation constraints govern; no 10% penalty
+            terms.append((self.vm["w"].idx(i, 2, nn), -1))
+            # HSA: qualified medical withdrawals are tax-free (simplified model)
+            terms.append((self.vm["w"].idx(i, 3, nn), -1))
 
-            for t in range(self.N_t):
-                row.addElem(self.vm["f"].idx(t, n), self.theta_tn[t, n])
+        terms += [(self.vm["f"].idx(t, nn), self.theta_tn[t, :N_n]) for t in range(self.N_t)]
 
-            # LTCG tax from bracket variables q[1,n] and q[2,n] directly.
-            row.addElem(self.vm["q"].idx(1, n), 0.15)
-            row.addElem(self.vm["q"].idx(2, n), 0.20)
+        # LTCG tax from bracket variables q[1,n] and q[2,n] directly.
+        terms.append((self.vm["q"].idx(1, nn), 0.15))
+        terms.append((self.vm["q"].idx(2, nn), 0.20))
 
-            # State income tax from state bracket variables.
-            if "st_f" in self.vm:
-                for t in range(self.N_st):
-                    row.addElem(self.vm["st_f"].idx(t, n), self.st_theta_tn[t, n])
+        # State income tax from state bracket variables.
+        if "st_f" in self.vm:
+            terms += [(self.vm["st_f"].idx(t, nn), self.st_theta_tn[t, :N_n]) for t in range(self.N_st)]
 
-            # NIIT: when optimize mode, use LP variable Jn; otherwise already in rhs.
-            if getattr(self, "_niit_lp", False):
-                row.addElem(self.vm["Jn"].idx(n), 1)
+        # NIIT: when optimize mode, use LP variable Jn; otherwise already in rhs.
+        if getattr(self, "_niit_lp", False):
+            terms.append((self.vm["Jn"].idx(nn), 1))
 
-            self.A.addRow(row, rhs, rhs, tag=("cash_flow", n))
+        self.A.addRows(N_n, terms, rhs, rhs, tags=[("cash_flow", n) for n in range(N_n)])
 
     def _add_income_profile(self, objective):
         spLo = 1 - self.lambdha
         spHi = 1 + self.lambdha
-        for n in range(1, self.N_n):
-            rowDic = {self.vm["g"].idx(0): spLo * self.xiBar_n[n], self.vm["g"].idx(n): -self.xiBar_n[0]}
-            self.A.addNewRow(rowDic, -np.inf, 0, tag=("profile_lo", n))
-            rowDic = {self.vm["g"].idx(0): spHi * self.xiBar_n[n], self.vm["g"].idx(n): -self.xiBar_n[0]}
-            self.A.addNewRow(rowDic, 0, np.inf, tag=("profile_hi", n))
+        nn = np.arange(1, self.N_n)
+        g0, gn = self.vm["g"].idx(0), self.vm["g"].idx(nn)
+        self.A.addInterleavedRows(
+            self.N_n - 1,
+            [
+                ([(g0, spLo * self.xiBar_n[nn]), (gn, -self.xiBar_n[0])], -np.inf, 0),
+                ([(g0, spHi * self.xiBar_n[nn]), (gn, -self.xiBar_n[0])], 0, np.inf),
+            ],
+            tags=[(side, n) for n in range(1, self.N_n) for side in ("profile_lo", "profile_hi")],
+        )
 
     def _add_taxable_income(self, options=None):
         ss_lp = options is not None and options.get("withSSTaxability", "loop") == "optimize"
-        for n in range(self.N_n):
-            # Add fixed assets ordinary income
-            rhs = self.fixed_assets_ordinary_income_n[n]
-            row = self.A.newRow()
-            row.addElem(self.vm["e"].idx(n), 1)
-            for i in range(self.N_i):
-                if ss_lp:
-                    # Taxable SS is an LP variable (tss_n); omit the Psi_n*zetaBar parameter.
-                    rhs += (
-                        self.omega_in[i, n]
-                        + self.other_inc_in[i, n]
-                        + self.netinv_in[i, n]
-                        + self.piBar_in[i, n]
-                        + self.spiaBar_in[i, n]
-                    )
-                else:
-                    rhs += (
-                        self.omega_in[i, n]
-                        + self.other_inc_in[i, n]
-                        + self.netinv_in[i, n]
-                        + self.Psi_n[n] * self.zetaBar_in[i, n]
-                        + self.piBar_in[i, n]
-                        + self.spiaBar_in[i, n]
-                    )
-                row.addElem(self.vm["w"].idx(i, 1, n), -1)
-                row.addElem(self.vm["x"].idx(i, n), -1)
-                # Only positive returns are taxable (interest/dividends); losses don't reduce income.
-                fak = np.sum(
-                    np.maximum(0, self.tau_kn[1 : self.N_k, n]) * self.alpha_ijkn[i, 0, 1 : self.N_k, n], axis=0
-                )
-                rhs += 0.5 * fak * self.kappa_ijn[i, 0, n]
-                row.addElem(self.vm["b"].idx(i, 0, n), -fak)
-                row.addElem(self.vm["w"].idx(i, 0, n), fak)
-                row.addElem(self.vm["d"].idx(i, n), -fak)
-            for t in range(self.N_t):
-                row.addElem(self.vm["f"].idx(t, n), 1)
+        N_n = self.N_n
+        nn = np.arange(N_n)
+        # Add fixed assets ordinary income
+        rhs = self.fixed_assets_ordinary_income_n[:N_n].copy()
+        terms = [(self.vm["e"].idx(nn), 1)]
+        for i in range(self.N_i):
             if ss_lp:
-                # t^σ_n = taxable SS LP variable replaces Psi_n*zetaBar_n in the constraint:
-                # e_n - t^σ_n + sum_t(f_tn) = non_SS_ordinary_income
-                row.addElem(self.vm["tss"].idx(n), -1)
-            self.A.addRow(row, rhs, rhs, tag=("taxable_income", n))
+                # Taxable SS is an LP variable (tss_n); omit the Psi_n*zetaBar parameter.
+                rhs += (
+                    self.omega_in[i, :N_n]
+                    + self.other_inc_in[i, :N_n]
+                    + self.netinv_in[i, :N_n]
+                    + self.piBar_in[i, :N_n]
+                    + self.spiaBar_in[i, :N_n]
+                )
+            else:
+                rhs += (
+                    self.omega_in[i, :N_n]
+                    + self.other_inc_in[i, :N_n]
+                    + self.netinv_in[i, :N_n]
+                    + self.Psi_n[:N_n] * self.zetaBar_in[i, :N_n]
+                    + self.piBar_in[i, :N_n]
+                    + self.spiaBar_in[i, :N_n]
+                )
+            terms.append((self.vm["w"].idx(i, 1, nn), -1))
+            terms.append((self.vm["x"].idx(i, nn), -1))
+            # Only positive returns are taxable (interest/dividends); losses don't reduce income.
+            fak = np.sum(
+                np.maximum(0, self.tau_kn[1 : self.N_k, :N_n]) * self.alpha_ijkn[i, 0, 1 : self.N_k, :N_n], axis=0
+            )
+            rhs += 0.5 * fak * self.kappa_ijn[i, 0, :N_n]
+            terms.append((self.vm["b"].idx(i, 0, nn), -fak))
+            terms.append((self.vm["w"].idx(i, 0, nn), fak))
+            terms.append((self.vm["d"].idx(i, nn), -fak))
+        terms += [(self.vm["f"].idx(t, nn), 1) for t in range(self.N_t)]
+        if ss_lp:
+            # t^σ_n = taxable SS LP variable replaces Psi_n*zetaBar_n in the constraint:
+            # e_n - t^σ_n + sum_t(f_tn) = non_SS_ordinary_income
+            terms.append((self.vm["tss"].idx(nn), -1))
+        self.A.addRows(N_n, terms, rhs, rhs, tags=[("taxable_income", n) for n in range(N_n)])
 
     def _configure_ss_taxability_lp(self, options):
         """
@@ -2851,116 +3136,91 @@ class Plan:
             return
 
         bigM = u.get_numeric_option(options, "bigMss", BIGM_AMO, min_value=0)
+        vm = self.vm
+        nn = np.arange(self.N_n)
+        zetaBar_n = np.sum(self.zetaBar_in[:, : self.N_n], axis=0)
+
+        # No SS income this year: fix variables to 0 and skip all 8 constraints.
+        # tss_n MUST be fixed (it appears in taxable income with -1 coefficient).
+        # z0_n, z1_n should be fixed to remove them from MIP branching.
+        n0 = nn[zetaBar_n == 0]
+        self.B.setRanges(np.column_stack((vm["tss"].idx(n0), vm["zs"].idx(n0, 0), vm["zs"].idx(n0, 1))), 0, 0)
+
+        nn = nn[zetaBar_n != 0]
+        zetaBar_n = zetaBar_n[nn]
+        if len(nn) == 0:
+            return
 
-        for n in range(self.N_n):
-            zetaBar_n = np.sum(self.zetaBar_in[:, n])
-
-            # No SS income this year: fix variables to 0 and skip all 8 constraints.
-            # tss_n MUST be fixed (it appears in taxable income with -1 coefficient).
-            # z0_n, z1_n should be fixed to remove them from MIP branching.
-            if zetaBar_n == 0:
-                self.B.setRange(self.vm["tss"].idx(n), 0, 0)
-                self.B.setRange(self.vm["zs"].idx(n, 0), 0, 0)
-                self.B.setRange(self.vm["zs"].idx(n, 1), 0, 0)
-                continue
-
-            # Per-year filing status: for couple, switch to Single at n_d.
-            status_n = 0 if (self.N_i == 2 and n >= self.n_d) else self.N_i - 1
-            ss_lo_n = tx.ssTaxabilityLo[status_n]
-            ss_hi_n = tx.ssTaxabilityHi[status_n]
-            delta_p_n = ss_hi_n - ss_lo_n
-
-            # === Build Π_n LP coefficients ===
-            # Π_n = B_n + Q_n + 0.5·ζ̄_n, where B_n is non-SS ordinary income before the
-            # standard exemption. The LP income terms below mirror the ACA MAGI constraint
-            # exactly — same year n, same coefficients — and carry 0.5·ζ̄_n instead of the
-            # full ζ̄_n. Those terms already are B_n + Q_n: neither e_n nor t^σ_n belongs
-            # here. Adding e_n would count the exemption a second time, and subtracting
-            # t^σ_n would remove taxable SS that the terms never included.
-
-            rhs_pi = (
-                self.fixed_assets_ordinary_income_n[n] + self.fixed_assets_capital_gains_n[n] + 0.5 * zetaBar_n
-            )  # 0.5·SS for provisional income (not full SS)
-
-            pi_row = {}
-
-            for i in range(self.N_i):
-                # Combined dividend + interest yield for taxable account (equity + bonds/notes/cash).
-                afac = self.mu * self.alpha_ijkn[i, 0, 0, n] + np.sum(
-                    self.alpha_ijkn[i, 0, 1:, n] * np.maximum(0, self.tau_kn[1:, n])
-                )
-                # Capital gains on taxable account withdrawal (uses tracked basis if available).
-                bfac = self.alpha_ijkn[i, 0, 0, n] * self._effective_cap_gain_coef(i, n)
-
-                w1_idx = self.vm["w"].idx(i, 1, n)
-                x_idx = self.vm["x"].idx(i, n)
-                b_idx = self.vm["b"].idx(i, 0, n)
-                d_idx = self.vm["d"].idx(i, n)
-                w0_idx = self.vm["w"].idx(i, 0, n)
-
-                pi_row[w1_idx] = pi_row.get(w1_idx, 0) - 1  # IRA withdrawals (income)
-                pi_row[x_idx] = pi_row.get(x_idx, 0) - 1  # Roth conversions (income)
-                pi_row[b_idx] = pi_row.get(b_idx, 0) - afac  # beginning balance × yield
-                pi_row[d_idx] = pi_row.get(d_idx, 0) - afac  # contributions × yield
-                pi_row[w0_idx] = pi_row.get(w0_idx, 0) + (afac - bfac)  # withdrawals (net)
-
-                rhs_pi += (
-                    self.omega_in[i, n]
-                    + self.other_inc_in[i, n]
-                    + self.netinv_in[i, n]
-                    + self.piBar_in[i, n]
-                    + self.spiaBar_in[i, n]
-                    + 0.5 * self.kappa_ijn[i, 0, n] * afac
-                )  # half-period contribution yield
-
-            # Variable index shorthands.
-            plo_idx = self.vm["plo"].idx(n)
-            phi_idx = self.vm["phi"].idx(n)
-            pmin_idx = self.vm["pmin"].idx(n)
-            tss_idx = self.vm["tss"].idx(n)
-            z0_idx = self.vm["zs"].idx(n, 0)
-            z1_idx = self.vm["zs"].idx(n, 1)
-            bigMBar = bigM * self.gamma_n[n]
-
+        # Per-year filing status: for couple, switch to Single at n_d.
+        status_n = np.where((self.N_i == 2) & (nn >= self.n_d), 0, self.N_i - 1)
+        ss_lo_n = np.asarray(tx.ssTaxabilityLo)[status_n]
+        ss_hi_n = np.asarray(tx.ssTaxabilityHi)[status_n]
+        delta_p_n = ss_hi_n - ss_lo_n
+
+        # === Build Π_n LP coefficients ===
+        # Π_n = B_n + Q_n + 0.5·ζ̄_n, where B_n is non-SS ordinary income before the
+        # standard exemption. The LP income terms below mirror the ACA MAGI constraint
+        # exactly — same year n, same coefficients — and carry 0.5·ζ̄_n instead of the
+        # full ζ̄_n. Those terms already are B_n + Q_n: neither e_n nor t^σ_n belongs
+        # here. Adding e_n would count the exemption a second time, and subtracting
+        # t^σ_n would remove taxable SS that the terms never included.
+
+        rhs_pi = (
+            self.fixed_assets_ordinary_income_n[nn] + self.fixed_assets_capital_gains_n[nn] + 0.5 * zetaBar_n
+        )  # 0.5·SS for provisional income (not full SS)
+
+        pi_terms, afacs = self._agiTerms(nn)
+        for i in range(self.N_i):
+            rhs_pi += (
+                self.omega_in[i, nn]
+                + self.other_inc_in[i, nn]
+                + self.netinv_in[i, nn]
+                + self.piBar_in[i, nn]
+                + self.spiaBar_in[i, nn]
+                + 0.5 * self.kappa_ijn[i, 0, nn] * afacs[i]
+            )  # half-period contribution yield
+
+        # Variable index shorthands.
+        plo_idx = vm["plo"].idx(nn)
+        phi_idx = vm["phi"].idx(nn)
+        pmin_idx = vm["pmin"].idx(nn)
+        tss_idx = vm["tss"].idx(nn)
+        z0_idx = vm["zs"].idx(nn, 0)
+        z1_idx = vm["zs"].idx(nn, 1)
+        bigMBar = bigM * self.gamma_n[nn]
+
+        # When ζ̄_n < Δ𝒫_n, the effective upper bound on pmin is ζ̄_n; using Δ𝒫_n in the big-M
+        # lower bound of constraint (3b) would force pmin ≥ Δ𝒫_n > ζ̄_n, causing infeasibility.
+        p_ub = np.minimum(delta_p_n, zetaBar_n)
+
+        families = [
             # === p^lo_n = max(0, Π_n − 𝒫^lo) ===
             # Lower bound ≥ 0 from default variable bounds; explicit inequality enforces the max.
             # Row: p^lo_n + pi_row_coeffs ≥ rhs_pi − ss_lo_n
-            row_plo = dict(pi_row)
-            row_plo[plo_idx] = row_plo.get(plo_idx, 0) + 1
-            self.A.addNewRow(row_plo, rhs_pi - ss_lo_n, np.inf, tag=("ss_tax_plo", n))
-
+            (pi_terms + [(plo_idx, 1)], rhs_pi - ss_lo_n, np.inf),
             # === p^hi_n = max(0, Π_n − 𝒫^hi) ===
-            row_phi = dict(pi_row)
-            row_phi[phi_idx] = row_phi.get(phi_idx, 0) + 1
-            self.A.addNewRow(row_phi, rhs_pi - ss_hi_n, np.inf, tag=("ss_tax_phi", n))
-
+            (pi_terms + [(phi_idx, 1)], rhs_pi - ss_hi_n, np.inf),
             # === p^{σ,min}_n = min(Δ𝒫_n, ζ̄_n, p^lo_n) via binary z^σ_{0n} ===
             # Upper bounds: p^{σ,min}_n ≤ min(Δ𝒫_n, ζ̄_n) (setRange) and ≤ p^lo_n (constraint).
-            # When ζ̄_n < Δ𝒫_n, the effective upper bound on pmin is ζ̄_n; using Δ𝒫_n in the big-M
-            # lower bound of constraint (3b) would force pmin ≥ Δ𝒫_n > ζ̄_n, causing infeasibility.
-            p_ub = min(delta_p_n, zetaBar_n)
-            self.A.addNewRow({pmin_idx: 1, plo_idx: -1}, -np.inf, 0, tag=("ss_tax_pmin_ub", n))  # pmin ≤ p^lo
+            ([(pmin_idx, 1), (plo_idx, -1)], -np.inf, 0),  # pmin ≤ p^lo
             # p^{σ,min}_n ≥ min(Δ𝒫_n, ζ̄_n) − M·(1 − z0)  →  pmin − M·z0 ≥ p_ub − M
-            self.A.addNewRow({pmin_idx: 1, z0_idx: -bigMBar}, p_ub - bigMBar, np.inf, tag=("ss_tax_pmin_lb_cap", n))
+            ([(pmin_idx, 1), (z0_idx, -bigMBar)], p_ub - bigMBar, np.inf),
             # p^{σ,min}_n ≥ p^lo_n − M·z0  →  pmin − p^lo + M·z0 ≥ 0
-            self.A.addNewRow({pmin_idx: 1, plo_idx: -1, z0_idx: bigMBar}, 0, np.inf, tag=("ss_tax_pmin_lb_plo", n))
-            self.B.setRange(pmin_idx, 0, p_ub)  # pmin ≤ min(Δ𝒫_n, ζ̄_n)
-
+            ([(pmin_idx, 1), (plo_idx, -1), (z0_idx, bigMBar)], 0, np.inf),
             # === t^σ_n = min(0.85·ζ̄_n, 0.5·p^{σ,min}_n + 0.85·p^hi_n) via binary z^σ_{1n} ===
             # Upper bound t^σ_n ≤ 0.5·p^{σ,min}_n + 0.85·p^hi_n.
-            self.A.addNewRow({tss_idx: 1, pmin_idx: -0.5, phi_idx: -0.85}, -np.inf, 0, tag=("ss_tax_tss_ub", n))
+            ([(tss_idx, 1), (pmin_idx, -0.5), (phi_idx, -0.85)], -np.inf, 0),
             # t^σ_n ≥ 0.85·ζ̄_n − M·(1 − z1)  →  t^σ_n − M·z1 ≥ 0.85·ζ̄_n − M
-            self.A.addNewRow(
-                {tss_idx: 1, z1_idx: -bigMBar}, 0.85 * zetaBar_n - bigMBar, np.inf, tag=("ss_tax_tss_lb_cap", n)
-            )
+            ([(tss_idx, 1), (z1_idx, -bigMBar)], 0.85 * zetaBar_n - bigMBar, np.inf),
             # t^σ_n ≥ 0.5·p^{σ,min}_n + 0.85·p^hi_n − M·z1  →  tss − 0.5·pmin − 0.85·phi + M·z1 ≥ 0
-            self.A.addNewRow(
-                {tss_idx: 1, pmin_idx: -0.5, phi_idx: -0.85, z1_idx: bigMBar},
-                0,
-                np.inf,
-                tag=("ss_tax_tss_lb_formula", n),
-            )
-            self.B.setRange(tss_idx, 0, 0.85 * zetaBar_n)  # t^σ ≤ 0.85·ζ̄
+            ([(tss_idx, 1), (pmin_idx, -0.5), (phi_idx, -0.85), (z1_idx, bigMBar)], 0, np.inf),
+        ]
+        names = ["plo", "phi", "pmin_ub", "pmin_lb_cap", "pmin_lb_plo", "tss_ub", "tss_lb_cap", "tss_lb_formula"]
+        self.A.addInterleavedRows(
+            len(nn), families, tags=[("ss_tax_" + name, int(n)) for n in nn for name in names]
+        )
+        self.B.setRanges(pmin_idx, 0, p_ub)  # pmin ≤ min(Δ𝒫_n, ζ̄_n)
+        self.B.setRanges(tss_idx, 0, 0.85 * zetaBar_n)  # t^σ ≤ 0.85·ζ̄
 
     def _ssaAgeIsFixed(self, i):
         """
@@ -2999,8 +3259,10 @@ class Plan:
         N_K = self._ssa_N_K
         B_own = self._ssa_B_own
 
+        kk = np.arange(N_K)
         for i in range(self.N_i):
             pia_i = int(self.ssecAmounts[i]) if hasattr(self, "ssecAmounts") else 0
+            zssa_k = vm["zssa"].idx(i, kk)
 
             if self._ssaAgeIsFixed(i):
                 # Fix to the known/current claiming age (or age 62 if no SS).
@@ -3009,31 +3271,32 @@ class Plan:
                 else:
                     k_fixed = int(round((float(self.ssecAges[i]) - 62.0) * 12))
                     k_fixed = max(0, min(N_K - 1, k_fixed))
-                for k in range(N_K):
-                    lb = 1 if k == k_fixed else 0
-                    self.B.setRange(vm["zssa"].idx(i, k), lb, lb)
+                lb = (kk == k_fixed).astype(int)
+                self.B.setRanges(zssa_k, lb, lb)
             else:
                 # Free individual: fix ineligible claiming ages to 0.
                 bornOnFirstDays = self.tobs[i] <= 2
                 eligible = 62.0 if bornOnFirstDays else 62.0 + 1.0 / 12
-                for k in range(N_K):
-                    if self._ssa_ages_k[k] < eligible:
-                        self.B.setRange(vm["zssa"].idx(i, k), 0, 0)
+                self.B.setRanges(zssa_k[np.asarray(self._ssa_ages_k) < eligible], 0, 0)
 
             # a) AMO: exactly one claiming month per individual.
-            amo_row = {vm["zssa"].idx(i, k): 1 for k in range(N_K)}
-            self.A.addNewRow(amo_row, 1, 1, tag=("ss_age_amo", i))
+            self.A.addBlock(1, 0, zssa_k, 1, 1, 1, tags=[("ss_age_amo", i)])
 
             # b) Benefit definition: ssb[i,n] = sum_k B_own[i,k,n] * zssa[i,k]
-            for n in range(self.N_n):
-                ssb_idx = vm["ssb"].idx(i, n)
-                row = {ssb_idx: 1}
-                for k in range(N_K):
-                    b_val = float(B_own[i, k, n])
-                    if b_val != 0.0:
-                        row[vm["zssa"].idx(i, k)] = row.get(vm["zssa"].idx(i, k), 0) - b_val
-                # equality: ssb[i,n] - sum_k B_own * zssa = 0
-                self.A.addNewRow(row, 0, 0, tag=("ss_age_benefit", i, n))
+            # equality: ssb[i,n] - sum_k B_own * zssa = 0
+            B_nk = B_own[i, :, : self.N_n].T.astype(float)
+            cols = np.column_stack((vm["ssb"].idx(i, np.arange(self.N_n)), np.broadcast_to(zssa_k, B_nk.shape)))
+            vals = np.column_stack((np.ones(self.N_n), -B_nk))
+            keep = np.column_stack((np.ones(self.N_n, dtype=bool), B_nk != 0.0))
+            self.A.addBlock(
+                self.N_n,
+                np.broadcast_to(np.arange(self.N_n)[:, None], keep.shape)[keep],
+                cols[keep],
+                vals[keep],
+                0,
+                0,
+                tags=[("ss_age_benefit", i, n) for n in range(self.N_n)],
+            )
 
     def _configure_ltcg_constraints(self):
         """
@@ -3063,43 +3326,75 @@ class Plan:
 
         U_n = 0.15*q[1,n] + 0.20*q[2,n] is computed as a derived quantity after solving.
         """
-        for n in range(self.N_n):
-            # Per-year filing status: couple switches to Single at n_d.
-            status_n = 0 if (self.N_i == 2 and n >= self.n_d) else self.N_i - 1
-
-            # Inflation-adjusted bracket thresholds.
-            T15_n = self.gamma_n[n] * tx.capGainRates[status_n][0]
-            T20_n = self.gamma_n[n] * tx.capGainRates[status_n][1]
-
-            q0_idx = self.vm["q"].idx(0, n)  # p=0: 0% bracket
-            q1_idx = self.vm["q"].idx(1, n)  # p=1: 15% bracket
-            q2_idx = self.vm["q"].idx(2, n)  # p=2: 20% bracket
-
-            if self._ltcg_lp:
-                # =========================================================
-                # MILP mode: G_n is a continuous LP variable (gn), bracket
-                # room is encoded via big-M binary constraints with zl.
-                # =========================================================
-                gn_idx = self.vm["gn"].idx(n)
-                zl15_idx = self.vm["zl"].idx(0, n)  # regime binary: G_n < T15
-                zl20_idx = self.vm["zl"].idx(1, n)  # regime binary: G_n < T20
-
-                # Big-M: scale with gamma_n[n] (nominal dollars grow with inflation), following
-                # the pattern used elsewhere (e.g., bigMBar = bigM * gamma_n[n] in SS taxability).
-                # Default: 3*T20_n (already gamma-scaled, safe upper bound on G_n).
-                # Using T20_n alone is too tight — G_n can exceed T15+T20 in Roth conversion years.
-                base_Mltcg = getattr(self, "_bigMltcg", None)
-                if base_Mltcg is None or base_Mltcg <= 0:
-                    M_ltcg = 3.0 * T20_n  # gamma_n[n] already embedded in T20_n
-                else:
-                    M_ltcg = base_Mltcg * self.gamma_n[n]
+        vm = self.vm
+        N_n = self.N_n
+        nn = np.arange(N_n)
+        # Per-year filing status: couple switches to Single at n_d.
+        status_n = np.where((self.N_i == 2) & (nn >= self.n_d), 0, self.N_i - 1)
+
+        # Inflation-adjusted bracket thresholds.
+        T15_n = self.gamma_n[:N_n] * np.asarray(tx.capGainRates)[status_n, 0]
+        T20_n = self.gamma_n[:N_n] * np.asarray(tx.capGainRates)[status_n, 1]
+
+        q0_idx = vm["q"].idx(0, nn)  # p=0: 0% bracket
+        q1_idx = vm["q"].idx(1, nn)  # p=1: 15% bracket
+        q2_idx = vm["q"].idx(2, nn)  # p=2: 20% bracket
+
+        # === Partition lower-bound constraint (both modes): q[0]+q[1]+q[2] ≥ Q_n ===
+        # Q_portfolio_n = sum_i alpha_i00n * [mu*(b_i0n + d_in - w_i0n) + cap_rate*w_i0n
+        #                                     + 0.5*mu*kappa_i0n]
+        # Rearranged: sum_i alpha_i00n * [mu*b_i0n + (cap_rate-mu)*w_i0n + mu*d_in]
+        # The kappa half-period correction goes to the RHS.
+        rhs_q = self.fixed_assets_capital_gains_n[:N_n].copy()
+        q_terms = [(q0_idx, 1), (q1_idx, 1), (q2_idx, 1)]
+        for i in range(self.N_i):
+            alpha = self.alpha_ijkn[i, 0, 0, :N_n]
+            has = alpha != 0
+            gf = self._effective_cap_gain_coefs(i, nn)
+            q_terms += [
+                (vm["b"].idx(i, 0, nn), -(alpha * self.mu), has),
+                (vm["w"].idx(i, 0, nn), -(alpha * (gf - self.mu)), has),
+                (vm["d"].idx(i, nn), -(alpha * self.mu), has),
+            ]
+            rhs_q[has] += alpha[has] * 0.5 * self.mu * self.kappa_ijn[i, 0, nn[has]]
+
+        # (3') Companion upper bound on the same row: prevents q[1,n]/q[2,n] from being
+        # inflated along the flat direction shared with f_tn's per-bracket split (q[2,n]
+        # is otherwise unbounded above in loop mode). loss_buf widens the bound so a
+        # capital-loss year (Q_n < 0) stays feasible; tol=$1 matches the
+        # LTCG-consistency-loop tolerance in _scSolve. Two loss sources are covered:
+        #   - fixed-asset capital loss for year n is a known parameter, so cover it
+        #     directly (this keeps iteration 0, where prevQ is None, safe);
+        #   - any portfolio loss surfaces in the previous iteration's realized Q_n.
+        # prevQ[n] already includes the fixed-asset component, so take the larger.
+        tol = 1.0
+        fixed_loss = np.maximum(0.0, -self.fixed_assets_capital_gains_n[:N_n])
+        prevQ = getattr(self, "Q_n", None)
+        prev_loss = 0.0 if prevQ is None else np.maximum(0.0, -prevQ[:N_n])
+        loss_buf = np.maximum(fixed_loss, prev_loss) + tol
+
+        if self._ltcg_lp:
+            # =========================================================
+            # MILP mode: G_n is a continuous LP variable (gn), bracket
+            # room is encoded via big-M binary constraints with zl.
+            # =========================================================
+            gn_idx = vm["gn"].idx(nn)
+            zl15_idx = vm["zl"].idx(0, nn)  # regime binary: G_n < T15
+            zl20_idx = vm["zl"].idx(1, nn)  # regime binary: G_n < T20
+
+            # Big-M: scale with gamma_n[n] (nominal dollars grow with inflation), following
+            # the pattern used elsewhere (e.g., bigMBar = bigM * gamma_n[n] in SS taxability).
+            # Default: 3*T20_n (already gamma-scaled, safe upper bound on G_n).
+            # Using T20_n alone is too tight — G_n can exceed T15+T20 in Roth conversion years.
+            base_Mltcg = getattr(self, "_bigMltcg", None)
+            if base_Mltcg is None or base_Mltcg <= 0:
+                M_ltcg = 3.0 * T20_n  # gamma_n[n] already embedded in T20_n
+            else:
+                M_ltcg = base_Mltcg * self.gamma_n[:N_n]
 
+            families = [
                 # G_n equality: gn = sum_t f_tn  (ordinary taxable income)
-                row_gn = {gn_idx: 1}
-                for t in range(self.N_t):
-                    row_gn[self.vm["f"].idx(t, n)] = row_gn.get(self.vm["f"].idx(t, n), 0) - 1
-                self.A.addNewRow(row_gn, 0, 0, tag=("ltcg_gn_def", n))
-
+                ([(gn_idx, 1)] + [(vm["f"].idx(t, nn), -1) for t in range(self.N_t)], 0, 0),
                 # Big-M link for zl15: G_n + M*zl15 in [T15, T15+M]
                 # Equivalent to: if zl15=0 then G_n = T15 (exactly), if zl15=1 then G_n <= T15+M
                 # More precisely: T15 <= G_n + M*zl15 <= T15+M
@@ -3109,87 +3404,54 @@ class Plan:
                 # Use: G_n - M*(1-zl15) <= T15  and  G_n >= T15 - M*zl15
                 # Simplified: G_n + M*zl15 >= T15  (if zl15=0 → G_n >= T15)
                 #             G_n + M*zl15 <= T15+M (always feasible)
-                # Better: addNewRow({gn_idx:1, zl15_idx:M_ltcg}, T15_n, T15_n+M_ltcg)
-                self.A.addNewRow({gn_idx: 1, zl15_idx: M_ltcg}, T15_n, T15_n + M_ltcg, tag=("ltcg_zl15_link", n))
-                self.A.addNewRow({gn_idx: 1, zl20_idx: M_ltcg}, T20_n, T20_n + M_ltcg, tag=("ltcg_zl20_link", n))
-
+                ([(gn_idx, 1), (zl15_idx, M_ltcg)], T15_n, T15_n + M_ltcg),
+                ([(gn_idx, 1), (zl20_idx, M_ltcg)], T20_n, T20_n + M_ltcg),
                 # q[0] room15 upper bound: q0 + G_n + M*zl15 <= T15 + M
                 # → q0 <= T15 - G_n + M*(1-zl15) (unlimited when zl15=1, i.e. G_n>=T15)
-                self.A.addNewRow(
-                    {q0_idx: 1, gn_idx: 1, zl15_idx: M_ltcg}, -np.inf, T15_n + M_ltcg, tag=("ltcg_room15_mip", n)
-                )
+                ([(q0_idx, 1), (gn_idx, 1), (zl15_idx, M_ltcg)], -np.inf, T15_n + M_ltcg),
                 # q[0] forced zero when G_n >= T15 (zl15=1): q0 - M*zl15 <= 0
-                self.A.addNewRow({q0_idx: 1, zl15_idx: -M_ltcg}, -np.inf, 0, tag=("ltcg_q0_zero", n))
-
+                ([(q0_idx, 1), (zl15_idx, -M_ltcg)], -np.inf, 0),
                 # q[0]+q[1] room20 upper bound: q0+q1 + G_n + M*zl20 <= T20 + M
-                self.A.addNewRow(
-                    {q0_idx: 1, q1_idx: 1, gn_idx: 1, zl20_idx: M_ltcg},
-                    -np.inf,
-                    T20_n + M_ltcg,
-                    tag=("ltcg_room20_mip", n),
-                )
+                ([(q0_idx, 1), (q1_idx, 1), (gn_idx, 1), (zl20_idx, M_ltcg)], -np.inf, T20_n + M_ltcg),
                 # q[0]+q[1] forced zero when G_n >= T20 (zl20=1): q0+q1 - M*zl20 <= 0
-                self.A.addNewRow({q0_idx: 1, q1_idx: 1, zl20_idx: -M_ltcg}, -np.inf, 0, tag=("ltcg_q01_zero", n))
-
+                ([(q0_idx, 1), (q1_idx, 1), (zl20_idx, -M_ltcg)], -np.inf, 0),
                 # Monotonicity: zl15 <= zl20 (if G_n <= T15 then G_n <= T20, so room for 0% implies room for 15%)
                 # zl15 - zl20 <= 0  →  addNewRow({zl15:1, zl20:-1}, -inf, 0)
-                self.A.addNewRow({zl15_idx: 1, zl20_idx: -1}, -np.inf, 0, tag=("ltcg_zl_monotone", n))
-
-            else:
-                # =========================================================
-                # LP (loop) mode: use SC-loop G_n parameter for bracket room.
-                # =========================================================
-                # LTCG is stacked on top of ordinary taxable income G_n (from previous SC iteration).
-                # G_n is initialised to 0 for the first iteration (zero ordinary income assumption).
-                # room15_n / room20_n = T15/T20 threshold minus ordinary income already filling the bracket.
-                room15_n = max(0.0, T15_n - self.G_n[n])
-                room20_n = max(0.0, T20_n - self.G_n[n])
-                # (1) q[0,n] ≤ room15_n (enforced via variable upper bound)
-                self.B.setRange(q0_idx, 0, room15_n)
-                # (2) q[0,n] + q[1,n] ≤ room20_n
-                self.A.addNewRow({q0_idx: 1, q1_idx: 1}, -np.inf, room20_n, tag=("ltcg_room20", n))
-                # q[1] upper bound = remaining 15% bracket width after stacking ordinary income.
-                self.B.setRange(q1_idx, 0, max(0.0, room20_n - room15_n))
-                # q[2] is unbounded above (the 20% bracket has no cap).
-
-            # === Partition lower-bound constraint (both modes): q[0]+q[1]+q[2] ≥ Q_n ===
-            # Q_portfolio_n = sum_i alpha_i00n * [mu*(b_i0n + d_in - w_i0n) + cap_rate*w_i0n
-            #                                     + 0.5*mu*kappa_i0n]
-            # Rearranged: sum_i alpha_i00n * [mu*b_i0n + (cap_rate-mu)*w_i0n + mu*d_in]
-            # The kappa half-period correction goes to the RHS.
-            rhs_q = self.fixed_assets_capital_gains_n[n]
-            row_q = {q0_idx: 1, q1_idx: 1, q2_idx: 1}
-            for i in range(self.N_i):
-                alpha = self.alpha_ijkn[i, 0, 0, n]
-                if alpha == 0:
-                    continue
-                b_idx = self.vm["b"].idx(i, 0, n)
-                w_idx = self.vm["w"].idx(i, 0, n)
-                d_idx = self.vm["d"].idx(i, n)
-                gf = self._effective_cap_gain_coef(i, n)
-                row_q[b_idx] = row_q.get(b_idx, 0) - alpha * self.mu
-                row_q[w_idx] = row_q.get(w_idx, 0) - alpha * (gf - self.mu)
-                row_q[d_idx] = row_q.get(d_idx, 0) - alpha * self.mu
-                rhs_q += alpha * 0.5 * self.mu * self.kappa_ijn[i, 0, n]
-
-            # (3) q[0]+q[1]+q[2] − Q_portfolio_LP_vars ≥ Q_fixed + kappa_correction
-            self.A.addNewRow(row_q, rhs_q, np.inf, tag=("ltcg_partition_lo", n))
-
-            # (3') Companion upper bound on the same row: prevents q[1,n]/q[2,n] from being
-            # inflated along the flat direction shared with f_tn's per-bracket split (q[2,n]
-            # is otherwise unbounded above in loop mode). loss_buf widens the bound so a
-            # capital-loss year (Q_n < 0) stays feasible; tol=$1 matches the
-            # LTCG-consistency-loop tolerance in _scSolve. Two loss sources are covered:
-            #   - fixed-asset capital loss for year n is a known parameter, so cover it
-            #     directly (this keeps iteration 0, where prevQ is None, safe);
-            #   - any portfolio loss surfaces in the previous iteration's realized Q_n.
-            # prevQ[n] already includes the fixed-asset component, so take the larger.
-            tol = 1.0
-            fixed_loss = max(0.0, -float(self.fixed_assets_capital_gains_n[n]))
-            prevQ = getattr(self, "Q_n", None)
-            prev_loss = 0.0 if prevQ is None else max(0.0, -float(prevQ[n]))
-            loss_buf = max(fixed_loss, prev_loss) + tol
-            self.A.addNewRow(row_q, -np.inf, rhs_q + loss_buf, tag=("ltcg_partition_hi", n))
+                ([(zl15_idx, 1), (zl20_idx, -1)], -np.inf, 0),
+            ]
+            names = [
+                "ltcg_gn_def",
+                "ltcg_zl15_link",
+                "ltcg_zl20_link",
+                "ltcg_room15_mip",
+                "ltcg_q0_zero",
+                "ltcg_room20_mip",
+                "ltcg_q01_zero",
+                "ltcg_zl_monotone",
+            ]
+        else:
+            # =========================================================
+            # LP (loop) mode: use SC-loop G_n parameter for bracket room.
+            # =========================================================
+            # LTCG is stacked on top of ordinary taxable income G_n (from previous SC iteration).
+            # G_n is initialised to 0 for the first iteration (zero ordinary income assumption).
+            # room15_n / room20_n = T15/T20 threshold minus ordinary income already filling the bracket.
+            room15_n = np.maximum(0.0, T15_n - self.G_n[:N_n])
+            room20_n = np.maximum(0.0, T20_n - self.G_n[:N_n])
+            # (1) q[0,n] ≤ room15_n (enforced via variable upper bound)
+            self.B.setRanges(q0_idx, 0, room15_n)
+            # q[1] upper bound = remaining 15% bracket width after stacking ordinary income.
+            self.B.setRanges(q1_idx, 0, np.maximum(0.0, room20_n - room15_n))
+            # q[2] is unbounded above (the 20% bracket has no cap).
+            # (2) q[0,n] + q[1,n] ≤ room20_n
+            families = [([(q0_idx, 1), (q1_idx, 1)], -np.inf, room20_n)]
+            names = ["ltcg_room20"]
+
+        # Each year ends with the two partition rows, which share the same terms:
+        # (3) q[0]+q[1]+q[2] − Q_portfolio_LP_vars ≥ Q_fixed + kappa_correction, and (3').
+        families += [(q_terms, rhs_q, np.inf), (q_terms, -np.inf, rhs_q + loss_buf)]
+        names += ["ltcg_partition_lo", "ltcg_partition_hi"]
+        self.A.addInterleavedRows(N_n, families, tags=[(name, n) for n in range(N_n) for name in names])
 
     def _add_magi_lp(self, options):
         """
@@ -3211,35 +3473,25 @@ class Plan:
         if not self._niit_lp:
             return
 
-        for n in range(self.N_n):
-            magi_idx = self.vm["magi"].idx(n)
-            e_idx = self.vm["e"].idx(n)
+        nn = np.arange(self.N_n)
+        # Build MAGI equality row: magi_n = G_n + e_n + Q_n
+        terms = [(self.vm["magi"].idx(nn), 1), (self.vm["e"].idx(nn), -1)]
+
+        # G_n contribution: either via gn LP var or directly from f_tn vars
+        if "gn" in self.vm:
+            terms.append((self.vm["gn"].idx(nn), -1))
+        else:
+            terms += [(self.vm["f"].idx(t, nn), -1) for t in range(self.N_t)]
 
-            # Build MAGI equality row: magi_n = G_n + e_n + Q_n
-            row = {magi_idx: 1, e_idx: -1}
+        # Q_n contribution: use q bracket variables directly.
+        # The LTCG partition constraint enforces q[0]+q[1]+q[2] >= Q_n, so at the
+        # partition minimum the sum equals Q_n. Do NOT substitute the portfolio LP
+        # expression for Q_n: those portfolio terms (b, w, d) cancel q_total at the
+        # partition minimum, removing Q_n from MAGI entirely (the root-cause bug).
+        terms += [(self.vm["q"].idx(p, nn), -1) for p in range(3)]
 
-            # G_n contribution: either via gn LP var or directly from f_tn vars
-            if "gn" in self.vm:
-                row[self.vm["gn"].idx(n)] = row.get(self.vm["gn"].idx(n), 0) - 1
-            else:
-                for t in range(self.N_t):
-                    f_idx = self.vm["f"].idx(t, n)
-                    row[f_idx] = row.get(f_idx, 0) - 1
-
-            # Q_n contribution: use q bracket variables directly.
-            # The LTCG partition constraint enforces q[0]+q[1]+q[2] >= Q_n, so at the
-            # partition minimum the sum equals Q_n. Do NOT substitute the portfolio LP
-            # expression for Q_n: those portfolio terms (b, w, d) cancel q_total at the
-            # partition minimum, removing Q_n from MAGI entirely (the root-cause bug).
-            q0_idx = self.vm["q"].idx(0, n)
-            q1_idx = self.vm["q"].idx(1, n)
-            q2_idx = self.vm["q"].idx(2, n)
-            row[q0_idx] = row.get(q0_idx, 0) - 1
-            row[q1_idx] = row.get(q1_idx, 0) - 1
-            row[q2_idx] = row.get(q2_idx, 0) - 1
-
-            # No SS term: taxable SS is already embedded in e_n + G_n (AGI basis).
-            self.A.addNewRow(row, 0.0, 0.0, tag=("niit_magi_def", n))
+        # No SS term: taxable SS is already embedded in e_n + G_n (AGI basis).
+        self.A.addRows(self.N_n, terms, 0.0, 0.0, tags=[("niit_magi_def", n) for n in range(self.N_n)])
 
     def _configure_NIIT_binary_variables(self, options):
         """
@@ -3273,60 +3525,54 @@ class Plan:
         if I_n_param is None:
             I_n_param = np.sum(self.netinv_in, axis=0)
 
-        for n in range(self.N_n):
-            # Per-year filing status: couple switches to Single at n_d.
-            status_n = 0 if (self.N_i == 2 and n >= self.n_d) else self.N_i - 1
-            T_niit = 200000.0 if status_n == 0 else 250000.0  # NOT inflation-adjusted
-
-            # Big-M: scale with gamma_n[n] following the convention used elsewhere in the code.
-            # Default: 3*T20_n (already gamma-scaled via T20_n = gamma_n[n]*capGainRates).
-            T20_n = self.gamma_n[n] * tx.capGainRates[status_n][1]
-            base_Mniit = getattr(self, "_bigMniit", None)
-            if base_Mniit is None or base_Mniit <= 0:
-                M_niit = 3.0 * T20_n  # gamma_n[n] already embedded in T20_n
-            else:
-                M_niit = base_Mniit * self.gamma_n[n]
-
-            Jn_idx = self.vm["Jn"].idx(n)
-            magi_idx = self.vm["magi"].idx(n)
-            zj_idx = self.vm["zj"].idx(n)
-            niis_idx = self.vm["niis"].idx(n)
-            e_idx = self.vm["e"].idx(n)
-
-            # Bounds
-            self.B.setRange(Jn_idx, 0, M_niit)
-            self.B.setRange(magi_idx, 0, M_niit)
-            self.B.setRange(niis_idx, 0, M_niit)
+        N_n = self.N_n
+        nn = np.arange(N_n)
+        # Per-year filing status: couple switches to Single at n_d.
+        status_n = np.where((self.N_i == 2) & (nn >= self.n_d), 0, self.N_i - 1)
+        T_niit = np.where(status_n == 0, 200000.0, 250000.0)  # NOT inflation-adjusted
+
+        # Big-M: scale with gamma_n[n] following the convention used elsewhere in the code.
+        # Default: 3*T20_n (already gamma-scaled via T20_n = gamma_n[n]*capGainRates).
+        T20_n = self.gamma_n[:N_n] * np.asarray(tx.capGainRates)[status_n, 1]
+        base_Mniit = getattr(self, "_bigMniit", None)
+        if base_Mniit is None or base_Mniit <= 0:
+            M_niit = 3.0 * T20_n  # gamma_n[n] already embedded in T20_n
+        else:
+            M_niit = base_Mniit * self.gamma_n[:N_n]
+
+        Jn_idx = self.vm["Jn"].idx(nn)
+        magi_idx = self.vm["magi"].idx(nn)
+        zj_idx = self.vm["zj"].idx(nn)
+        niis_idx = self.vm["niis"].idx(nn)
+        e_idx = self.vm["e"].idx(nn)
+
+        # Bounds
+        self.B.setRanges(np.column_stack((Jn_idx, magi_idx, niis_idx)), 0, M_niit[:, None])
+
+        # (4) niis_n <= (MAGI_n - T) - (I_n + Q_n) + M*(1-zj)
+        # With the AGI-basis MAGI = G_n + e_n + Q_n, both Q_n and the SS terms cancel:
+        #   MAGI_n - NII_n = (G_n + e_n + Q_n) - (I_n + Q_n) = G_n + e_n - I_n
+        #   niis_n <= G_n + e_n - T - I_n + M*(1-zj)
+        #   niis_n - G_n - e_n + M*zj <= M - T - I_n
+        rhs4 = M_niit - T_niit - np.asarray(I_n_param[:N_n], dtype=float)
+        terms4 = [(niis_idx, 1), (e_idx, -1), (zj_idx, M_niit)]
+        if "gn" in self.vm:
+            terms4.append((self.vm["gn"].idx(nn), -1))
+        else:
+            terms4 += [(self.vm["f"].idx(t, nn), -1) for t in range(self.N_t)]
 
+        families = [
             # (1') J_n + 0.038*niis_n >= 0.038*(MAGI_n - T) - M*(1-zj)
             #   → J_n + 0.038*niis_n - 0.038*magi_n - M*zj >= -0.038*T - M
-            self.A.addNewRow(
-                {Jn_idx: 1, niis_idx: 0.038, magi_idx: -0.038, zj_idx: -M_niit},
-                -0.038 * T_niit - M_niit,
-                np.inf,
-                tag=("niit_floor", n),
-            )
-
+            ([(Jn_idx, 1), (niis_idx, 0.038), (magi_idx, -0.038), (zj_idx, -M_niit)], -0.038 * T_niit - M_niit, np.inf),
             # (2) J_n <= M*zj  →  J_n - M*zj <= 0
-            self.A.addNewRow({Jn_idx: 1, zj_idx: -M_niit}, -np.inf, 0, tag=("niit_j_zero", n))
-
+            ([(Jn_idx, 1), (zj_idx, -M_niit)], -np.inf, 0),
             # (3) MAGI_n <= T + M*zj  →  MAGI_n - M*zj <= T
-            self.A.addNewRow({magi_idx: 1, zj_idx: -M_niit}, -np.inf, T_niit, tag=("niit_magi_cap", n))
-
-            # (4) niis_n <= (MAGI_n - T) - (I_n + Q_n) + M*(1-zj)
-            # With the AGI-basis MAGI = G_n + e_n + Q_n, both Q_n and the SS terms cancel:
-            #   MAGI_n - NII_n = (G_n + e_n + Q_n) - (I_n + Q_n) = G_n + e_n - I_n
-            #   niis_n <= G_n + e_n - T - I_n + M*(1-zj)
-            #   niis_n - G_n - e_n + M*zj <= M - T - I_n
-            rhs4 = M_niit - T_niit - float(I_n_param[n])
-            row4 = {niis_idx: 1, e_idx: -1, zj_idx: M_niit}
-            if "gn" in self.vm:
-                row4[self.vm["gn"].idx(n)] = row4.get(self.vm["gn"].idx(n), 0) - 1
-            else:
-                for t in range(self.N_t):
-                    f_idx = self.vm["f"].idx(t, n)
-                    row4[f_idx] = row4.get(f_idx, 0) - 1
-            self.A.addNewRow(row4, -np.inf, rhs4, tag=("niit_surplus_cap", n))
+            ([(magi_idx, 1), (zj_idx, -M_niit)], -np.inf, T_niit),
+            (terms4, -np.inf, rhs4),
+        ]
+        names = ["niit_floor", "niit_j_zero", "niit_magi_cap", "niit_surplus_cap"]
+        self.A.addInterleavedRows(N_n, families, tags=[(name, n) for n in range(N_n) for name in names])
 
     def _configure_Medicare_binary_variables(self, options):
         if options.get("withMedicare", "loop") != "optimize":
@@ -3334,119 +3580,86 @@ class Plan:
 
         bigM = u.get_numeric_option(options, "bigMamo", BIGM_AMO, min_value=0)
         Nmed = self.N_n - self.nm
+        nnv = np.arange(Nmed)
+        qq = np.arange(self.N_irmaa)
+        zm_idx = self.vm["zm"].idx(nnv[:, None], qq)
+        h_idx = self.vm["h"].idx(nnv[:, None], qq)
         # Select exactly one IRMAA bracket per year (SOS1 behavior).
-        for nn in range(Nmed):
-            row = self.A.newRow()
-            for q in range(self.N_irmaa):
-                row.addElem(self.vm["zm"].idx(nn, q), 1)
-            self.A.addRow(row, 1, 1, tag=("irmaa_amo", nn))
+        self.A.addBlock(Nmed, nnv[:, None], zm_idx, 1, 1, 1, tags=[("irmaa_amo", nn) for nn in range(Nmed)])
 
         # MAGI decomposition into bracket portions: sum_q h_{q} = MAGI.
-        for nn in range(Nmed):
-            n = self.nm + nn
-            row = self.A.newRow()
-            for q in range(self.N_irmaa):
-                row.addElem(self.vm["h"].idx(nn, q), 1)
-
-            if n < 2:
-                # MAGI for the first two plan years is known (prevMAGI from user-supplied data).
-                self.A.addRow(row, self.prevMAGI[n], self.prevMAGI[n], tag=("irmaa_magi_def", nn))
-                # Pre-fix the bracket to match the known MAGI in all solver modes, including
-                # Benders.  The correct bracket is deterministic; pre-fixing (Lb == Ub) causes
-                # _benders_solve to exclude these zm columns from master_cols automatically.
-                # Without pre-fixing, the LP relaxation pushes h-values toward low-premium
-                # brackets (maximizer behaviour) so argmax(h) picks the wrong bracket for these
-                # years, making the subproblem LP infeasible on the first Benders iteration.
-                magi = self.prevMAGI[n]
-                qsel = 0
-                for q in range(1, self.N_irmaa):
-                    if magi > self.Lbar_nq[nn, q - 1]:
-                        qsel = q
-
-                for q in range(self.N_irmaa):
-                    idx = self.vm["zm"].idx(nn, q)
-                    val = 1 if q == qsel else 0
-                    self.B.setRange(idx, val, val)
-                continue
-
-            n2 = n - 2
-            rhs = self.fixed_assets_ordinary_income_n[n2] + self.fixed_assets_capital_gains_n[n2]
-
-            # IRMAA MAGI is AGI-basis: include only the *taxable* portion of SS. When SS
-            # taxability is optimized, taxable SS is the LP var tss[n2] (added once, below);
-            # otherwise it is the SC-loop parameter Psi_n[n2]*zetaBar_in[i,n2].
-            ss_lp = "tss" in self.vm
-            # The terms below are income before the standard exemption, which is what AGI
-            # is: G_(n-2) + e_(n-2). Subtracting e here as well would add it a second time.
-            for i in range(self.N_i):
-                row.addElem(self.vm["w"].idx(i, 1, n2), -1)
-                row.addElem(self.vm["x"].idx(i, n2), -1)
-
-                # Dividends and interest gains for year n2. Only positive returns are taxable.
-                afac = self.mu * self.alpha_ijkn[i, 0, 0, n2] + np.sum(
-                    self.alpha_ijkn[i, 0, 1:, n2] * np.maximum(0, self.tau_kn[1:, n2])
-                )
-
-                row.addElem(self.vm["b"].idx(i, 0, n2), -afac)
-                row.addElem(self.vm["d"].idx(i, n2), -afac)
-
-                # Capital gains on taxable account withdrawal (uses tracked basis if available).
-                bfac = self.alpha_ijkn[i, 0, 0, n2] * self._effective_cap_gain_coef(i, n2)
-                row.addElem(self.vm["w"].idx(i, 0, n2), afac - bfac)
-
-                sumoni = (
-                    self.omega_in[i, n2]
-                    + self.other_inc_in[i, n2]
-                    + self.netinv_in[i, n2]
-                    + self.piBar_in[i, n2]
-                    + self.spiaBar_in[i, n2]
-                    + 0.5 * self.kappa_ijn[i, 0, n2] * afac
-                )
-                if not ss_lp:
-                    sumoni += self.Psi_n[n2] * self.zetaBar_in[i, n2]  # taxable SS (SC-loop param)
-                rhs += sumoni
-
-            if ss_lp:
-                row.addElem(self.vm["tss"].idx(n2), -1)  # taxable SS (LP var) on LHS
-
-            self.A.addRow(row, rhs, rhs, tag=("irmaa_magi_def", nn))
+        nv = self.nm + nnv
+        # MAGI for the first two plan years is known (prevMAGI from user-supplied data).
+        known = nv < 2
+        lagged = ~known
+        n2 = np.maximum(nv - 2, 0)
+        rhs = self.fixed_assets_ordinary_income_n[n2] + self.fixed_assets_capital_gains_n[n2]
+
+        # IRMAA MAGI is AGI-basis: include only the *taxable* portion of SS. When SS
+        # taxability is optimized, taxable SS is the LP var tss[n2] (added once, below);
+        # otherwise it is the SC-loop parameter Psi_n[n2]*zetaBar_in[i,n2].
+        ss_lp = "tss" in self.vm
+        # The terms below are income before the standard exemption, which is what AGI
+        # is: G_(n-2) + e_(n-2). Subtracting e here as well would add it a second time.
+        agi_terms, afacs = self._agiTerms(n2)
+        for i in range(self.N_i):
+            sumoni = (
+                self.omega_in[i, n2]
+                + self.other_inc_in[i, n2]
+                + self.netinv_in[i, n2]
+                + self.piBar_in[i, n2]
+                + self.spiaBar_in[i, n2]
+                + 0.5 * self.kappa_ijn[i, 0, n2] * afacs[i]
+            )
+            if not ss_lp:
+                sumoni += self.Psi_n[n2] * self.zetaBar_in[i, n2]  # taxable SS (SC-loop param)
+            rhs += sumoni
+        rhs = np.where(known, self.prevMAGI[np.minimum(nv, 1)], rhs)
+
+        terms = [(h_idx[:, q], 1) for q in range(self.N_irmaa)]
+        terms += [(cols, vals, lagged) for cols, vals in agi_terms]
+        if ss_lp:
+            terms.append((self.vm["tss"].idx(n2), -1, lagged))  # taxable SS (LP var) on LHS
+        self.A.addRows(Nmed, terms, rhs, rhs, tags=[("irmaa_magi_def", nn) for nn in range(Nmed)])
+
+        # Pre-fix the bracket to match the known MAGI in all solver modes, including
+        # Benders.  The correct bracket is deterministic; pre-fixing (Lb == Ub) causes
+        # _benders_solve to exclude these zm columns from master_cols automatically.
+        # Without pre-fixing, the LP relaxation pushes h-values toward low-premium
+        # brackets (maximizer behaviour) so argmax(h) picks the wrong bracket for these
+        # years, making the subproblem LP infeasible on the first Benders iteration.
+        for nn in np.flatnonzero(known):
+            magi = self.prevMAGI[nv[nn]]
+            qsel = 0
+            for q in range(1, self.N_irmaa):
+                if magi > self.Lbar_nq[nn, q - 1]:
+                    qsel = q
+            val = (qq == qsel).astype(float)
+            self.B.setRanges(zm_idx[nn], val, val)
 
         # Bracket bounds: L_{q-1} z_q <= mg_q <= L_q z_q.
-        for nn in range(Nmed):
-            for q in range(self.N_irmaa):
-                mg_idx = self.vm["h"].idx(nn, q)
-                zm_idx = self.vm["zm"].idx(nn, q)
-
-                lower = 0 if q == 0 else self.Lbar_nq[nn, q - 1]
-                if lower > 0:
-                    self.A.addNewRow({mg_idx: 1, zm_idx: -lower}, 0, np.inf, tag=("irmaa_bracket_lb", nn, q))
-
-                if q < self.N_irmaa - 1:
-                    upper = self.Lbar_nq[nn, q]
-                else:
-                    # Upper bound for last bracket so h_qn = 0 when z_q = 0.
-                    upper = bigM * self.gamma_n[self.nm + nn]
-                self.A.addNewRow({mg_idx: 1, zm_idx: -upper}, -np.inf, 0, tag=("irmaa_bracket_ub", nn, q))
+        lower = np.zeros((Nmed, self.N_irmaa))
+        lower[:, 1:] = self.Lbar_nq[:Nmed, : self.N_irmaa - 1]
+        upper = np.empty((Nmed, self.N_irmaa))
+        upper[:, :-1] = self.Lbar_nq[:Nmed, : self.N_irmaa - 1]
+        # Upper bound for last bracket so h_qn = 0 when z_q = 0.
+        upper[:, -1] = bigM * self.gamma_n[self.nm + nnv]
+        self._addBracketBounds(h_idx, zm_idx, lower, upper, "irmaa_bracket")
 
     def _add_Medicare_costs(self, options):
         if options.get("withMedicare", "loop") != "optimize":
             # In loop mode, Medicare costs are computed outside the solver (M_n).
             # Ensure the in-model Medicare variable (m_n) stays at zero.
-            for n in range(self.N_n):
-                self.B.setRange(self.vm["m"].idx(n), 0, 0)
+            self.B.setRanges(self.vm["m"].idx(np.arange(self.N_n)), 0, 0)
             return
 
-        for n in range(self.nm):
-            self.B.setRange(self.vm["m"].idx(n), 0, 0)
+        self.B.setRanges(self.vm["m"].idx(np.arange(self.nm)), 0, 0)
 
         Nmed = self.N_n - self.nm
-        for nn in range(Nmed):
-            n = self.nm + nn
-            row = self.A.newRow()
-            row.addElem(self.vm["m"].idx(n), 1)
-            for q in range(self.N_irmaa):
-                row.addElem(self.vm["zm"].idx(nn, q), -self.Cbar_nq[nn, q])
-            self.A.addRow(row, 0, 0, tag=("irmaa_cost_def", nn))
+        nn = np.arange(Nmed)
+        terms = [(self.vm["m"].idx(self.nm + nn), 1)]
+        terms += [(self.vm["zm"].idx(nn, q), -self.Cbar_nq[:Nmed, q]) for q in range(self.N_irmaa)]
+        self.A.addRows(Nmed, terms, 0, 0, tags=[("irmaa_cost_def", n) for n in range(Nmed)])
 
     def _configure_ACA_binary_variables(self, options):
         """
@@ -3466,72 +3679,72 @@ class Plan:
 
         bigM = u.get_numeric_option(options, "bigMaca", BIGM_AMO, min_value=0)
 
+        n_aca = self.n_aca
+        nn = np.arange(n_aca)
+        rr = np.arange(tx.N_ACA_R)
+        za_idx = self.vm["za"].idx(nn[:, None], rr)
+        haca_idx = self.vm["haca"].idx(nn[:, None], rr)
+
         # a) SOS1: exactly one bracket selected per year.
-        for nn in range(self.n_aca):
-            row = self.A.newRow()
-            for r in range(tx.N_ACA_R):
-                row.addElem(self.vm["za"].idx(nn, r), 1)
-            self.A.addRow(row, 1, 1, tag=("aca_amo", nn))
+        self.A.addBlock(n_aca, nn[:, None], za_idx, 1, 1, 1, tags=[("aca_amo", n) for n in range(n_aca)])
 
         # b) MAGI decomposition: sum_r haca[nn, r] = current-year MAGI.
-        for nn in range(self.n_aca):
-            n = nn  # ACA uses current year (no lag)
-            rhs_magi = self.fixed_assets_ordinary_income_n[n] + self.fixed_assets_capital_gains_n[n]
+        # ACA uses current year (no lag).
+        rhs_magi = self.fixed_assets_ordinary_income_n[nn] + self.fixed_assets_capital_gains_n[nn]
 
-            # As for IRMAA: these terms are income before the standard exemption, so the
-            # exemption is already in them and must not be subtracted a second time.
-            row_magi = {}
-
-            for i in range(self.N_i):
-                afac = self.mu * self.alpha_ijkn[i, 0, 0, n] + np.sum(
-                    self.alpha_ijkn[i, 0, 1:, n] * np.maximum(0, self.tau_kn[1:, n])
-                )
-                bfac = self.alpha_ijkn[i, 0, 0, n] * self._effective_cap_gain_coef(i, n)
-
-                w1_idx = self.vm["w"].idx(i, 1, n)
-                x_idx = self.vm["x"].idx(i, n)
-                b_idx = self.vm["b"].idx(i, 0, n)
-                d_idx = self.vm["d"].idx(i, n)
-                w0_idx = self.vm["w"].idx(i, 0, n)
-
-                row_magi[w1_idx] = row_magi.get(w1_idx, 0) - 1
-                row_magi[x_idx] = row_magi.get(x_idx, 0) - 1
-                row_magi[b_idx] = row_magi.get(b_idx, 0) - afac
-                row_magi[d_idx] = row_magi.get(d_idx, 0) - afac
-                row_magi[w0_idx] = row_magi.get(w0_idx, 0) + (afac - bfac)
-
-                rhs_magi += (
-                    self.omega_in[i, n]
-                    + self.other_inc_in[i, n]
-                    + self.netinv_in[i, n]
-                    + self.zetaBar_in[i, n]  # full SS (not 0.5×SS; ACA uses MAGI)
-                    + self.piBar_in[i, n]
-                    + self.spiaBar_in[i, n]
-                    + 0.5 * self.kappa_ijn[i, 0, n] * afac
-                )
-
-            for r in range(tx.N_ACA_R):
-                haca_idx = self.vm["haca"].idx(nn, r)
-                row_magi[haca_idx] = row_magi.get(haca_idx, 0) + 1
-
-            self.A.addNewRow(row_magi, rhs_magi, rhs_magi, tag=("aca_magi_def", nn))
+        # As for IRMAA: these terms are income before the standard exemption, so the
+        # exemption is already in them and must not be subtracted a second time.
+        terms, afacs = self._agiTerms(nn)
+        for i in range(self.N_i):
+            rhs_magi += (
+                self.omega_in[i, nn]
+                + self.other_inc_in[i, nn]
+                + self.netinv_in[i, nn]
+                + self.zetaBar_in[i, nn]  # full SS (not 0.5×SS; ACA uses MAGI)
+                + self.piBar_in[i, nn]
+                + self.spiaBar_in[i, nn]
+                + 0.5 * self.kappa_ijn[i, 0, nn] * afacs[i]
+            )
+        terms += [(haca_idx[:, r], 1) for r in range(tx.N_ACA_R)]
+        self.A.addRows(n_aca, terms, rhs_magi, rhs_magi, tags=[("aca_magi_def", n) for n in range(n_aca)])
 
         # c) Bracket bounds: Lbar[nn, r-1]*za[r] <= haca[r] <= Lbar[nn, r]*za[r].
-        for nn in range(self.n_aca):
-            for r in range(tx.N_ACA_R):
-                haca_idx = self.vm["haca"].idx(nn, r)
-                za_idx = self.vm["za"].idx(nn, r)
-
-                lower = 0 if r == 0 else self.Lbar_aca_nr[nn, r - 1]
-                if lower > 0:
-                    self.A.addNewRow({haca_idx: 1, za_idx: -lower}, 0, np.inf, tag=("aca_bracket_lb", nn, r))
-
-                if r < tx.N_ACA_R - 1:
-                    upper = self.Lbar_aca_nr[nn, r]
-                else:
-                    # Last bracket (above 400% FPL): use BigM as upper bound so haca = 0 when za = 0.
-                    upper = bigM * self.gamma_n[nn]
-                self.A.addNewRow({haca_idx: 1, za_idx: -upper}, -np.inf, 0, tag=("aca_bracket_ub", nn, r))
+        lower = np.zeros((n_aca, tx.N_ACA_R))
+        lower[:, 1:] = self.Lbar_aca_nr[:n_aca, : tx.N_ACA_R - 1]
+        upper = np.empty((n_aca, tx.N_ACA_R))
+        upper[:, :-1] = self.Lbar_aca_nr[:n_aca, : tx.N_ACA_R - 1]
+        # Last bracket (above 400% FPL): use BigM as upper bound so haca = 0 when za = 0.
+        upper[:, -1] = bigM * self.gamma_n[:n_aca]
+        self._addBracketBounds(haca_idx, za_idx, lower, upper, "aca_bracket")
+
+    def _addBracketBounds(self, h_idx, z_idx, lower, upper, name):
+        """
+        Add the rows lower*z <= h <= upper*z tying the MAGI portion h[nn, q] to the
+        bracket selector z[nn, q]. Rows are emitted year by year and bracket by bracket,
+        the lower-bound row first and only when lower > 0, and tagged (name_lb|name_ub, nn, q).
+        """
+        has_lb = (lower > 0).ravel()
+        nrows_q = 1 + has_lb
+        ub_row = np.cumsum(nrows_q) - 1
+        lb_row = ub_row[has_lb] - 1
+        h_flat = h_idx.ravel()
+        z_flat = z_idx.ravel()
+
+        nrows = int(ub_row[-1]) + 1 if len(ub_row) else 0
+        rows = np.concatenate((lb_row, lb_row, ub_row, ub_row))
+        cols = np.concatenate((h_flat[has_lb], z_flat[has_lb], h_flat, z_flat))
+        vals = np.concatenate((np.ones(len(lb_row)), -lower.ravel()[has_lb], np.ones(len(ub_row)), -upper.ravel()))
+        order = np.argsort(rows, kind="stable")
+        lb = np.full(nrows, -np.inf)
+        ub = np.full(nrows, np.inf)
+        lb[lb_row] = 0
+        ub[ub_row] = 0
+        tags = []
+        for k, (nn, q) in enumerate(np.ndindex(*lower.shape)):
+            if has_lb[k]:
+                tags.append((name + "_lb", nn, q))
+            tags.append((name + "_ub", nn, q))
+        self.A.addBlock(nrows, rows[order], cols[order], vals[order], lb, ub, tags=tags)
 
     def _add_ACA_costs(self, options):
         """
@@ -3545,18 +3758,18 @@ class Plan:
             return  # Loop mode: no maca variable; ACA_n from SC loop is in the cash-flow RHS.
 
         # Pin post-ACA years to zero (individual is on Medicare; no ACA cost).
-        for n in range(self.n_aca, self.N_n):
-            self.B.setRange(self.vm["maca"].idx(n), 0, 0)
+        self.B.setRanges(self.vm["maca"].idx(np.arange(self.n_aca, self.N_n)), 0, 0)
 
         # Cost constraint: maca_n = sum_{r=0}^{5} cap_pct_r * haca[nn,r] + slcsp*za[nn,6].
         # Bracket 6 (>400% FPL): 2026 rules impose full SLCSP (no PTC), not proportional to MAGI.
-        for nn in range(self.n_aca):
-            row = self.A.newRow({self.vm["maca"].idx(nn): 1})
-            for r in range(tx.N_ACA_R - 1):  # r=0..5 only; bracket 6 uses fixed SLCSP
-                row.addElem(self.vm["haca"].idx(nn, r), -self.cap_pct_aca_r[r])
-            row.addElem(self.vm["za"].idx(nn, tx.N_ACA_R - 1), -self.slcsp_aca_n[nn])
-            self.A.addRow(row, 0, 0, tag=("aca_cost_def", nn))
-            self.B.setRange(self.vm["maca"].idx(nn), 0, self.slcsp_aca_n[nn])
+        nn = np.arange(self.n_aca)
+        slcsp = self.slcsp_aca_n[: self.n_aca]
+        terms = [(self.vm["maca"].idx(nn), 1)]
+        # r=0..5 only; bracket 6 uses fixed SLCSP
+        terms += [(self.vm["haca"].idx(nn, r), -self.cap_pct_aca_r[r]) for r in range(tx.N_ACA_R - 1)]
+        terms.append((self.vm["za"].idx(nn, tx.N_ACA_R - 1), -slcsp))
+        self.A.addRows(self.n_aca, terms, 0, 0, tags=[("aca_cost_def", n) for n in range(self.n_aca)])
+        self.B.setRanges(self.vm["maca"].idx(nn), 0, slcsp)
 
     def _build_objective_vector(self, objective, options):
         c_arr = np.zeros(self.nvars)
@@ -3655,6 +3868,9 @@ class Plan:
         roll=0,
         augmented=False,
         log_x=False,
+        workers=None,
+        deadline=None,
+        cancel_event=None,
     ):
         return run_historical_range(
             self,
@@ -3669,11 +3885,91 @@ class Plan:
             roll=roll,
             augmented=augmented,
             log_x=log_x,
+            workers=workers,
+            deadline=deadline,
+            cancel_event=cancel_event,
         )
 
     @_timer
-    def runMC(self, objective, options, N, verbose=False, figure=False, progcall=None, log_x=False):
-        return run_mc(self, objective, options, N, verbose=verbose, figure=figure, progcall=progcall, log_x=log_x)
+    def runMC(
+        self,
+        objective,
+        options,
+        N,
+        verbose=False,
+        figure=False,
+        progcall=None,
+        log_x=False,
+        workers=None,
+        precision_pct=None,
+        target_success_rate_pct=90.0,
+        batch=None,
+        time_budget=None,
+        bank=None,
+        deadline=None,
+        cancel_event=None,
+    ):
+        return run_mc(
+            self,
+            objective,
+            options,
+            N,
+            verbose=verbose,
+            figure=figure,
+            progcall=progcall,
+            log_x=log_x,
+            workers=workers,
+            precision_pct=precision_pct,
+            target_success_rate_pct=target_success_rate_pct,
+            batch=batch,
+            time_budget=time_budget,
+            bank=bank,
+            deadline=deadline,
+            cancel_event=cancel_event,
+        )
+
+    def iterScenarios(
+        self,
+        objective,
+        options,
+        scenario_method,
+        *,
+        ystart=None,
+        yend=None,
+        reverse=False,
+        roll=0,
+        augmented=False,
+        N=None,
+        bank=None,
+        with_longevity=False,
+        sexes=None,
+        seed=None,
+        workers=None,
+        bins=STREAM_BINS,
+        deadline=None,
+        cancel_event=None,
+    ):
+        """Yield the historical or Monte Carlo scenarios of this plan as they are solved; see iter_scenarios()."""
+        return iter_scenarios(
+            self,
+            objective,
+            options,
+            scenario_method,
+            ystart=ystart,
+            yend=yend,
+            reverse=reverse,
+            roll=roll,
+            augmented=augmented,
+            N=N,
+            bank=bank,
+            with_longevity=with_longevity,
+            sexes=sexes,
+            seed=seed,
+            workers=workers,
+            bins=bins,
+            deadline=deadline,
+            cancel_event=cancel_event,
+        )
 
     @_timer
     def runStochasticSpending(
@@ -3690,6 +3986,16 @@ class Plan:
         with_longevity=False,
         sexes=None,
         seed=None,
+        executor="thread",
+        precision_pct=None,
+        target_success_rate_pct=90.0,
+        batch=None,
+        time_budget=None,
+        bank=None,
+        deadline=None,
+        cancel_event=None,
+        checkpoint=None,
+        trajectories=None,
     ):
         return run_stochastic_spending(
             self,
@@ -3704,6 +4010,16 @@ class Plan:
             with_longevity=with_longevity,
             sexes=sexes,
             seed=seed,
+            executor=executor,
+            precision_pct=precision_pct,
+            target_success_rate_pct=target_success_rate_pct,
+            batch=batch,
+            time_budget=time_budget,
+            bank=bank,
+            deadline=deadline,
+            cancel_event=cancel_event,
+            checkpoint=checkpoint,
+            trajectories=trajectories,
         )
 
     @_timer
@@ -3720,6 +4036,8 @@ class Plan:
         seed=None,
         with_duals=False,
         progcall=None,
+        bank=None,
+        warm_start=False,
     ):
         """
         Trace the efficient frontier between net spending and bequest.
@@ -3739,6 +4057,45 @@ class Plan:
             seed=seed,
             with_duals=with_duals,
             progcall=progcall,
+            bank=bank,
+            warm_start=warm_start,
+        )
+
+    def iterSpendingBequestFrontier(
+        self,
+        options,
+        bequest_grid,
+        *,
+        scenario_method="historical",
+        ystart=None,
+        yend=None,
+        N=None,
+        seed=None,
+        bank=None,
+        workers=None,
+        bins=STREAM_BINS,
+        deadline=None,
+        cancel_event=None,
+    ):
+        """
+        Yield the solves of a stochastic spending/bequest frontier as they complete.
+
+        See stresstests.iter_spending_bequest_frontier.
+        """
+        return iter_spending_bequest_frontier(
+            self,
+            options,
+            bequest_grid,
+            scenario_method=scenario_method,
+            ystart=ystart,
+            yend=yend,
+            N=N,
+            seed=seed,
+            bank=bank,
+            workers=workers,
+            bins=bins,
+            deadline=deadline,
+            cancel_event=cancel_event,
         )
 
     @_timer
@@ -3888,6 +4245,7 @@ class Plan:
             "withSSTaxability",
             "withSSAges",  # SS claiming age: "fixed" (default) or "optimize"
             "withDuals",  # Re-solve final LP with binaries fixed to extract shadow prices
+            "withHotStart",  # HiGHS: keep one model across SC iterations and hot start re-solves
             "withdrawalOrder",  # "optimal" (default) or "taxable_first" (naive ordering gates)
         ]
         options = {} if options is None else options
@@ -3972,7 +4330,12 @@ class Plan:
         self._st_lp = False  # Will be set to True in _buildOffsetMap when state is set
         self._adjustedParameters = False  # Force fresh parameter setup for each solve()
         self._highs_warm_start = None  # MIP warm-start hint; reset each solve(), updated each SC iter
+        self._lpPattern = None  # Constraint pattern reused across SC iterations; see _buildConstraints()
+        self._highs_session = None  # Persistent HiGHS model, alive during the SC loop only
+        self._reuseLpPattern = False
         self._dual_data = None  # Shadow prices from binaries-fixed LP re-solve; set when withDuals=True
+        self._warmStartOut = None  # What a neighbouring case can start from; see getWarmStart()
+        self.scIterations = 0  # Iterations of the self-consistent loop, set by _scSolve()
 
         # Compute state tax parameters when a state is configured.
         # Note: st_ss_thresh_n (AGI threshold for SS exemption, e.g. KS $75k, MO $100k) is
@@ -4208,6 +4571,40 @@ class Plan:
         tau_prev = self.tau_kn[0, n - 1]  # n=0 → tau_kn[0,-1] (last rate), matches roll convention
         return max(0.0, tau_prev - self.mu)
 
+    def _effective_cap_gain_coefs(self, i, nn):
+        """Vectorized _effective_cap_gain_coef() over an array of years ``nn``."""
+        legacy = np.maximum(0.0, self.tau_kn[0, nn - 1] - self.mu)
+        if self.gain_fraction_in is None:
+            return legacy
+        gf = self.gain_fraction_in[i, nn]
+        return np.where(np.isnan(gf), legacy, gf)
+
+    def _agiTerms(self, nn):
+        """
+        LP terms of the income before the standard exemption for years ``nn``, shared by
+        the provisional-income and MAGI rows: IRA withdrawals, Roth conversions, and the
+        yield and realized gains of the taxable account. Returns the terms, in row order,
+        and the combined dividend and interest yield of each individual's taxable account.
+        """
+        terms, afacs = [], []
+        for i in range(self.N_i):
+            # Combined dividend + interest yield for taxable account (equity + bonds/notes/cash).
+            afac = self.mu * self.alpha_ijkn[i, 0, 0, nn] + np.sum(
+                self.alpha_ijkn[i, 0, 1:][:, nn] * np.maximum(0, self.tau_kn[1:, nn]), axis=0
+            )
+            # Capital gains on taxable account withdrawal (uses tracked basis if available).
+            bfac = self.alpha_ijkn[i, 0, 0, nn] * self._effective_cap_gain_coefs(i, nn)
+            terms += [
+                (self.vm["w"].idx(i, 1, nn), -1),  # IRA withdrawals (income)
+                (self.vm["x"].idx(i, nn), -1),  # Roth conversions (income)
+                (self.vm["b"].idx(i, 0, nn), -afac),  # beginning balance × yield
+                (self.vm["d"].idx(i, nn), -afac),  # contributions × yield
+                (self.vm["w"].idx(i, 0, nn), afac - bfac),  # withdrawals (net)
+            ]
+            afacs.append(afac)
+
+        return terms, afacs
+
     def _init_gain_fraction(self):
         """Initialize gain_fraction_in from user-supplied cost basis before first LP solve.
         Zero basis for an individual means 'use legacy approximation for that person' (NaN sentinel).
@@ -4302,9 +4699,25 @@ class Plan:
 
         self._computeNLstuff(None, includeMedicare, fixedPsi=fixed_psi)
         self._init_gain_fraction()
+        warm_basis = self._applyWarmStart(fixed_psi)
         M_n_lp = self.M_n.copy()
         ACA_n_lp = self.ACA_n.copy()
         Psi_n_lp = self.Psi_n.copy()
+        # Build the constraint pattern once for this solve; later iterations only patch
+        # the rows and bounds of the parametric emitters (see _constraintEmitters()).
+        self._lpPattern = None
+        self._reuseLpPattern = True
+        # Opt-in: keep one HiGHS model alive across iterations; see highssession. Where an
+        # LP optimum is degenerate a hot start can return another optimal vertex than a cold
+        # solve, and an oscillating loop can then settle on another fixed point: the default
+        # solves every iteration cold, so that results do not depend on the solve history.
+        # A warm start from a neighbouring case asks for its basis, hence for a session.
+        hot_start = bool(options.get("withHotStart", False)) or warm_basis is not None
+        self._highs_session = (
+            highssession.HighsSession(basis=warm_basis, interrupt=getattr(self, "_solveInterrupt", None))
+            if is_milp and hot_start
+            else None
+        )
         while True:
             # Snapshot the NL parameters actually embedded in this iteration's LP constraints.
             # _buildConstraints runs inside the solver call below, so these are the values it
@@ -4441,6 +4854,18 @@ class Plan:
             it += 1
             old_x = xx
 
+        self.scIterations = it + 1
+        self._lpPattern = None
+        self._reuseLpPattern = False
+        final_basis = None
+        if self._highs_session is not None:
+            final_basis = self._highs_session.basis()
+            history = self._highs_session.history
+            nhot = sum(1 for mode, _, _ in history if mode == "hot")
+            total = sum(elapsed for _, elapsed, _ in history)
+            self.mylog.vprint(f"HiGHS session: {len(history)} solves ({nhot} hot started) in {total:.2f}s.")
+            self._highs_session.close()
+            self._highs_session = None
         if solverSuccess:
             self.mylog.print(f"Self-consistent loop returned after {it + 1} iterations.")
             if solverMsg:
@@ -4472,6 +4897,16 @@ class Plan:
                 self.J_n = J_n_lp
             if self.slcsp_annual > 0 and not self._aca_lp:
                 self.ACA_n = ACA_n_lp
+            self._warmStartOut = {
+                "nvars": self.nvars,
+                "x": np.array(xx, dtype=np.float64),
+                "params": {
+                    name: np.copy(getattr(self, name))
+                    for name in WARM_START_PARAMS
+                    if getattr(self, name, None) is not None
+                },
+                "basis": final_basis,
+            }
             self._check_cashflow_balance()
             if options.get("withDuals", False):
                 self._computeDuals(xx, options)
@@ -4483,6 +4918,28 @@ class Plan:
 
         return None
 
+    def _applyWarmStart(self, fixedPsi):
+        """
+        Replace the starting loop parameters with those of the warm start set by
+        setWarmStart(), if any, and seed the HiGHS hint with its solution. Return its
+        basis for the HiGHS session, or None.
+        """
+        warm, self._warmStartIn = getattr(self, "_warmStartIn", None), None
+        if warm is None:
+            return None
+        if warm["nvars"] != self.nvars:
+            self.mylog.vprint("Ignoring warm start from a model of another size.")
+            return None
+        for name, value in warm["params"].items():
+            if name == "Psi_n" and fixedPsi is not None:
+                continue
+            current = getattr(self, name, None)
+            if current is not None and np.shape(current) == np.shape(value):
+                setattr(self, name, value.copy())
+        self._highs_warm_start = warm["x"].copy()
+        self.mylog.vprint("Starting self-consistent loop from a warm start.")
+        return warm["basis"]
+
     def _amoContext(self, options):
         """Bundle what amorepair needs from this plan."""
         col_lb, _ = self.B.arrays()
@@ -4637,69 +5094,14 @@ class Plan:
 
         Returns (objfn, xx, success, msg, gap) matching the _milpSolve contract.
         """
-        import highspy
-
         time_limit = u.get_numeric_option(options, "maxTime", TIME_LIMIT, min_value=0)
         mygap = u.get_numeric_option(options, "gap", GAP, min_value=0)
         verbose = options.get("verbose", False)
 
-        h = highspy.Highs()
-        h.setOptionValue("output_flag", bool(verbose))
-        h.setOptionValue("mip_rel_gap", float(mygap))
-        h.setOptionValue("time_limit", float(time_limit))
-        h.setOptionValue("mip_max_nodes", 1_000_000)
-        h.setOptionValue("presolve", "on")
-
-        inf = highspy.kHighsInf
-        col_lb = np.where(np.isneginf(Lb), -inf, Lb).astype(np.float64)
-        col_ub = np.where(np.isposinf(Ub), inf, Ub).astype(np.float64)
-        row_lb = np.where(np.isneginf(lbvec), -inf, lbvec).astype(np.float64)
-        row_ub = np.where(np.isposinf(ubvec), inf, ubvec).astype(np.float64)
-
-        h.passModel(
-            len(c),
-            len(lbvec),
-            len(a_value),
-            int(highspy.MatrixFormat.kRowwise),  # 2 — NOT 1 (kColwise)
-            int(highspy.ObjSense.kMinimize),  # 1
-            0.0,  # offset
-            c.astype(np.float64),
-            col_lb,
-            col_ub,
-            row_lb,
-            row_ub,
-            a_start.astype(np.int32),
-            a_index.astype(np.int32),
-            a_value.astype(np.float64),
-            integrality.astype(np.int32),
+        return highssession.HighsSession(interrupt=getattr(self, "_solveInterrupt", None)).solve(
+            c, Lb, Ub, lbvec, ubvec, a_start, a_index, a_value, integrality, time_limit, mygap, verbose, warm_x=warm_x
         )
 
-        if warm_x is not None:
-            all_idx = np.arange(len(c), dtype=np.int32)
-            h.setSolution(len(c), all_idx, warm_x.astype(np.float64))
-
-        h.run()
-
-        ms = h.getModelStatus()
-        _, pstatus = h.getInfoValue("primal_solution_status")
-        success = (
-            ms in (highspy.HighsModelStatus.kOptimal, highspy.HighsModelStatus.kObjectiveBound)
-            or pstatus == highspy.kSolutionStatusFeasible
-        )
-
-        if success:
-            sol = h.getSolution()
-            xx = np.array(sol.col_value, dtype=np.float64)
-            obj_val = float(h.getObjectiveValue())
-            # mip_gap is meaningless on a pure LP; -1 is the convention for those solves.
-            gap = h.getInfoValue("mip_gap")[1] if integrality.any() else -1.0
-        else:
-            xx = np.zeros(len(c))
-            obj_val = None
-            gap = -1.0
-
-        return obj_val, xx, success, h.modelStatusToString(ms), float(gap)
-
     def _run_highs_lp_with_duals(self, A, B, c_obj, options, col_overrides=None, return_col_duals=False):
         """
         Solve LP (no integrality) via HiGHS and return primal + row dual variables.
@@ -4792,7 +5194,9 @@ class Plan:
             "up": mosek.boundkey.up,
         }
 
-        Aind, Aval, clb, cub = A.lists()
+        a_start, a_index, a_value = A.to_csr()
+        a_end = np.append(a_start[1:], len(a_index))
+        clb, cub = A.lb, A.ub
         ckeys = A.keys()
         vlb, vub = B.arrays()
         vkeys = list(B.keys())  # copy so overrides don't mutate B
@@ -4815,14 +5219,13 @@ class Plan:
 
         for ii in range(len(cind)):
             task.putcj(cind[ii], cval[ii])
-        for ii in range(nvars):
-            task.putvarbound(ii, bdic[vkeys[ii]], float(vlb[ii]), float(vub[ii]))
+        task.putvarboundslice(0, nvars, [bdic[k] for k in vkeys], vlb.tolist(), vub.tolist())
         if int_vars:
             for ii in int_vars:
                 task.putvartype(int(ii), mosek.variabletype.type_int)
-        for i in range(ncons):
-            task.putarow(i, Aind[i], Aval[i])
-            task.putconbound(i, bdic[ckeys[i]], float(clb[i]), float(cub[i]))
+        if ncons > 0:
+            task.putarowslice(0, ncons, a_start.tolist(), a_end.tolist(), a_index.tolist(), a_value.tolist())
+            task.putconboundslice(0, ncons, [bdic[k] for k in ckeys], clb.tolist(), cub.tolist())
         task.putobjsense(mosek.objsense.minimize)
 
         return task, ncons, nvars
@@ -4954,8 +5357,7 @@ class Plan:
             self._dual_data = None
             return
 
-        activity = np.array([float(np.dot(vals, xx[inds]))
-                            for inds, vals in zip(self.A.Aind, self.A.Aval, strict=True)])
+        activity = self.A.activity(xx)
         if self.objective == "maxSpending":
             objFac = -1.0 / float(self.xi_n[0])
         else:
@@ -5008,6 +5410,8 @@ class Plan:
         The solution from each successful iteration is stored in self._highs_warm_start and
         passed as a hint to the next iteration, reducing branch-and-bound nodes when bracket
         assignments are stable across iterations.
+        Within the SC loop, the model is kept in a persistent HiGHS session and updated in
+        place, so that pure-LP iterations hot start from the previous basis.
         """
         self._buildConstraints(objective, options)
         a_start, a_index, a_value = self.A.to_csr()
@@ -5017,9 +5421,31 @@ class Plan:
         integrality = self.B.integralityArray()
         c = self.c.arrays()
 
-        result = self._run_highs(
-            c, Lb, Ub, lbvec, ubvec, a_start, a_index, a_value, integrality, options, warm_x=self._highs_warm_start
-        )
+        session = getattr(self, "_highs_session", None)
+        if session is None:
+            result = self._run_highs(
+                c, Lb, Ub, lbvec, ubvec, a_start, a_index, a_value, integrality, options, warm_x=self._highs_warm_start
+            )
+        else:
+            time_limit = u.get_numeric_option(options, "maxTime", TIME_LIMIT, min_value=0)
+            mygap = u.get_numeric_option(options, "gap", GAP, min_value=0)
+            result = session.solve(
+                c,
+                Lb,
+                Ub,
+                lbvec,
+                ubvec,
+                a_start,
+                a_index,
+                a_value,
+                integrality,
+                time_limit,
+                mygap,
+                options.get("verbose", False),
+                warm_x=self._highs_warm_start,
+            )
+            mode, elapsed, simplex_its = session.history[-1]
+            self.mylog.vprint(f"HiGHS {mode} solve: {elapsed:.3f}s, {simplex_its} simplex iterations.")
         if result[2]:  # success — store for next SC iteration
             self._highs_warm_start = result[1].copy()
         return result
@@ -5163,17 +5589,24 @@ class Plan:
 
         n_master = len(master_cols)
         master_col_to_pos = {col: pos for pos, col in enumerate(master_cols)}
-        master_col_set = set(master_cols)
 
-        # Column-to-row transpose for Benders cut coefficient computation.
-        col_rows = [[] for _ in range(nvars)]
-        for i, (inds, vals) in enumerate(zip(self.A.Aind, self.A.Aval, strict=True)):
-            for j, v in zip(inds, vals, strict=True):
-                col_rows[j].append((i, float(v)))
+        # Column-to-row transpose of the master columns for Benders cut coefficient computation.
+        a_start, a_index, a_value = self.A.to_csr()
+        row_of = np.repeat(np.arange(self.A.ncons), np.diff(np.append(a_start, len(a_index))))
+        in_master = np.zeros(nvars, dtype=bool)
+        in_master[master_cols] = True
+        elem_master = in_master[a_index]
+        order = np.argsort(a_index, kind="stable")
+        order = order[elem_master[order]]
+        splits = np.searchsorted(a_index[order], master_cols, side="right")[:-1]
+        col_rows = dict(zip(master_cols, zip(np.split(row_of[order], splits), np.split(a_value[order], splits),
+                                             strict=True), strict=True))
 
         # Master-only rows: rows whose non-zeros lie entirely in master (binary) columns.
         # These are the AMO constraints (sum_q zm[n,q] = 1, etc.) and zl monotonicity.
-        master_only_rows = [i for i, inds in enumerate(self.A.Aind) if inds and all(j in master_col_set for j in inds)]
+        nonzeros = np.bincount(row_of, minlength=self.A.ncons)
+        outside = np.bincount(row_of[~elem_master], minlength=self.A.ncons)
+        master_only_rows = np.flatnonzero((nonzeros > 0) & (outside == 0))
 
         # Build master problem: variables = [z_0, ..., z_{n_master-1}, eta].
         mp_nvars = n_master + 1
@@ -5189,8 +5622,10 @@ class Plan:
         mp_c_obj.setElem(eta_pos, 1.0)  # minimize eta
 
         mp_A_static_rows = []
+        a_end = np.append(a_start[1:], len(a_index))
         for i in master_only_rows:
-            rowDic = {master_col_to_pos[j]: v for j, v in zip(self.A.Aind[i], self.A.Aval[i], strict=True)}
+            inds, vals = a_index[a_start[i] : a_end[i]], a_value[a_start[i] : a_end[i]]
+            rowDic = {master_col_to_pos[int(j)]: float(v) for j, v in zip(inds, vals, strict=True)}
             mp_A_static_rows.append((rowDic, self.A.lb[i], self.A.ub[i], self.A.tags[i]))
 
         def _build_master_A(cuts):
@@ -5291,7 +5726,7 @@ class Plan:
                 break
 
             # Benders optimality cut: eta >= alpha + beta^T z (tight at current z*).
-            beta = np.array([-sum(pi[r] * v for r, v in col_rows[col]) for col in master_cols])
+            beta = np.array([-np.dot(pi[col_rows[col][0]], col_rows[col][1]) for col in master_cols])
             alpha = sp_lp_obj - float(beta @ z_star)
             benders_cuts.append((alpha, beta))
 
@@ -6280,6 +6715,35 @@ class Plan:
         self._plotter.jupyter_renderer(fig)
         return None
 
+    def showTrajectoryBands(self, trajectories, field, tag="", value=None, percentiles=None, figure=False):
+        """
+        Fan chart of a per-year series across the scenarios of a stochastic run: the
+        median and the bands between symmetric percentiles, year by year.
+
+        trajectories is the "trajectories" TrajectoryStore of runStochasticSpending(),
+        or the dict it returned. field is one of its series, such as "balance". The
+        percentiles default to 5, 25, 50, 75 and 95.
+
+        The value parameter can be set to *nominal* or *today*, overriding
+        the default behavior of setDefaultPlots().
+        """
+        if isinstance(trajectories, dict):
+            trajectories = trajectories.get("trajectories")
+        if trajectories is None:
+            raise ValueError("No trajectories: run runStochasticSpending() with trajectories=True.")
+        value = self._checkValueType(value)
+        q = DEFAULT_PERCENTILES if percentiles is None else tuple(sorted(percentiles))
+        bands = trajectories.percentiles(field, q, value)
+        title = self._name + "\n" + TRAJECTORY_FIELDS[field][0] + f" across {trajectories.n_scenarios} scenarios"
+        if tag:
+            title += " - " + tag
+        fig = self._plotter.plot_trajectory_bands(trajectories.year_n, q, bands, value, title)
+        if figure:
+            return fig
+
+        self._plotter.jupyter_renderer(fig)
+        return None
+
     def saveWorkbook(self, overwrite=False, *, basename=None, saveToFile=True, with_config="no"):
         """
         Save instance in an Excel spreadsheet.
@@ -120,6 +120,20 @@ class PlotBackend(ABC):
         """Plot taxes over time. A_n: optional ACA costs. ST_n: optional state income tax."""
         pass
 
+    @abstractmethod
+    def plot_trajectory_bands(self, year_n, q, bands, value, title):
+        """Fan chart of a per-year series across scenarios.
+
+        Parameters
+        ----------
+        year_n : ndarray (N_n,) — calendar years
+        q : sequence of float — increasing percentiles, e.g. (5, 25, 50, 75, 95)
+        bands : ndarray (len(q), N_n) — the series at each percentile, year by year
+        value : str — "nominal" or "today" (labels the axis)
+        title : str
+        """
+        pass
+
     @abstractmethod
     def plot_spending_by_year(self, objective, start_years, values, n_d, year_n):
         """Bar chart of optimal spending or bequest by historical start year (today's dollars).
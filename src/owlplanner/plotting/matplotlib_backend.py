@@ -687,6 +687,35 @@ class MatplotlibBackend(PlotBackend):
 
         return fig
 
+    def plot_trajectory_bands(self, year_n, q, bands, value, title):
+        """Fan chart: bands between symmetric percentiles, darker toward the median."""
+        if value == "nominal":
+            yformat = r"\$k (nominal)"
+        else:
+            yformat = r"\$k (constant " + str(year_n[0]) + r")"
+        n_bands = len(q) // 2
+        fig, ax = plt.subplots()
+        for j in range(n_bands):
+            ax.fill_between(
+                year_n,
+                bands[j],
+                bands[-1 - j],
+                color="steelblue",
+                alpha=0.15 + 0.2 * j / max(n_bands - 1, 1),
+                linewidth=0,
+                label=f"{q[j]:g}th-{q[-1 - j]:g}th pctl",
+            )
+        if len(q) % 2:
+            ax.plot(year_n, bands[n_bands], color="navy", linewidth=1.5, label=f"{q[n_bands]:g}th pctl")
+
+        ax.legend(loc="upper left", fontsize=8, framealpha=0.3)
+        ax.set_title(title)
+        ax.set_ylabel(yformat)
+        ax.xaxis.set_major_locator(tk.MaxNLocator(integer=True))
+        ax.get_yaxis().set_major_formatter(tk.FuncFormatter(lambda x, p: format(int(x / 1000), ",")))
+
+        return fig
+
     def plot_spending_by_year(self, objective, start_years, values, n_d, year_n):
         """Bar chart of optimal spending or bequest by historical start year (today's dollars)."""
         thisyear = int(year_n[0])
@@ -263,6 +263,51 @@ class PlotlyBackend(PlotBackend):
 
         return fig
 
+    def plot_trajectory_bands(self, year_n, q, bands, value, title):
+        """Fan chart: bands between symmetric percentiles, darker toward the median."""
+        fig = go.Figure()
+        if value == "nominal":
+            y_title = "$k (nominal)"
+        else:
+            y_title = f"$k (constant {year_n[0]})"
+        x = list(year_n)
+        n_bands = len(q) // 2
+        for j in range(n_bands):
+            alpha = 0.15 + 0.2 * j / max(n_bands - 1, 1)
+            fig.add_trace(
+                go.Scatter(
+                    x=x + x[::-1],
+                    y=(bands[-1 - j] / 1000).tolist() + (bands[j] / 1000)[::-1].tolist(),
+                    fill="toself",
+                    fillcolor=f"rgba(70, 130, 180, {alpha:.2f})",
+                    line=dict(width=0),
+                    hoverinfo="skip",
+                    name=f"{q[j]:g}th-{q[-1 - j]:g}th pctl",
+                )
+            )
+        if len(q) % 2:
+            fig.add_trace(
+                go.Scatter(
+                    x=x,
+                    y=(bands[n_bands] / 1000).tolist(),
+                    name=f"{q[n_bands]:g}th pctl",
+                    line=dict(color="navy", width=2),
+                )
+            )
+
+        title = title.replace("\n", "<br>")
+        fig.update_layout(
+            title=title,
+            yaxis_title=y_title,
+            template=self.template,
+            showlegend=True,
+            legend={**_LEGEND_BOTTOM, "y": -0.4},
+            margin=dict(b=150),
+        )
+        fig.update_yaxes(tickformat=",.0f")
+
+        return fig
+
     def plot_rates(self, name, tau_kn, year_n, N_k, rate_method, rate_frm=None, rate_to=None, tag=""):
         """Plot rate values used over the time horizon."""
         fig = go.Figure()
@@ -101,13 +101,13 @@ def constrain_series_mean(series: np.ndarray, target_means: np.ndarray) -> np.nd
     Callers must apply return floors after this function (see apply_return_floors).
 
     Args:
-        series: (N, 4) array of annual returns in decimal.
+        series: (N, 4) array of annual returns in decimal, or (n_paths, N, 4), each path shifted on its own.
         target_means: (4,) array of target arithmetic means in decimal.
 
     Returns:
-        Shifted (N, 4) array with no floor applied.
+        Shifted array of the same shape with no floor applied.
     """
-    return series + (target_means - series.mean(axis=0))
+    return series + (target_means - series.mean(axis=-2, keepdims=True))
 
 
 def apply_return_floors(series: np.ndarray) -> np.ndarray:
@@ -119,13 +119,13 @@ def apply_return_floors(series: np.ndarray) -> np.ndarray:
     Must be called as the final step of every generate() method.
 
     Args:
-        series: (N, 4) array of annual returns in decimal.
+        series: (N, 4) array of annual returns in decimal, or a stack of them.
 
     Returns:
         Series with floors applied (in-place modification, same array returned).
     """
-    series[:, :3] = np.maximum(series[:, :3], -1.0)
-    series[:, 3] = np.maximum(series[:, 3], INFLATION_FLOOR)
+    series[..., :3] = np.maximum(series[..., :3], -1.0)
+    series[..., 3] = np.maximum(series[..., 3], INFLATION_FLOOR)
     return series
 
 
@@ -228,6 +228,8 @@ def generate_histogaussian_series(
     to: int,
     rng: np.random.Generator,
     mylog=None,
+    sampler=None,
+    n_paths=None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate Nx4 stochastic series from historical distribution params.
@@ -240,6 +242,8 @@ def generate_histogaussian_series(
     φ before fitting to correct for right-skew, then φ⁻¹ is applied to generated
     samples so outputs remain in actual inflation units.
 
+    With n_paths, draws that many series at once, stacked as (n_paths, N, 4).
+
     Returns:
         (rate_series, means, stdev, corr) - series in decimal, arithmetic params for metadata
     """
@@ -275,11 +279,12 @@ def generate_histogaussian_series(
 
     arith_means = data_t.mean(axis=0)
     covar = np.cov(data_t.T)
-    rate_series = _sampling.multivariate_normal(rng, arith_means, covar, size=N)
+    size = N if n_paths is None else (n_paths, N)
+    rate_series = _sampling.multivariate_normal(rng, arith_means, covar, size=size, sampler=sampler)
 
     # Invert inflation transform on generated samples
-    rate_series[:, 3] = inv_pwl_transform(rate_series[:, 3], k, slope_lo, slope_hi)
-    rate_series[:, 3] = np.maximum(rate_series[:, 3], INFLATION_FLOOR)
+    rate_series[..., 3] = inv_pwl_transform(rate_series[..., 3], k, slope_lo, slope_hi)
+    rate_series[..., 3] = np.maximum(rate_series[..., 3], INFLATION_FLOOR)
 
     return rate_series, orig_means, orig_stdev, orig_corr
 
@@ -290,6 +295,8 @@ def generate_lognormal_series(
     stdev_pct: list[float] | np.ndarray,
     corr=None,
     rng: np.random.Generator | None = None,
+    sampler=None,
+    n_paths=None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate Nx4 log-normal rate series from user-specified arithmetic mean and volatility.
@@ -303,6 +310,8 @@ def generate_lognormal_series(
         stdev_pct: Arithmetic standard deviations in percent (length 4)
         corr: Correlation matrix (4x4) or off-diagonal list (6). None = identity.
         rng: Random generator. If None, uses default_rng().
+        sampler: Optional _sampling.NormalSampler for variance-reduced draws.
+        n_paths: If given, draw that many series at once, stacked as (n_paths, N, 4).
 
     Returns:
         (rate_series, means, stdev, corr) - series in decimal, params for metadata
@@ -335,7 +344,8 @@ def generate_lognormal_series(
         corr_matrix = _build_corr_matrix(corr)
 
     Sigma_z = _build_covar(sigma_z, corr_matrix)
-    Z = _sampling.multivariate_normal(rng, mu_z, Sigma_z, size=N)
+    size = N if n_paths is None else (n_paths, N)
+    Z = _sampling.multivariate_normal(rng, mu_z, Sigma_z, size=size, sampler=sampler)
     rate_series = np.exp(Z) - 1.0
 
     return rate_series, means, stdev, corr_matrix
@@ -347,12 +357,15 @@ def generate_histolognormal_series(
     to: int,
     rng: np.random.Generator,
     mylog=None,
+    sampler=None,
+    n_paths=None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate Nx4 log-normal series fitted to a historical window.
 
     Computes log-returns from history, estimates log-space mean and covariance
     directly, then samples from a multivariate normal and exponentiates.
+    With n_paths, draws that many series at once, stacked as (n_paths, N, 4).
 
     Returns:
         (rate_series, means, stdev, corr) - series in decimal, arithmetic params for metadata
@@ -394,13 +407,14 @@ def generate_histolognormal_series(
     mu_z = lr_t.mean(axis=0)  # log-space mean (transformed inflation)
     Sigma_z = np.cov(lr_t.T)  # log-space covariance (transformed inflation)
 
-    Z = _sampling.multivariate_normal(rng, mu_z, Sigma_z, size=N)
+    size = N if n_paths is None else (n_paths, N)
+    Z = _sampling.multivariate_normal(rng, mu_z, Sigma_z, size=size, sampler=sampler)
 
     # Invert inflation transform in log-return space before exponentiating
-    Z[:, 3] = inv_pwl_transform(Z[:, 3], k, slope_lo, slope_hi)
+    Z[..., 3] = inv_pwl_transform(Z[..., 3], k, slope_lo, slope_hi)
 
     rate_series = np.exp(Z) - 1.0
-    rate_series[:, 3] = np.maximum(rate_series[:, 3], INFLATION_FLOOR)
+    rate_series[..., 3] = np.maximum(rate_series[..., 3], INFLATION_FLOOR)
 
     # Metadata derived from original (untransformed) log-returns for UI display
     lr_orig_cov = np.cov(lr.T)
@@ -427,6 +441,8 @@ def generate_stochastic_series(
     stdev_pct: list[float] | np.ndarray,
     corr=None,
     rng: np.random.Generator | None = None,
+    sampler=None,
+    n_paths=None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate Nx4 stochastic series from user-provided mean and volatility.
@@ -437,6 +453,8 @@ def generate_stochastic_series(
         stdev_pct: Standard deviations in percent (length 4)
         corr: Correlation matrix (4x4) or off-diagonal list (6). None = identity.
         rng: Random generator. If None, uses default_rng().
+        sampler: Optional _sampling.NormalSampler for variance-reduced draws.
+        n_paths: If given, draw that many series at once, stacked as (n_paths, N, 4).
 
     Returns:
         (rate_series, means, stdev, corr) - series in decimal, params for metadata
@@ -460,6 +478,7 @@ def generate_stochastic_series(
         corr_matrix = _build_corr_matrix(corr, Nk)
 
     covar = _build_covar(stdev, corr_matrix)
-    rate_series = _sampling.multivariate_normal(rng, means, covar, size=N)
+    size = N if n_paths is None else (n_paths, N)
+    rate_series = _sampling.multivariate_normal(rng, means, covar, size=size, sampler=sampler)
 
     return rate_series, means, stdev, corr_matrix
@@ -13,6 +13,10 @@ already do by hand. The one thing it cannot do is factorize a singular covarianc
 which SVD handles; a component estimated from very few observations can land there, so
 this falls back rather than failing, and says so.
 
+A NormalSampler replaces the independent standard normals behind those draws with
+variance-reduced ones: antithetic pairs, Latin hypercube or scrambled Sobol' points
+taken across successive paths (see the ``sampling`` option of the stochastic models).
+
 Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
 
 This program is free software: you can redistribute it and/or modify
@@ -32,15 +36,117 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import warnings
 
 import numpy as np
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+from owlplanner.rate_models.constants import SAMPLING_SCHEMES
+
+# Paths drawn from one Latin hypercube or Sobol' block. A power of 2, as the balance of
+# Sobol' points requires; stratification holds over each complete block.
+SAMPLING_BLOCK = 64
+
+# Optional parameter of the models that support variance-reduced sampling.
+SAMPLING_PARAMETER = {
+    "type": "str",
+    "default": "random",
+    "ui_excluded": True,
+    "description": (
+        "How the normal draws of successive scenarios are sampled: 'random' (independent), "
+        "'antithetic' (mirrored pairs), 'lhs' (Latin hypercube) or 'sobol' (scrambled Sobol' "
+        "quasi-random points). The last three lower the scenario-to-scenario noise of Monte Carlo estimates."
+    ),
+    "example": '"sobol"',
+}
+
+# Keeps uniforms away from 0 and 1, where the inverse normal CDF is infinite.
+_U_EPS = 1e-12
+
+
+class NormalSampler:
+    """
+    Standard normal draws for successive rate paths, with variance reduction across paths.
+
+    Each call to standard_normal() returns the draws of one path. With scheme "random"
+    they are plain pseudo-random draws from rng. "antithetic" returns each draw twice,
+    the second time negated, so that paths come in mirrored pairs. "lhs" and "sobol"
+    treat a path as a single point with one dimension per draw, and take successive paths
+    from a Latin hypercube or a scrambled Sobol' sequence of SAMPLING_BLOCK points,
+    randomized from rng when the block starts. A path of a different shape starts a new
+    block, and reset() starts the sequence over.
+    """
+
+    def __init__(self, scheme="random"):
+        if scheme not in SAMPLING_SCHEMES:
+            raise ValueError(f"Unknown sampling scheme '{scheme}'. Use one of {', '.join(SAMPLING_SCHEMES)}.")
+        self.scheme = scheme
+        self.reset()
 
+    def reset(self):
+        self._mirror = None
+        self._block = None
+        self._next = 0
 
-def multivariate_normal(rng, mean, cov, size=None):
+    def standard_normal(self, rng, shape):
+        """Return an array of the given shape holding the standard normals of the next path."""
+        shape = tuple(shape)
+        if self.scheme == "random":
+            return rng.standard_normal(shape)
+
+        if self.scheme == "antithetic":
+            if self._mirror is not None and self._mirror.shape == shape:
+                z, self._mirror = -self._mirror, None
+                return z
+            self._mirror = rng.standard_normal(shape)
+            return self._mirror.copy()
+
+        d = int(np.prod(shape))
+        if self._block is None or self._block.shape[1] != d or self._next == len(self._block):
+            if self.scheme == "lhs":
+                engine = qmc.LatinHypercube(d=d, rng=rng)
+            else:
+                engine = qmc.Sobol(d=d, scramble=True, rng=rng)
+            self._block = ndtri(np.clip(engine.random(SAMPLING_BLOCK), _U_EPS, 1.0 - _U_EPS))
+            self._next = 0
+        z = self._block[self._next].reshape(shape)
+        self._next += 1
+        return z
+
+    def paths(self, rng, n_paths, shape):
+        """Return the standard normals of the next n_paths paths, stacked along a leading axis."""
+        if self.scheme == "random":
+            return rng.standard_normal((n_paths, *shape))
+        return np.stack([self.standard_normal(rng, shape) for _ in range(n_paths)])
+
+
+def _factor(cov):
+    """Return L with L @ L.T == cov: the Cholesky factor, or a symmetric root if cov is singular."""
+    try:
+        return np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:
+        w, v = np.linalg.eigh(cov)
+        return v * np.sqrt(np.maximum(w, 0.0))
+
+
+def multivariate_normal(rng, mean, cov, size=None, sampler=None):
     """Draw correlated normals reproducibly across platforms.
 
     Drop-in for ``rng.multivariate_normal(mean, cov, size)``. Uses the Cholesky factor,
     which is unique, and falls back to the default factorization with a warning when the
     covariance is not positive definite.
+
+    Given a NormalSampler with a scheme other than "random", the standard normals come
+    from the sampler and are correlated through the same factor; ``size`` must then be
+    the number of rows of one path, or (n_paths, rows) for a stack of paths.
     """
+    if sampler is not None and sampler.scheme != "random":
+        mean = np.asarray(mean, dtype=float)
+        if np.ndim(size) == 0:
+            z = sampler.standard_normal(rng, (size, len(mean)))
+        else:
+            n_paths, rows = size
+            z = sampler.paths(rng, n_paths, (rows, len(mean)))
+        return mean + z @ _factor(np.asarray(cov, dtype=float)).T
+
     try:
         return rng.multivariate_normal(mean, cov, size=size, method="cholesky")
     except np.linalg.LinAlgError:
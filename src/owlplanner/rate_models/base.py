@@ -17,6 +17,8 @@ from abc import ABC, abstractmethod
 from typing import Any, ClassVar, Optional
 import numpy as np
 
+from owlplanner.rate_models._sampling import NormalSampler
+
 
 class BaseRateModel(ABC):
     """
@@ -50,8 +52,10 @@ class BaseRateModel(ABC):
     more_info: Optional[str] = None
     deterministic = False
     constant = False
+    # generate_batch() returns the paths that successive generate() calls would.
+    batch_matches_generate = True
 
-    _global_hints: ClassVar[frozenset[str]] = frozenset({"constrain_mean"})
+    _global_hints: ClassVar[frozenset[str]] = frozenset({"constrain_mean", "sampling"})
 
     # Parameter schema
     required_parameters: dict[str, Any] = {}
@@ -69,6 +73,9 @@ class BaseRateModel(ABC):
         # Normalize and validate parameters
         self.params = self._validate_and_normalize_parameters(self.config)
 
+        # Standard normals of generate(); variance-reduced for models declaring "sampling".
+        self._sampler = NormalSampler(self.params.get("sampling") or "random")
+
     #######################################################################
     # Parameter Validation (Centralized)
     #######################################################################
@@ -126,6 +133,15 @@ class BaseRateModel(ABC):
         """
         return self.params.get(name, default)
 
+    def reset_sampling(self):
+        """
+        Start the variance-reduced sequence of paths over, so that a Monte Carlo run
+        draws its antithetic pairs or quasi-random blocks from the first path.
+        """
+        sampler = getattr(self, "_sampler", None)
+        if sampler is not None:
+            sampler.reset()
+
     #######################################################################
     # Required Interface
     #######################################################################
@@ -162,6 +178,24 @@ class BaseRateModel(ABC):
         """
         pass
 
+    def generate_batch(self, N, n_paths) -> np.ndarray:
+        """
+        Generate n_paths independent (N, 4) rate series, stacked as an (n_paths, N, 4)
+        array in **decimal** format.
+
+        The built-in models override this to advance all paths together, one time step
+        at a time. This default calls generate() once per path, so plugin models get
+        the method without writing anything; a deterministic model is called once and
+        its series repeated.
+        """
+        if self.deterministic:
+            series = np.asarray(self.generate(N), dtype=float)
+            return np.repeat(series[np.newaxis], n_paths, axis=0)
+        out = np.empty((n_paths, N, 4))
+        for m in range(n_paths):
+            out[m] = self.generate(N)
+        return out
+
     #######################################################################
     # TOML Serialization Interface
     #######################################################################
@@ -10,6 +10,7 @@ import numpy as np
 
 from owlplanner.rate_models.base import BaseRateModel
 from owlplanner.rate_models import _builtin_impl as impl
+from owlplanner.rate_models._sampling import SAMPLING_PARAMETER
 from owlplanner.rate_models._builtin_impl import _validate_historical_range
 
 
@@ -224,7 +225,8 @@ class GaussianRateModel(BaseRateModel):
                 "Matrix or upper-triangle off-diagonals. Standard in finance/statistics."
             ),
             "example": "[0.2, 0.1, 0.0, 0.3, 0.1, 0.2]",
-        }
+        },
+        "sampling": SAMPLING_PARAMETER,
     }
 
     @classmethod
@@ -246,6 +248,8 @@ class GaussianRateModel(BaseRateModel):
             corr = np.array(params["corr"])
             Nk = corr.shape[0]
             result["correlations"] = [float(corr[k1, k2]) for k1 in range(Nk) for k2 in range(k1 + 1, Nk)]
+        if params.get("sampling") is not None:
+            result["sampling"] = params["sampling"]
         return result
 
     def __init__(self, config, seed=None, logger=None):
@@ -261,12 +265,20 @@ class GaussianRateModel(BaseRateModel):
             self.params["corr"] = corr_matrix.copy()
 
     def generate(self, N):
+        return self._draw(N)
+
+    def generate_batch(self, N, n_paths):
+        return self._draw(N, n_paths)
+
+    def _draw(self, N, n_paths=None):
         series, means, stdev_arr, corr_matrix = impl.generate_stochastic_series(
             N,
             self._values,
             self._stdev,
             corr=self._corr,
             rng=self._rng,
+            sampler=self._sampler,
+            n_paths=n_paths,
         )
         self.params["corr"] = corr_matrix.copy()
         return series
@@ -304,7 +316,8 @@ class LognormalRateModel(BaseRateModel):
                 "Matrix or upper-triangle off-diagonals. Standard in finance/statistics."
             ),
             "example": "[0.2, 0.1, 0.0, 0.3, 0.1, 0.2]",
-        }
+        },
+        "sampling": SAMPLING_PARAMETER,
     }
 
     @classmethod
@@ -324,6 +337,8 @@ class LognormalRateModel(BaseRateModel):
             corr = np.array(params["corr"])
             Nk = corr.shape[0]
             result["correlations"] = [float(corr[k1, k2]) for k1 in range(Nk) for k2 in range(k1 + 1, Nk)]
+        if params.get("sampling") is not None:
+            result["sampling"] = params["sampling"]
         return result
 
     def __init__(self, config, seed=None, logger=None):
@@ -339,12 +354,20 @@ class LognormalRateModel(BaseRateModel):
             self.params["corr"] = corr_matrix.copy()
 
     def generate(self, N):
+        return self._draw(N)
+
+    def generate_batch(self, N, n_paths):
+        return self._draw(N, n_paths)
+
+    def _draw(self, N, n_paths=None):
         series, means, stdev_arr, corr_matrix = impl.generate_lognormal_series(
             N,
             self._values,
             self._stdev,
             corr=self._corr,
             rng=self._rng,
+            sampler=self._sampler,
+            n_paths=n_paths,
         )
         self.params["corr"] = corr_matrix.copy()
         return series
@@ -382,6 +405,7 @@ class HistolognormalRateModel(BaseRateModel):
             "default": False,
             "example": "true",
         },
+        "sampling": SAMPLING_PARAMETER,
     }
 
     def __init__(self, config, seed=None, logger=None):
@@ -399,8 +423,14 @@ class HistolognormalRateModel(BaseRateModel):
             self._hist_target_means = impl._historical_arith_means(self._frm, self._to)
 
     def generate(self, N):
+        return self._draw(N)
+
+    def generate_batch(self, N, n_paths):
+        return self._draw(N, n_paths)
+
+    def _draw(self, N, n_paths=None):
         series, means, stdev_arr, corr_arr = impl.generate_histolognormal_series(
-            N, self._frm, self._to, self._rng, self.logger
+            N, self._frm, self._to, self._rng, self.logger, self._sampler, n_paths
         )
         self.params["values"] = means.copy()
         self.params["stdev"] = stdev_arr.copy()
@@ -440,6 +470,7 @@ class HistogaussianRateModel(BaseRateModel):
             "default": False,
             "example": "true",
         },
+        "sampling": SAMPLING_PARAMETER,
     }
 
     def __init__(self, config, seed=None, logger=None):
@@ -457,8 +488,14 @@ class HistogaussianRateModel(BaseRateModel):
             self._hist_target_means = impl._historical_arith_means(self._frm, self._to)
 
     def generate(self, N):
+        return self._draw(N)
+
+    def generate_batch(self, N, n_paths):
+        return self._draw(N, n_paths)
+
+    def _draw(self, N, n_paths=None):
         series, means, stdev_arr, corr_arr = impl.generate_histogaussian_series(
-            N, self._frm, self._to, self._rng, self.logger
+            N, self._frm, self._to, self._rng, self.logger, self._sampler, n_paths
         )
         self.params["values"] = means.copy()
         self.params["stdev"] = stdev_arr.copy()
@@ -108,6 +108,26 @@ CONSTRAIN_MEAN_METHODS = (
     "vector_ar",
 )
 
+# Variance-reduction schemes for the normal draws of stochastic models (sampling option).
+SAMPLING_SCHEMES = (
+    "random",
+    "antithetic",
+    "lhs",
+    "sobol",
+)
+
+# Methods that support the sampling option (models driven by correlated normal draws).
+SAMPLING_METHODS = (
+    "gaussian",
+    "lognormal",
+    "historical_gaussian",
+    "historical_lognormal",
+    "historical_copula",
+    "garch_dcc",
+    "hmm",
+    "vector_ar",
+)
+
 # Methods the UI treats as "varying" type (alphabetically ordered for selector).
 VARYING_TYPE_UI = (
     "garch_dcc",
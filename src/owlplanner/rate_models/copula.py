@@ -53,6 +53,8 @@ def generate_histocopula_series(
     to: int,
     rng: np.random.Generator,
     mylog=None,
+    sampler=None,
+    n_paths=None,
 ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
     Generate Nx4 series using a Gaussian copula fitted to the historical window.
@@ -72,7 +74,8 @@ def generate_histocopula_series(
         6. Floor inflation at INFLATION_FLOOR.
 
     Generated values are bounded to the historical [min, max] for each asset
-    (no parametric extrapolation beyond observed data).
+    (no parametric extrapolation beyond observed data). With n_paths, draws that
+    many series at once, stacked as (n_paths, N, 4).
 
     Returns:
         (rate_series, means, stdev, corr) - series in decimal, historical stats for metadata
@@ -117,22 +120,23 @@ def generate_histocopula_series(
         mylog.vprint(f"historical_copula: Rho fitted on {T} years ({frm}-{to}).")
 
     # Step 4: sample from multivariate normal with the copula correlation.
-    Z_samples = _sampling.multivariate_normal(rng, np.zeros(K), Rho, size=N)  # (N, K)
+    size = N if n_paths is None else (n_paths, N)
+    Z_samples = _sampling.multivariate_normal(rng, np.zeros(K), Rho, size=size, sampler=sampler)  # (..., N, K)
 
     # Step 5a: Φ(Z) → U[0,1].
-    U_samples = norm.cdf(Z_samples)  # (N, K)
+    U_samples = norm.cdf(Z_samples)  # (..., N, K)
 
     # Step 5b: empirical quantile back-transform (linear interpolation over sorted history).
     # u_grid[i] = (i + 0.5) / T matches the forward transform.
     # np.interp clamps U outside [u_grid[0], u_grid[-1]] to the historical min/max,
     # preventing extrapolation beyond observed data.
     u_grid = (np.arange(T) + 0.5) / T
-    rate_series = np.zeros((N, K))
+    rate_series = np.zeros(U_samples.shape)
     for k in range(K):
-        rate_series[:, k] = np.interp(U_samples[:, k], u_grid, np.sort(data[:, k]))
+        rate_series[..., k] = np.interp(U_samples[..., k], u_grid, np.sort(data[:, k]))
 
     # Step 6: apply inflation floor to avoid Great Depression tail artefacts.
-    rate_series[:, 3] = np.maximum(rate_series[:, 3], INFLATION_FLOOR)
+    rate_series[..., 3] = np.maximum(rate_series[..., 3], INFLATION_FLOOR)
 
     # Metadata: report historical arithmetic statistics for UI display.
     means = data.mean(axis=0)
@@ -176,6 +180,7 @@ class HistoCopulaRateModel(BaseRateModel):
             "default": False,
             "example": "true",
         },
+        "sampling": _sampling.SAMPLING_PARAMETER,
     }
 
     def __init__(self, config, seed=None, logger=None):
@@ -193,7 +198,15 @@ class HistoCopulaRateModel(BaseRateModel):
             self._hist_target_means = _historical_arith_means(self._frm, self._to)
 
     def generate(self, N):
-        series, means, stdev_arr, corr_arr = generate_histocopula_series(N, self._frm, self._to, self._rng, self.logger)
+        return self._draw(N)
+
+    def generate_batch(self, N, n_paths):
+        return self._draw(N, n_paths)
+
+    def _draw(self, N, n_paths=None):
+        series, means, stdev_arr, corr_arr = generate_histocopula_series(
+            N, self._frm, self._to, self._rng, self.logger, self._sampler, n_paths
+        )
         self.params["values"] = means.copy()
         self.params["stdev"] = stdev_arr.copy()
         self.params["corr"] = corr_arr.copy()
@@ -0,0 +1,131 @@
+"""
+Memoized fits of the rate models to the historical data.
+
+Fitting a model to a historical window -- Baum-Welch for ``hmm``, EM for ``gmm``, the
+GARCH and DCC likelihoods of ``garch_dcc``, the OLS of ``vector_ar``, the inflation
+transform of every model that uses one -- gives the same answer every time for the same
+window, hyperparameters and data. Yet setRates() builds a new model, and refits, each
+time it is called: on every rerender of the UI and for every plan an MCP request builds.
+
+cached_fit() keeps each fit in memory, keyed by the model, the window, the
+hyperparameters, a hash of ``data/rates.csv`` and the package version. Given a
+directory, through set_fit_cache_dir() or the ``OWL_FIT_CACHE_DIR`` environment
+variable, it also writes each fit there, so that fits survive a restart. A new
+``rates.csv`` changes the hash, and an upgrade the version, so fits of old data or old
+code are never read back. Cache files are pickles: point the directory only at a
+location you trust.
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import copy
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+from owlplanner.version import __version__
+
+FIT_CACHE_ENV = "OWL_FIT_CACHE_DIR"
+
+_memory = {}
+_lock = threading.Lock()
+_cache_dir = os.environ.get(FIT_CACHE_ENV) or None
+
+
+def set_fit_cache_dir(path):
+    """Keep fits in directory path across restarts, or only in memory if path is None."""
+    global _cache_dir
+    if path is not None:
+        os.makedirs(path, exist_ok=True)
+    _cache_dir = None if path is None else str(path)
+
+
+def get_fit_cache_dir():
+    """Return the directory fits are written to, or None."""
+    return _cache_dir
+
+
+def clear_fit_cache():
+    """Forget the fits held in memory. Files in the cache directory are left alone."""
+    with _lock:
+        _memory.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def rates_data_hash():
+    """Hash of the historical data file every fit is computed from."""
+    where = os.path.dirname(sys.modules["owlplanner"].__file__)
+    with open(os.path.join(where, "data/rates.csv"), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def cached_fit(name, key, fit):
+    """
+    Return fit(), computed once per (name, key) and the current historical data.
+
+    key is a tuple of the window and hyperparameters that determine the fit; its repr
+    identifies the fit, so it should hold plain numbers, strings, booleans or None.
+    The value returned by fit() must be picklable. Callers get a deep copy, so they
+    may modify it freely.
+    """
+    ident = repr((name, key, rates_data_hash(), __version__))
+    with _lock:
+        value = _memory.get(ident)
+    if value is None:
+        value = _read(ident)
+        if value is None:
+            value = fit()
+            _write(ident, value)
+        with _lock:
+            _memory[ident] = value
+    return copy.deepcopy(value)
+
+
+def _path(ident):
+    return os.path.join(_cache_dir, hashlib.sha256(ident.encode()).hexdigest()[:32] + ".pkl")
+
+
+def _read(ident):
+    """Return the fit stored for ident in the cache directory, or None."""
+    if _cache_dir is None:
+        return None
+    try:
+        with open(_path(ident), "rb") as f:
+            stored_ident, value = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+        return None
+    return value if stored_ident == ident else None
+
+
+def _write(ident, value):
+    """Store a fit in the cache directory. A fit that cannot be written is simply not kept."""
+    if _cache_dir is None:
+        return
+    try:
+        fd, tmp = tempfile.mkstemp(dir=_cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((ident, value), f)
+        os.replace(tmp, _path(ident))
+    except (OSError, pickle.PicklingError):
+        if os.path.exists(tmp):
+            os.remove(tmp)
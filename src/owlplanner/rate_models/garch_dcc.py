@@ -35,7 +35,9 @@ from scipy.optimize import minimize
 from numpy.linalg import cholesky, eigvalsh, LinAlgError
 
 from owlplanner.rate_models.base import BaseRateModel
+from owlplanner.rate_models._sampling import SAMPLING_PARAMETER
 from owlplanner.rate_models.constants import GARCH_DCC_MIN_OBSERVATIONS
+from owlplanner.rate_models.fit_cache import cached_fit
 from owlplanner.rate_models.inflation_transform import fit_inflation_transform, inv_pwl_transform, pwl_transform
 from owlplanner.rate_models._builtin_impl import (
     _historical_arith_means,
@@ -52,11 +54,11 @@ from owlplanner.rates import FROM, TO
 
 
 def _normalize_Q(Q):
-    """Convert a quasi-correlation matrix Q to a proper correlation matrix R."""
-    d = np.sqrt(np.maximum(np.diag(Q), 1e-10))
-    R = Q / np.outer(d, d)
+    """Convert a quasi-correlation matrix Q, or each of a stack of them, to a proper correlation matrix R."""
+    d = np.sqrt(np.maximum(np.diagonal(Q, axis1=-2, axis2=-1), 1e-10))
+    R = Q / (d[..., :, np.newaxis] * d[..., np.newaxis, :])
     # Enforce exact symmetry
-    R = (R + R.T) / 2.0
+    R = (R + np.swapaxes(R, -1, -2)) / 2.0
     return R
 
 
@@ -76,6 +78,31 @@ def _pd_cholesky(M):
         return np.eye(M.shape[0])
 
 
+def _pd_cholesky_stack(M):
+    """_pd_cholesky() of each matrix of a (P, K, K) stack, factorized together."""
+    min_eig = eigvalsh(M)[:, 0]
+    shift = np.where(min_eig <= 1e-10, -min_eig + 1e-8, 0.0)
+    M = M + shift[:, np.newaxis, np.newaxis] * np.eye(M.shape[-1])
+    try:
+        return cholesky(M)
+    except LinAlgError:
+        return np.stack([_pd_cholesky(m) for m in M])
+
+
+# Attributes set by GARCHDCCRateModel._fit(), which is all a cached fit needs to restore.
+_FITTED_ATTRIBUTES = (
+    "_garch_omega",
+    "_garch_alpha",
+    "_garch_beta",
+    "_sigma2_0",
+    "_Q_bar",
+    "_dcc_a",
+    "_dcc_b",
+    "_Q_0",
+    "_chol_R_0",
+)
+
+
 ###########################################################################
 
 
@@ -117,6 +144,7 @@ class GARCHDCCRateModel(BaseRateModel):
             "default": False,
             "example": "true",
         },
+        "sampling": SAMPLING_PARAMETER,
     }
 
     #######################################################################
@@ -156,7 +184,8 @@ class GARCHDCCRateModel(BaseRateModel):
         data[:, 3] = pwl_transform(data[:, 3], k, slope_lo, slope_hi)
 
         self._mu = data.mean(axis=0)
-        self._fit(data)
+        fitted = cached_fit(self.model_name, (self.frm, self.to), lambda: self._fitted_state(data))
+        self.__dict__.update(fitted)
 
         self._constrain_mean = bool(self.get_param("constrain_mean"))
         if self._constrain_mean:
@@ -169,6 +198,11 @@ class GARCHDCCRateModel(BaseRateModel):
     # Fitting orchestration
     #######################################################################
 
+    def _fitted_state(self, data):
+        """Run _fit() and return the attributes it sets, as cached by cached_fit()."""
+        self._fit(data)
+        return {name: getattr(self, name) for name in _FITTED_ATTRIBUTES}
+
     def _fit(self, data):
         """
         Two-step DCC-GARCH(1,1) fitting.
@@ -350,7 +384,21 @@ class GARCHDCCRateModel(BaseRateModel):
         -------
         np.ndarray, shape (N, 4), decimal-scale annual returns.
         """
-        rng = self._rng
+        innovations = self._sampler.standard_normal(self._rng, (N, 4))
+        return self._simulate(innovations[np.newaxis])[0]
+
+    def generate_batch(self, N, n_paths):
+        """
+        Simulate n_paths independent N-year paths, advancing all paths together.
+
+        Returns
+        -------
+        np.ndarray, shape (n_paths, N, 4), decimal-scale annual returns.
+        """
+        return self._simulate(self._sampler.paths(self._rng, n_paths, (N, 4)))
+
+    def _simulate(self, innovations):
+        """Run the GARCH and DCC recursions on standard normals of shape (P, N, 4)."""
         omega = self._garch_omega
         alpha = self._garch_alpha
         beta = self._garch_beta
@@ -358,29 +406,30 @@ class GARCHDCCRateModel(BaseRateModel):
         b = self._dcc_b
         Q_bar = self._Q_bar
 
-        sigma2 = self._sigma2_0.copy()
-        Q = self._Q_0.copy()
-        chol_R = self._chol_R_0.copy()
+        P, N, _ = innovations.shape
+        sigma2 = np.tile(self._sigma2_0, (P, 1))
+        Q = np.tile(self._Q_0, (P, 1, 1))
+        chol_R = np.tile(self._chol_R_0, (P, 1, 1))
 
-        out = np.empty((N, 4))
+        out = np.empty((P, N, 4))
 
         for t in range(N):
-            z = chol_R @ rng.standard_normal(4)
+            z = np.einsum("pij,pj->pi", chol_R, innovations[:, t])
             eps = np.sqrt(sigma2) * z
-            out[t] = self._mu + eps
+            out[:, t] = self._mu + eps
 
             # GARCH update
             sigma2 = omega + alpha * eps**2 + beta * sigma2
             sigma2 = np.maximum(sigma2, 1e-10)
 
             # DCC update
-            Q = (1 - a - b) * Q_bar + a * np.outer(z, z) + b * Q
-            Q = (Q + Q.T) / 2.0
-            chol_R = _pd_cholesky(_normalize_Q(Q))
+            Q = (1 - a - b) * Q_bar + a * z[:, :, np.newaxis] * z[:, np.newaxis, :] + b * Q
+            Q = (Q + np.swapaxes(Q, 1, 2)) / 2.0
+            chol_R = _pd_cholesky_stack(_normalize_Q(Q))
 
         # Invert inflation transform to recover actual inflation values
         k, slope_lo, slope_hi = self._infl_transform
-        out[:, 3] = inv_pwl_transform(out[:, 3], k, slope_lo, slope_hi)
+        out[..., 3] = inv_pwl_transform(out[..., 3], k, slope_lo, slope_hi)
 
         if self._constrain_mean:
             out = constrain_series_mean(out, self._hist_target_means)
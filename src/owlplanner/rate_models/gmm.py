@@ -32,6 +32,7 @@ from scipy.stats import multivariate_normal
 
 from owlplanner.rate_models.base import BaseRateModel
 from owlplanner.rate_models._builtin_impl import apply_return_floors, constrain_series_mean, load_historical_slice
+from owlplanner.rate_models.fit_cache import cached_fit
 from owlplanner.rates import FROM, TO
 
 _MAX_ITER = 200
@@ -50,6 +51,8 @@ class GMMRateModel(BaseRateModel):
 
     deterministic = False
     constant = False
+    # generate_batch() draws the same distribution in another order than generate().
+    batch_matches_generate = False
 
     required_parameters = {}
 
@@ -113,7 +116,16 @@ class GMMRateModel(BaseRateModel):
                 f"Use a wider year range (need at least {self.n_components} years) "
                 f"or reduce n_components."
             )
-        self._weights, self._means, self._covs = self._fit_em(self._historical_data)
+        # EM starts from means drawn from the seeded generator, so the seed is part of the key,
+        # and a cached fit restores the generator to where fitting would have left it.
+        fitted = cached_fit(
+            self.model_name,
+            (self.frm, self.to, self.n_components, seed),
+            lambda: (*self._fit_em(self._historical_data), self._rng.bit_generator.state),
+        )
+        self._weights, self._means, self._covs, rng_state = fitted
+        if seed is not None:
+            self._rng.bit_generator.state = rng_state
         self._constrain_mean = bool(self.get_param("constrain_mean"))
         if self._constrain_mean:
             self._hist_target_means = self._historical_data.mean(axis=0)
@@ -182,9 +194,17 @@ class GMMRateModel(BaseRateModel):
 
     def generate(self, N: int) -> np.ndarray:
         """Draw N joint annual return vectors from the fitted GMM."""
-        k_idx = self._rng.choice(self.n_components, size=N, p=self._weights)
+        return self._draw((N,))
+
+    def generate_batch(self, N: int, n_paths: int) -> np.ndarray:
+        """Draw n_paths series of N joint annual return vectors, stacked as (n_paths, N, D)."""
+        return self._draw((n_paths, N))
+
+    def _draw(self, shape):
+        """Draw one component per year for every entry of shape, then each component's years at once."""
+        k_idx = self._rng.choice(self.n_components, size=shape, p=self._weights)
         D = self._historical_data.shape[1]
-        out = np.empty((N, D))
+        out = np.empty(shape + (D,))
         for k in range(self.n_components):
             mask = k_idx == k
             n_k = int(mask.sum())
@@ -44,6 +44,8 @@ class BootstrapSORRateModel(BaseRateModel):
 
     deterministic = False
     constant = False
+    # generate_batch() draws the same distribution in another order than generate().
+    batch_matches_generate = False
 
     required_parameters = {
         "frm": {
@@ -147,10 +149,10 @@ class BootstrapSORRateModel(BaseRateModel):
     # Sampling Utilities
     #######################################################################
 
-    def _choice(self, n, probs):
+    def _choice(self, n, probs, size=None):
         if probs is None:
-            return self._rng.integers(0, n)
-        return self._rng.choice(n, p=probs)
+            return self._rng.integers(0, n, size=size)
+        return self._rng.choice(n, size=size, p=probs)
 
     #######################################################################
     # Representative Sample
@@ -186,6 +188,28 @@ class BootstrapSORRateModel(BaseRateModel):
         out[:, 3] = np.maximum(out[:, 3], INFLATION_FLOOR)
         return out
 
+    def generate_batch(self, N, n_paths):
+        """
+        Draw n_paths bootstrap series of N years, stacked as (n_paths, N, 4).
+
+        Indices into the historical pool are drawn for all paths at once: every block
+        start of every path together, or, for the stationary bootstrap, one restart
+        decision per path and year.
+        """
+        T = len(self._historical_data)
+        if self.bootstrap_type == "iid":
+            idx = self._choice(T, self._base_weights, size=(n_paths, N))
+        elif self.bootstrap_type in ("block", "circular"):
+            idx = self._block_indices(N, n_paths, circular=self.bootstrap_type == "circular")
+        elif self.bootstrap_type == "stationary":
+            idx = self._stationary_indices(N, n_paths)
+        else:
+            raise ValueError(f"Unknown bootstrap_type '{self.bootstrap_type}'.")
+
+        out = self._historical_data[idx]
+        out[..., 3] = np.maximum(out[..., 3], INFLATION_FLOOR)
+        return out
+
     #######################################################################
     # IID Bootstrap
     #######################################################################
@@ -252,6 +276,29 @@ class BootstrapSORRateModel(BaseRateModel):
         series = np.vstack(blocks)
         return series[:N]
 
+    def _block_indices(self, N, n_paths, circular):
+        """(n_paths, N) pool indices made of consecutive blocks, as _block_bootstrap() and _circular_bootstrap()."""
+        T = len(self._historical_data)
+        n_blocks = -(-N // self.block_size)
+
+        if circular:
+            starts = self._choice(T, self._base_weights, size=(n_paths, n_blocks))
+        else:
+            max_start = T - self.block_size + 1
+            if max_start <= 0:
+                raise ValueError("block_size larger than available historical window.")
+            if self._base_weights is None:
+                start_probs = None
+            else:
+                start_probs = np.clip(self._base_weights[:max_start], 0.0, None)
+                start_probs /= start_probs.sum()
+            starts = self._choice(max_start, start_probs, size=(n_paths, n_blocks))
+
+        idx = starts[:, :, np.newaxis] + np.arange(self.block_size)
+        if circular:
+            idx %= T
+        return idx.reshape(n_paths, -1)[:, :N]
+
     #######################################################################
     # Stationary Bootstrap (Politis & Romano)
     #######################################################################
@@ -273,3 +320,19 @@ class BootstrapSORRateModel(BaseRateModel):
                 idx = (idx + 1) % T
 
         return series
+
+    def _stationary_indices(self, N, n_paths):
+        """(n_paths, N) pool indices of stationary-bootstrap paths, all paths stepped together."""
+        T = len(self._historical_data)
+        p = 1.0 / self.block_size
+
+        idx = np.empty((n_paths, N), dtype=int)
+        if N == 0:
+            return idx
+        idx[:, 0] = self._choice(T, self._base_weights, size=n_paths)
+        for t in range(1, N):
+            restart = self._rng.random(n_paths) < p
+            fresh = self._choice(T, self._base_weights, size=n_paths)
+            idx[:, t] = np.where(restart, fresh, (idx[:, t - 1] + 1) % T)
+
+        return idx
@@ -32,6 +32,7 @@ from scipy.stats import multivariate_normal
 
 from owlplanner.rate_models.base import BaseRateModel
 from owlplanner.rate_models._builtin_impl import apply_return_floors, constrain_series_mean, load_historical_slice
+from owlplanner.rate_models.fit_cache import cached_fit
 from owlplanner.rates import FROM, TO
 
 _MAX_ITER = 200
@@ -51,6 +52,8 @@ class HMMRateModel(BaseRateModel):
 
     deterministic = False
     constant = False
+    # generate_batch() draws the same distribution in another order than generate().
+    batch_matches_generate = False
 
     required_parameters = {}
 
@@ -95,6 +98,7 @@ class HMMRateModel(BaseRateModel):
             "default": False,
             "example": "true",
         },
+        "sampling": _sampling.SAMPLING_PARAMETER,
     }
 
     #######################################################################
@@ -136,7 +140,16 @@ class HMMRateModel(BaseRateModel):
                 f"Use a wider year range (need at least {self.n_components} years) "
                 f"or reduce n_components."
             )
-        self._pi, self._trans, self._means, self._covs = self._fit_baum_welch(self._historical_data)
+        # Baum-Welch starts from means drawn from the seeded generator, so the seed is part of
+        # the key, and a cached fit restores the generator to where fitting would have left it.
+        fitted = cached_fit(
+            self.model_name,
+            (self.frm, self.to, self.n_components, self.reg_trans, seed),
+            lambda: (*self._fit_baum_welch(self._historical_data), self._rng.bit_generator.state),
+        )
+        self._pi, self._trans, self._means, self._covs, rng_state = fitted
+        if seed is not None:
+            self._rng.bit_generator.state = rng_state
         self._stationary_pi = self._stationary_dist()
         self._constrain_mean = bool(self.get_param("constrain_mean"))
         if self._constrain_mean:
@@ -291,9 +304,51 @@ class HMMRateModel(BaseRateModel):
             k = int(self._rng.choice(K, p=self._stationary_pi))
 
         out = np.empty((N, D))
+        if self._sampler.scheme == "random":
+            # Emissions and regimes interleaved year by year: the stream of seeded series.
+            for t in range(N):
+                out[t] = _sampling.multivariate_normal(self._rng, self._means[k], self._covs[k])
+                k = int(self._rng.choice(K, p=self._trans[k]))
+        else:
+            # The emission normals of the whole path come first, so that the sampling
+            # scheme treats the path as one point; regimes are chained from the generator.
+            z = self._sampler.standard_normal(self._rng, (N, D))
+            factors = [_sampling._factor(c) for c in self._covs]
+            for t in range(N):
+                out[t] = self._means[k] + factors[k] @ z[t]
+                k = int(self._rng.choice(K, p=self._trans[k]))
+
+        if self._constrain_mean:
+            out = constrain_series_mean(out, self._hist_target_means)
+        return apply_return_floors(out)
+
+    def generate_batch(self, N: int, n_paths: int) -> np.ndarray:
+        """
+        Simulate n_paths independent chains of N years, stacked as (n_paths, N, D).
+
+        All chains advance together: each year draws the emissions of every chain from
+        its current regime's factor, then the next regimes by inverting the cumulative
+        transition rows on one uniform per chain. With a sampling scheme other than
+        "random", the emission normals of every chain are drawn first, from the sampler.
+        """
+        K = self.n_components
+        D = self._historical_data.shape[1]
+        rng = self._rng
+
+        if self.init_regime is not None:
+            k = np.full(n_paths, self.init_regime)
+        else:
+            k = rng.choice(K, size=n_paths, p=self._stationary_pi)
+
+        factors = np.stack([_sampling._factor(c) for c in self._covs])  # (K, D, D)
+        cum_trans = np.cumsum(self._trans, axis=1)
+        z = None if self._sampler.scheme == "random" else self._sampler.paths(rng, n_paths, (N, D))
+        out = np.empty((n_paths, N, D))
         for t in range(N):
-            out[t] = _sampling.multivariate_normal(self._rng, self._means[k], self._covs[k])
-            k = int(self._rng.choice(K, p=self._trans[k]))
+            z_t = rng.standard_normal((n_paths, D)) if z is None else z[:, t]
+            out[:, t] = self._means[k] + np.einsum("pij,pj->pi", factors[k], z_t)
+            u = rng.random(n_paths)
+            k = np.minimum((u[:, np.newaxis] >= cum_trans[k]).sum(axis=1), K - 1)
 
         if self._constrain_mean:
             out = constrain_series_mean(out, self._hist_target_means)
@@ -31,10 +31,14 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import hashlib
+
 import numpy as np
 from scipy.optimize import minimize
 from scipy.stats import skew
 
+from owlplanner.rate_models.fit_cache import cached_fit
+
 
 def fit_inflation_transform(z: np.ndarray) -> tuple[float, float, float]:
     """
@@ -60,6 +64,12 @@ def fit_inflation_transform(z: np.ndarray) -> tuple[float, float, float]:
         Slope above the median.
     """
     z = np.asarray(z, dtype=float)
+    key = (hashlib.sha256(np.ascontiguousarray(z).tobytes()).hexdigest(),)
+    return cached_fit("inflation_transform", key, lambda: _fit_inflation_transform(z))
+
+
+def _fit_inflation_transform(z: np.ndarray) -> tuple[float, float, float]:
+    """Unmemoized fit_inflation_transform()."""
     k = float(np.median(z))
 
     def obj(params: np.ndarray) -> float:
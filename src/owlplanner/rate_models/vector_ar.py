@@ -34,6 +34,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 import numpy as np
 
 from owlplanner.rate_models.base import BaseRateModel
+from owlplanner.rate_models._sampling import SAMPLING_PARAMETER
+from owlplanner.rate_models.fit_cache import cached_fit
 from owlplanner.rate_models.inflation_transform import fit_inflation_transform, inv_pwl_transform, pwl_transform
 from owlplanner.rate_models._builtin_impl import (
     _historical_arith_means,
@@ -90,6 +92,7 @@ class VARRateModel(BaseRateModel):
             ),
             "example": "true",
         },
+        "sampling": SAMPLING_PARAMETER,
     }
 
     #######################################################################
@@ -129,7 +132,9 @@ class VARRateModel(BaseRateModel):
         data[:, 3] = pwl_transform(data[:, 3], k, slope_lo, slope_hi)
 
         self._mean = data.mean(axis=0)
-        self._fit(data)
+        fitted = cached_fit(self.model_name, (self.frm, self.to), lambda: self._fit(data))
+        self._c, self._A, self._L = fitted
+        self._check_stationarity()
 
         # Target means are computed from raw (untransformed) historical returns, since
         # self._mean lives in the PWL-transformed inflation space and cannot be reused.
@@ -151,11 +156,10 @@ class VARRateModel(BaseRateModel):
             X  shape (T-1, 5) = [ones | data[:-1]]
             B  shape (5, 4)
 
-        Extracts:
+        Returns (c, A, L):
             c  = B[0, :]      intercept (4,)
             A  = B[1:, :].T   transition matrix (4, 4)
-            Σ  residual covariance (4, 4)
-            L  Cholesky factor of Σ (4, 4)
+            L  Cholesky factor of the residual covariance Σ (4, 4)
         """
         T = len(data)
 
@@ -165,8 +169,8 @@ class VARRateModel(BaseRateModel):
 
         B, _, _, _ = np.linalg.lstsq(X, Y, rcond=None)  # (5, 4)
 
-        self._c = B[0, :]  # (4,)
-        self._A = B[1:, :].T  # (4, 4)
+        c = B[0, :]  # (4,)
+        A = B[1:, :].T  # (4, 4)
 
         # Residuals and covariance
         E = Y - X @ B  # (T-1, 4)
@@ -175,7 +179,16 @@ class VARRateModel(BaseRateModel):
             dof = T - 1  # fallback for very short windows
         Sigma = E.T @ E / dof  # (4, 4)
 
-        # Stationarity check
+        # Cholesky decomposition — ensure Sigma is symmetric positive definite
+        Sigma = (Sigma + Sigma.T) / 2.0
+        min_eig = float(np.min(np.linalg.eigvalsh(Sigma)))
+        if min_eig <= 0:
+            Sigma += (-min_eig + 1e-10) * np.eye(4)
+
+        return c, A, np.linalg.cholesky(Sigma)
+
+    def _check_stationarity(self):
+        """Warn when the fitted transition matrix is close to non-stationary, and shrink it if asked."""
         eigenvalues = np.linalg.eigvals(self._A)
         rho = float(np.max(np.abs(eigenvalues)))
 
@@ -194,14 +207,6 @@ class VARRateModel(BaseRateModel):
                         "Set shrink=True to auto-correct."
                     )
 
-        # Cholesky decomposition — ensure Sigma is symmetric positive definite
-        Sigma = (Sigma + Sigma.T) / 2.0
-        min_eig = float(np.min(np.linalg.eigvalsh(Sigma)))
-        if min_eig <= 0:
-            Sigma += (-min_eig + 1e-10) * np.eye(4)
-
-        self._L = np.linalg.cholesky(Sigma)
-
     #######################################################################
     # Generate
     #######################################################################
@@ -214,18 +219,33 @@ class VARRateModel(BaseRateModel):
         -------
         np.ndarray, shape (N, 4), decimal-scale returns.
         """
-        out = np.empty((N, 4))
-        y_prev = self._mean.copy()
+        return self._simulate(self._sampler.standard_normal(self._rng, (N, 4)))
+
+    def generate_batch(self, N, n_paths):
+        """
+        Simulate n_paths VAR(1) chains of length N, advancing all chains together.
+
+        Returns
+        -------
+        np.ndarray, shape (n_paths, N, 4), decimal-scale returns.
+        """
+        return self._simulate(self._sampler.paths(self._rng, n_paths, (N, 4)))
+
+    def _simulate(self, innovations):
+        """Run the chain from the unconditional mean on standard normals of shape (..., N, 4)."""
+        N = innovations.shape[-2]
+        out = np.empty(innovations.shape)
+        y_prev = np.broadcast_to(self._mean, innovations.shape[:-2] + (4,))
+        eps = innovations @ self._L.T
 
         for t in range(N):
-            eps = self._L @ self._rng.standard_normal(4)
-            y_t = self._c + self._A @ y_prev + eps
-            out[t] = y_t
+            y_t = self._c + y_prev @ self._A.T + eps[..., t, :]
+            out[..., t, :] = y_t
             y_prev = y_t
 
         # Invert inflation transform to recover actual inflation values
         k, slope_lo, slope_hi = self._infl_transform
-        out[:, 3] = inv_pwl_transform(out[:, 3], k, slope_lo, slope_hi)
+        out[..., 3] = inv_pwl_transform(out[..., 3], k, slope_lo, slope_hi)
 
         # Optionally shift each column so its sample mean matches the historical window mean.
         # Applied on final decimal-scale output, before floors, mirroring the other models.
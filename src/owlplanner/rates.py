@@ -23,6 +23,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 ###################################################################
+import functools
 import numpy as np
 import pandas as pd
 import os
@@ -297,3 +298,63 @@ def getRatesDistributions(frm=None, to=None, mylog=None, in_percent=True, *, df=
         stdev = stdev * 100
     # corr and covar are correlation-derived (unitless or decimal); never converted
     return RatesDistribution(geo_means=geo_means, arith_means=arith_means, stdev=stdev, corr=corr, covar=covar)
+
+
+class HistoricalWindows:
+    """
+    Every N_n-year sequence of the historical rates, as ready-made tau_kn and gamma_n.
+
+    A historical sweep sets a plan on the sequence starting at each year, possibly
+    reversed and rolled. The sequences are a sliding window view of one (N_k, T) array
+    of the data, so building the bank copies nothing, and the sequence of a year is a
+    view of its window. Reverse and roll, as applied by apply_rate_sequence_transform(),
+    are a permutation of the years of a window. The inflation multipliers gamma_n of all
+    windows are computed together, in one pass per (reverse, roll) variant, when the
+    variant is first asked for.
+    """
+
+    def __init__(self, N_n):
+        data = np.stack([SP500, BondsBaa, TNotes, Inflation]).astype(float) / 100.0
+        if not 1 <= N_n <= data.shape[1]:
+            raise ValueError(f"No {N_n}-year sequence in {data.shape[1]} years of historical data.")
+        self.N_n = N_n
+        self._windows = np.lib.stride_tricks.sliding_window_view(data, N_n, axis=1)  # (N_k, windows, N_n)
+        self._gammas = {}
+
+    def _window(self, year):
+        w = year - FROM
+        if not 0 <= w < self._windows.shape[1]:
+            raise ValueError(f"No {self.N_n}-year historical sequence starts in {year}.")
+        return w
+
+    def permutation(self, reverse=False, roll=0):
+        """Indices of the years of a window once rolled by roll, then reversed."""
+        idx = np.roll(np.arange(self.N_n), int(roll))
+        return idx[::-1] if reverse else idx
+
+    def tau_kn(self, year, reverse=False, roll=0):
+        """Read-only (N_k, N_n) rates of the sequence starting in year."""
+        window = self._windows[:, self._window(year)]
+        if not reverse and int(roll) % self.N_n == 0:
+            return window
+        tau_kn = window[:, self.permutation(reverse, roll)]
+        tau_kn.flags.writeable = False
+        return tau_kn
+
+    def gamma_n(self, year, reverse=False, roll=0):
+        """Read-only inflation multipliers of tau_kn(year, reverse, roll), as gen_gamma_n() computes them."""
+        key = (bool(reverse), int(roll) % self.N_n)
+        gammas = self._gammas.get(key)
+        if gammas is None:
+            inflation = self._windows[-1][:, self.permutation(*key)]  # (windows, N_n)
+            gammas = np.ones((inflation.shape[0], self.N_n + 1))
+            np.cumprod(1 + inflation, axis=1, out=gammas[:, 1:])
+            gammas.flags.writeable = False
+            self._gammas[key] = gammas
+        return gammas[self._window(year)]
+
+
+@functools.lru_cache(maxsize=8)
+def historical_windows(N_n):
+    """Shared HistoricalWindows of N_n-year sequences."""
+    return HistoricalWindows(N_n)
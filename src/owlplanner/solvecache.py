@@ -0,0 +1,235 @@
+"""
+Opt-in, on-disk cache of solved plans.
+
+The same case comes back with the same options all the time: a client retrying an MCP
+request, a page reloaded in the UI, ``owlcli run`` on a file that did not change. Each
+of these would otherwise solve from scratch. cached_solve() keys a solve by a hash of
+what determines its answer -- the plan configuration from plan_to_config(), the HFP
+tables actually loaded, the tau_kn rates being used, the objective and the solver
+options -- and keeps the state the solve leaves on the plan: the solution vector as
+_aggregateResults() distributed it, the self-consistent loop parameters and the
+solver status. A hit puts that state back without building or solving anything.
+The loggers and the solver session are not kept.
+
+Nothing is cached unless a directory is given, through set_solve_cache_dir() or the
+``OWL_SOLVE_CACHE_DIR`` environment variable. The directory is bounded, by default to
+OWL_SOLVE_CACHE_MB = 256 megabytes, by dropping the least recently used solves. Cache
+files are pickles: point the directory only at a location you trust.
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from .config.plan_bridge import plan_to_config
+from .version import __version__
+
+SOLVE_CACHE_ENV = "OWL_SOLVE_CACHE_DIR"
+SOLVE_CACHE_SIZE_ENV = "OWL_SOLVE_CACHE_MB"
+DEFAULT_MAX_MB = 256
+
+# Plan attributes never cached: how the plan logs, plots, talks to a solver and is
+# interrupted, and the constraint pattern the loop patches between iterations. The final
+# constraint matrices are kept: the summary reports their size.
+NOT_CACHED = frozenset(
+    {
+        "mylog",
+        "_plotter",
+        "_modelTemplates",
+        "_highs_session",
+        "_highs_warm_start",
+        "_lpPattern",
+        "_solveInterrupt",
+    }
+)
+
+# Solver options that change how a solve is reported, not what it finds.
+IGNORED_OPTIONS = frozenset({"verbose"})
+
+# Inputs setContributions() fills from the HFP tables, which plan_to_config() does not hold.
+HFP_ARRAYS = ("omega_in", "other_inc_in", "netinv_in", "Lambda_in", "myRothX_in", "kappa_ijn")
+
+_cache_dir = os.environ.get(SOLVE_CACHE_ENV) or None
+_max_bytes = int(float(os.environ.get(SOLVE_CACHE_SIZE_ENV) or DEFAULT_MAX_MB) * 2**20)
+
+
+def set_solve_cache_dir(path, max_mb=None):
+    """Cache solves in directory path, bounded to max_mb megabytes, or stop caching if path is None."""
+    global _cache_dir, _max_bytes
+    if path is not None:
+        os.makedirs(path, exist_ok=True)
+    _cache_dir = None if path is None else str(path)
+    if max_mb is not None:
+        _max_bytes = int(float(max_mb) * 2**20)
+
+
+def get_solve_cache_dir():
+    """Return the directory solves are cached in, or None."""
+    return _cache_dir
+
+
+def clear_solve_cache():
+    """Remove every cached solve."""
+    for path in _entries():
+        _remove(path)
+
+
+def solve_key(plan, objective, options=None):
+    """
+    Hash of everything that determines the solution of plan.solve(objective, options):
+    its configuration, its HFP tables and the arrays filled from them, its rates and
+    the solver options.
+    """
+    opts = {k: v for k, v in (options or {}).items() if k not in IGNORED_OPTIONS}
+    return plan_fingerprint(plan, {"objective": objective, "options": opts}, HFP_ARRAYS + ("tau_kn",))
+
+
+def plan_fingerprint(plan, head, arrays=HFP_ARRAYS):
+    """
+    Hash of plan -- its configuration, its HFP tables and its arrays named in ``arrays``
+    -- and of ``head``, a dict of whatever else is to be keyed, written as JSON.
+    """
+    h = hashlib.sha256()
+    head = {"version": __version__, **head, "config": plan_to_config(plan)}
+    h.update(json.dumps(head, sort_keys=True, default=_canonical).encode())
+    for tables in (getattr(plan, "timeLists", None), getattr(plan, "houseLists", None)):
+        for name in sorted(tables or {}):
+            df = tables[name]
+            h.update(repr((name, list(df.columns))).encode())
+            h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    for name in arrays:
+        h.update(np.ascontiguousarray(getattr(plan, name), dtype=np.float64).tobytes())
+    return h.hexdigest()
+
+
+def cached_solve(plan, objective, options=None, use_cache=True):
+    """
+    plan.solve(objective, options), answered from the cache when the same case was
+    solved before. Returns True on a cache hit. Only solved plans are cached, so an
+    unsuccessful case is always solved again.
+    """
+    if not use_cache or _cache_dir is None:
+        plan.solve(objective, options)
+        return False
+
+    try:
+        key = solve_key(plan, objective, options)
+    except Exception as e:
+        plan.mylog.vprint(f"Solving without the solve cache: {e}")
+        plan.solve(objective, options)
+        return False
+    state = _read(key)
+    if state is not None:
+        for name, value in state.items():
+            setattr(plan, name, value)
+        plan.mylog.vprint(f"Solution of {objective} read from the solve cache ({key[:12]}).")
+        return True
+
+    plan.solve(objective, options)
+    if plan.caseStatus == "solved":
+        # All of it, inputs included: they are those of any plan with this key anyway, and
+        # a solve that left an attribute as an earlier solve had set it still produced it.
+        _write(key, {name: value for name, value in vars(plan).items() if name not in NOT_CACHED and _picklable(value)})
+    return False
+
+
+def _canonical(value):
+    """JSON stand-in for the values of a plan configuration that json cannot write."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return repr(value)
+
+
+def _picklable(value):
+    try:
+        pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return False
+    return True
+
+
+def _path(key):
+    return os.path.join(_cache_dir, key[:32] + ".solve.pkl")
+
+
+def _entries():
+    if _cache_dir is None:
+        return []
+    return glob.glob(os.path.join(_cache_dir, "*.solve.pkl"))
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _read(key):
+    """Return the plan state stored for key, or None. A hit becomes the most recently used."""
+    path = _path(key)
+    try:
+        with open(path, "rb") as f:
+            stored_key, state = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, AttributeError, ImportError):
+        return None
+    if stored_key != key:
+        return None
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return state
+
+
+def _write(key, state):
+    """Store a solve, then drop the least recently used ones beyond the size bound."""
+    try:
+        fd, tmp = tempfile.mkstemp(dir=_cache_dir, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, _path(key))
+    except (OSError, pickle.PicklingError):
+        _remove(tmp)
+        return
+    _evict()
+
+
+def _evict():
+    entries = []
+    for path in _entries():
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= _max_bytes:
+            break
+        _remove(path)
+        total -= size
@@ -0,0 +1,187 @@
+"""
+Per-year trajectories of the scenarios of a stochastic run.
+
+A scenario of run_stochastic_spending() is solved on a clone of the plan, and all that
+comes back of it is a spending basis, its first-year decisions and a partial bequest:
+the clone and every per-year array it held are then dropped. Keeping the plans for fan
+charts of balances, taxes or conversions across scenarios would take gigabytes. Asked
+for ``trajectories``, the run instead keeps a few per-year series of each scenario in a
+TrajectoryStore: one float32 array of shape (S, N_n) per series, allocated once for the
+S scenarios of the run and filled as they complete.
+
+Values are kept in nominal dollars, with the inflation multipliers gamma_n of each
+scenario, so that they can be read in today's dollars of that scenario's own inflation.
+Years past a scenario's horizon, and scenarios that did not solve, are NaN.
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+
+# Series a run can keep: name -> (label, per-year values of a solved plan, nominal $).
+TRAJECTORY_FIELDS = {
+    "balance": ("Savings balance", lambda p: np.sum(p.b_ijn[:, :, : p.N_n], axis=(0, 1))),
+    "roth_conversion": ("Roth conversions", lambda p: np.sum(p.x_in, axis=0)),
+    "spending": ("Net spending", lambda p: p.g_n),
+    "income_tax": ("Income tax", lambda p: p.T_n + p.U_n + p.J_n),
+    "medicare": ("Medicare", lambda p: p.medicare_n),
+}
+
+# Percentiles of the bands of a fan chart: three bands around the median.
+DEFAULT_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+def trajectory_fields(trajectories):
+    """
+    Field names asked for by the ``trajectories`` argument of a run: None or False for
+    none, True for all of TRAJECTORY_FIELDS, or a sequence of their names.
+    """
+    if trajectories is None or trajectories is False:
+        return None
+    if trajectories is True:
+        return list(TRAJECTORY_FIELDS)
+    if isinstance(trajectories, str):
+        trajectories = [trajectories]
+    fields = list(dict.fromkeys(trajectories))
+    unknown = [f for f in fields if f not in TRAJECTORY_FIELDS]
+    if unknown or not fields:
+        raise ValueError(f"Unknown trajectory field(s) {unknown}. Use some of {list(TRAJECTORY_FIELDS)}.")
+    return fields
+
+
+def trajectory_row(p, fields):
+    """
+    The series ``fields`` of solved plan p, and its inflation multipliers as "gamma",
+    as float32 lists: small, picklable and JSON-ready, to come back from a worker.
+    """
+    row = {name: TRAJECTORY_FIELDS[name][1](p)[: p.N_n] for name in fields}
+    row["gamma"] = p.gamma_n[: p.N_n]
+    return {name: np.asarray(values, dtype=np.float32).tolist() for name, values in row.items()}
+
+
+class TrajectoryStore:
+    """
+    Per-year series of S scenarios: ``columns`` maps each field, and "gamma", to a
+    float32 array of shape (S, N_n). Row s is scenario ``scenarios[s]``: its historical
+    start year, or its number in a Monte Carlo run.
+    """
+
+    def __init__(self, year_n, columns, scenarios=None):
+        self.year_n = np.asarray(year_n, dtype=int)
+        self.columns = {name: np.asarray(values, dtype=np.float32) for name, values in columns.items()}
+        if "gamma" not in self.columns:
+            raise ValueError("A trajectory store needs the inflation multipliers 'gamma'.")
+        shape = self.columns["gamma"].shape
+        if len(shape) != 2 or shape[1] != len(self.year_n):
+            raise ValueError(f"Trajectories must have shape (S, {len(self.year_n)}), got {shape}.")
+        if any(values.shape != shape for values in self.columns.values()):
+            raise ValueError("All trajectories of a store must have the same shape.")
+        self.scenarios = np.arange(shape[0]) if scenarios is None else np.asarray(scenarios)
+
+    @classmethod
+    def empty(cls, fields, n_scenarios, year_n):
+        """A store of n_scenarios scenarios of len(year_n) years, all NaN."""
+        shape = (int(n_scenarios), len(year_n))
+        return cls(year_n, {name: np.full(shape, np.nan, dtype=np.float32) for name in [*fields, "gamma"]})
+
+    @property
+    def fields(self):
+        return [name for name in self.columns if name != "gamma"]
+
+    @property
+    def n_scenarios(self):
+        return self.columns["gamma"].shape[0]
+
+    @property
+    def N_n(self):
+        return len(self.year_n)
+
+    @property
+    def nbytes(self):
+        return sum(values.nbytes for values in self.columns.values())
+
+    def record(self, s, row):
+        """Fill row s from a trajectory_row(), which may be shorter than N_n years."""
+        for name, values in row.items():
+            values = np.asarray(values, dtype=np.float32)
+            self.columns[name][s, : len(values)] = values
+
+    def take(self, rows, scenarios=None):
+        """A store of rows ``rows`` of this one, labeled ``scenarios`` (their current labels by default)."""
+        rows = np.asarray(rows, dtype=int)
+        labels = self.scenarios[rows] if scenarios is None else scenarios
+        return TrajectoryStore(self.year_n, {name: values[rows] for name, values in self.columns.items()}, labels)
+
+    def values(self, field, value="nominal"):
+        """The (S, N_n) series ``field``, in nominal dollars or in today's dollars ("today")."""
+        if field not in self.columns or field == "gamma":
+            raise ValueError(f"No trajectory '{field}' in this store. Use one of {self.fields}.")
+        if value == "nominal":
+            return self.columns[field]
+        if value == "today":
+            return self.columns[field] / self.columns["gamma"]
+        raise ValueError(f"Value type must be one of: ('nominal', 'today'), not '{value}'.")
+
+    def percentiles(self, field, q=DEFAULT_PERCENTILES, value="nominal"):
+        """Percentiles q of field across scenarios, year by year: an array of shape (len(q), N_n)."""
+        with warnings.catch_warnings():
+            # Years past every horizon are all NaN, and so are their percentiles.
+            warnings.simplefilter("ignore", RuntimeWarning)
+            return np.nanpercentile(self.values(field, value), q, axis=0)
+
+    def to_dataframe(self):
+        """One row per scenario and year, in columns scenario, year, gamma and the fields."""
+        S, N = self.n_scenarios, self.N_n
+        df = pd.DataFrame({"scenario": np.repeat(self.scenarios, N), "year": np.tile(self.year_n, S)})
+        for name, values in self.columns.items():
+            df[name] = values.reshape(-1)
+        return df
+
+    @classmethod
+    def from_dataframe(cls, df):
+        """The store to_dataframe() wrote df from."""
+        scenarios = pd.unique(df["scenario"])
+        year_n = np.sort(pd.unique(df["year"]))
+        shape = (len(scenarios), len(year_n))
+        columns = {}
+        for name in df.columns.drop(["scenario", "year"]):
+            wide = df.pivot(index="scenario", columns="year", values=name).reindex(index=scenarios, columns=year_n)
+            columns[name] = wide.to_numpy(dtype=np.float32).reshape(shape)
+        return cls(year_n, columns, scenarios)
+
+    def to_npz(self, filename):
+        """Write the store to a compressed .npz file, read back with from_npz()."""
+        np.savez_compressed(filename, year_n=self.year_n, scenarios=self.scenarios, **self.columns)
+
+    @classmethod
+    def from_npz(cls, filename):
+        with np.load(filename) as data:
+            columns = {name: data[name] for name in data.files if name not in ("year_n", "scenarios")}
+            return cls(data["year_n"], columns, data["scenarios"])
+
+    def to_parquet(self, filename):
+        """
+        Write the store to a Parquet file, as to_dataframe() lays it out, read back with
+        from_parquet(). Needs pyarrow or fastparquet, as pandas.DataFrame.to_parquet() does.
+        """
+        self.to_dataframe().to_parquet(filename, index=False)
+
+    @classmethod
+    def from_parquet(cls, filename):
+        return cls.from_dataframe(pd.read_parquet(filename))
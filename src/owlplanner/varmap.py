@@ -60,12 +60,14 @@ class VarBlock:
 
         Replaces ``_q1`` / ``_q2`` / ``_q3`` / ``_q4`` — no dimension arguments
         needed at the call site because the shape is already stored in the block.
+        Indices can also be integer arrays, which broadcast against each other to
+        give an array of flat indices, as used by the block-constraint emitters.
         """
         if len(indices) != len(self.shape):
             raise IndexError(f"VarBlock '{self.name}': expected {len(self.shape)} index/indices, got {len(indices)}")
         flat, stride = 0, 1
         for ax in range(len(self.shape) - 1, -1, -1):
-            flat += indices[ax] * stride
+            flat = flat + indices[ax] * stride
             stride *= self.shape[ax]
         return self.start + flat
 
@@ -153,6 +155,11 @@ class VarMap:
         """Number of binary variables."""
         return self._cursor - self.nconts
 
+    @property
+    def signature(self) -> tuple:
+        """Layout of the map as (name, start, shape) per block, plus the binary boundary."""
+        return tuple((b.name, b.start, b.shape) for b in self._blocks.values()) + (self.nconts,)
+
     @property
     def nbals(self) -> int:
         """Size of the ``b`` block (= N_i * N_j * (N_n + 1))."""
@@ -1530,6 +1530,7 @@ def test_run_historical_from_params_solves():
     assert data["status"] == "completed"
     assert data["scenario_method"] == "historical"
     assert data["n_scenarios_attempted"] >= 1
+    assert data["n_distinct_solves"] == data["n_scenarios_attempted"]
     assert data["n_scenarios_solved"] >= 1
     dist = data["distribution"]["spending_today_dollars"]
     assert dist["min"] > 0
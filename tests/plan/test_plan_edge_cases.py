@@ -551,6 +551,33 @@ def test_clone_no_copy_suffix_accumulation():
     assert copy2._name == p._name + " (copy)"
 
 
+def test_shallow_clone_shares_inputs_and_solves_independently():
+    """A scenario view shares read-only inputs, and solving it leaves the source plan untouched."""
+    p = _make_single_plan(expectancy=85)
+    p.solve("maxSpending", {"maxRothConversion": 50})
+    basis = p.basis
+    tau_kn = p.tau_kn.copy()
+
+    view = plan.clone(p, shallow=True)
+    assert view._name == "original (copy)"
+    assert np.shares_memory(view.alpha_ijkn, p.alpha_ijkn)
+    assert not view.alpha_ijkn.flags.writeable
+    assert p.alpha_ijkn.flags.writeable
+    assert not np.shares_memory(view.myRothX_in, p.myRothX_in)
+
+    view.setRates("historical", 1969)
+    view.myRothX_in[0, 0] = -1.0
+    view.solve("maxSpending", {"maxRothConversion": 50, "useRothConvOverrides": True})
+    assert view.caseStatus == "solved"
+    assert view.basis != pytest.approx(basis)
+    assert p.basis == basis
+    np.testing.assert_array_equal(p.tau_kn, tau_kn)
+    assert p.myRothX_in[0, 0] == 0.0
+
+    with pytest.raises(ValueError, match="shallow"):
+        plan.clone(p, shallow=True, expectancy=[90])
+
+
 def test_q_functions():
     """Test VarBlock row-major indexing (replaces the deleted _q1/_q2/_q3/_q4 functions)."""
     from owlplanner.varmap import VarBlock
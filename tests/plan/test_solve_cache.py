@@ -0,0 +1,117 @@
+"""
+Tests for the on-disk solve cache.
+
+Covers:
+- Nothing is cached without a cache directory
+- A second solve of the same case is read back without calling a solver
+- Other options, rates or HFP tables change the key; verbosity does not
+- The directory is bounded, dropping the least recently used solves
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+from datetime import date
+
+import numpy as np
+import pytest
+
+import owlplanner as owl
+from owlplanner import solvecache
+
+OPTIONS = {"maxRothConversion": 50, "solver": "HiGHS"}
+
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path):
+    saved = solvecache.get_solve_cache_dir()
+    solvecache.set_solve_cache_dir(tmp_path, max_mb=64)
+    yield tmp_path
+    solvecache.set_solve_cache_dir(saved, max_mb=solvecache.DEFAULT_MAX_MB)
+
+
+def _plan():
+    thisyear = date.today().year
+    p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [86], "cached", verbose=False)
+    p.setSpendingProfile("flat")
+    p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+    p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+    p.setSocialSecurity([2000], [67])
+    p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+    return p
+
+
+def _no_solver(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("a cached solve must not call the solver")
+
+    monkeypatch.setattr(owl.Plan, "solve", fail)
+
+
+def test_same_case_is_read_back(monkeypatch, _cache_dir):
+    first = _plan()
+    assert not solvecache.cached_solve(first, "maxSpending", OPTIONS)
+    assert first.caseStatus == "solved"
+    assert len(list(_cache_dir.glob("*.solve.pkl"))) == 1
+
+    _no_solver(monkeypatch)
+    second = _plan()
+    assert solvecache.cached_solve(second, "maxSpending", dict(OPTIONS, verbose=True))
+    assert second.caseStatus == "solved"
+    assert second.basis == pytest.approx(first.basis)
+    np.testing.assert_allclose(second.b_ijn, first.b_ijn)
+    np.testing.assert_allclose(second.MAGI_n, first.MAGI_n)
+    assert second.summaryDf().equals(first.summaryDf())
+
+
+def test_no_cache_and_no_directory_solve_afresh(monkeypatch):
+    solvecache.cached_solve(_plan(), "maxSpending", OPTIONS)
+    calls = []
+    monkeypatch.setattr(owl.Plan, "solve", lambda self, *a, **k: calls.append(1))
+    solvecache.cached_solve(_plan(), "maxSpending", OPTIONS, use_cache=False)
+    solvecache.set_solve_cache_dir(None)
+    solvecache.cached_solve(_plan(), "maxSpending", OPTIONS)
+    assert calls == [1, 1]
+
+
+def test_key_follows_what_determines_the_solution():
+    p = _plan()
+    key = solvecache.solve_key(p, "maxSpending", OPTIONS)
+    assert solvecache.solve_key(_plan(), "maxSpending", dict(OPTIONS, verbose=True)) == key
+    assert solvecache.solve_key(p, "maxSpending", dict(OPTIONS, maxRothConversion=60)) != key
+    assert solvecache.solve_key(p, "maxBequest", OPTIONS) != key
+
+    p.setRates("user", values=[6.0, 4.0, 3.0, 3.0])
+    assert solvecache.solve_key(p, "maxSpending", OPTIONS) != key
+
+    q = _plan()
+    assert solvecache.solve_key(q, "maxSpending", OPTIONS) == key
+    q.timeLists[q.inames[0]].loc[5, "anticipated wages"] = 50_000
+    assert solvecache.solve_key(q, "maxSpending", OPTIONS) != key
+
+
+def test_least_recently_used_solves_are_dropped(_cache_dir):
+    for k, size in enumerate((3, 3, 3)):
+        path = _cache_dir / f"{k:032d}.solve.pkl"
+        path.write_bytes(b"x" * size * 2**20)
+        os.utime(path, (k, k))
+    solvecache.set_solve_cache_dir(_cache_dir, max_mb=7)
+    solvecache._evict()
+    left = sorted(p.name for p in _cache_dir.glob("*.solve.pkl"))
+    assert left == [f"{1:032d}.solve.pkl", f"{2:032d}.solve.pkl"]
+
+    solvecache.clear_solve_cache()
+    assert not list(_cache_dir.glob("*.solve.pkl"))
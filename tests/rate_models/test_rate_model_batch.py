@@ -0,0 +1,115 @@
+"""
+Tests for BaseRateModel.generate_batch().
+
+Covers:
+- Models drawing one block of normals per path give the paths of successive generate() calls
+- Bootstrap, GMM and HMM batches have the right shape and stay in the historical pool
+- The block bootstrap keeps consecutive years within a block
+- The default implementation loops over generate(), and repeats a deterministic series
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+import pytest
+
+from owlplanner.rate_models.base import BaseRateModel
+from owlplanner.rate_models.builtin import (
+    GaussianRateModel,
+    HistogaussianRateModel,
+    HistolognormalRateModel,
+    LognormalRateModel,
+    UserRateModel,
+)
+from owlplanner.rate_models.copula import HistoCopulaRateModel
+from owlplanner.rate_models.garch_dcc import GARCHDCCRateModel
+from owlplanner.rate_models.gmm import GMMRateModel
+from owlplanner.rate_models.historical_bootstrap import BootstrapSORRateModel
+from owlplanner.rate_models.hmm import HMMRateModel
+from owlplanner.rate_models.vector_ar import VARRateModel
+
+VALUES = [7.0, 4.5, 3.5, 2.5]
+STDEV = [17.0, 8.0, 6.0, 2.0]
+
+LOOP_EQUIVALENT = [
+    (GaussianRateModel, {"values": VALUES, "stdev": STDEV}),
+    (GaussianRateModel, {"values": VALUES, "stdev": STDEV, "sampling": "antithetic"}),
+    (LognormalRateModel, {"values": VALUES, "stdev": STDEV, "sampling": "lhs"}),
+    (HistogaussianRateModel, {"frm": 1950, "to": 2020, "constrain_mean": True}),
+    (HistolognormalRateModel, {"frm": 1950, "to": 2020}),
+    (HistoCopulaRateModel, {"frm": 1950, "to": 2020}),
+    (VARRateModel, {"frm": 1950, "to": 2020}),
+    (GARCHDCCRateModel, {"frm": 1950, "to": 2020, "sampling": "sobol"}),
+]
+
+
+@pytest.mark.parametrize("cls, config", LOOP_EQUIVALENT)
+def test_batch_matches_successive_generate_calls(cls, config):
+    batch = cls(config, seed=11).generate_batch(25, 6)
+    model = cls(config, seed=11)
+    looped = np.array([model.generate(25) for _ in range(6)])
+    assert batch.shape == (6, 25, 4)
+    np.testing.assert_allclose(batch, looped, rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("bootstrap_type", ["iid", "block", "circular", "stationary"])
+def test_bootstrap_batch_draws_from_the_pool(bootstrap_type):
+    model = BootstrapSORRateModel({"frm": 1950, "to": 2020, "bootstrap_type": bootstrap_type, "block_size": 5}, seed=3)
+    batch = model.generate_batch(23, 40)
+    assert batch.shape == (40, 23, 4)
+    pool = {tuple(row) for row in model._historical_data[:, :3]}
+    assert all(tuple(row) in pool for row in batch[..., :3].reshape(-1, 3))
+    assert not np.allclose(batch[0], batch[1])
+
+
+def test_block_bootstrap_batch_keeps_blocks_consecutive():
+    model = BootstrapSORRateModel({"frm": 1950, "to": 2020, "bootstrap_type": "block", "block_size": 5}, seed=3)
+    idx = model._block_indices(23, 10, circular=False)
+    steps = np.diff(idx, axis=1)
+    within_block = np.arange(1, 23) % 5 != 0
+    assert np.all(steps[:, within_block] == 1)
+
+
+@pytest.mark.parametrize("cls", [GMMRateModel, HMMRateModel])
+def test_mixture_batch_matches_the_fitted_mean(cls):
+    model = cls({"frm": 1928, "to": 2025, "n_components": 3}, seed=5)
+    batch = model.generate_batch(30, 400)
+    assert batch.shape == (400, 30, 4)
+    assert np.all(batch[..., 3] >= -0.05)
+    np.testing.assert_allclose(
+        batch.reshape(-1, 4).mean(axis=0), model._historical_data.mean(axis=0), atol=0.015
+    )
+
+
+def test_default_batch_loops_over_generate():
+    class PluginModel(BaseRateModel):
+        model_name = "plugin"
+        description = "Uniform draws."
+
+        def __init__(self, config, seed=None, logger=None):
+            super().__init__(config, seed=seed, logger=logger)
+            self._rng = np.random.default_rng(seed)
+
+        def generate(self, N):
+            return self._rng.uniform(-0.1, 0.1, size=(N, 4))
+
+    batch = PluginModel({}, seed=8).generate_batch(10, 3)
+    model = PluginModel({}, seed=8)
+    np.testing.assert_array_equal(batch, [model.generate(10) for _ in range(3)])
+
+    constant = UserRateModel({"values": VALUES}).generate_batch(10, 3)
+    assert constant.shape == (3, 10, 4)
+    np.testing.assert_allclose(constant, np.array(VALUES) / 100.0 + np.zeros((3, 10, 4)))
@@ -0,0 +1,97 @@
+"""
+Tests for the memoized fits of the rate models.
+
+Covers:
+- A second model of the same window reuses the fit, and draws the same series
+- A different seed or window refits
+- Fits written to a cache directory are read back after the memory is cleared
+- A change of historical data invalidates the cached fits
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+import pytest
+
+from owlplanner.rate_models import fit_cache
+from owlplanner.rate_models.garch_dcc import GARCHDCCRateModel
+from owlplanner.rate_models.hmm import HMMRateModel
+from owlplanner.rate_models.vector_ar import VARRateModel
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    saved = fit_cache.get_fit_cache_dir()
+    fit_cache.set_fit_cache_dir(None)
+    fit_cache.clear_fit_cache()
+    yield
+    fit_cache.set_fit_cache_dir(saved)
+    fit_cache.clear_fit_cache()
+
+
+def _count_calls(monkeypatch, cls, name):
+    calls = []
+    original = getattr(cls, name)
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(cls, name, counting)
+    return calls
+
+
+def test_hmm_reuses_its_fit_and_draws_the_same_series(monkeypatch):
+    fresh = HMMRateModel({"frm": 1950, "to": 2020, "n_components": 2}, seed=9).generate(30)
+    calls = _count_calls(monkeypatch, HMMRateModel, "_fit_baum_welch")
+
+    cached = HMMRateModel({"frm": 1950, "to": 2020, "n_components": 2}, seed=9)
+    np.testing.assert_array_equal(cached.generate(30), fresh)
+    assert calls == []
+
+    HMMRateModel({"frm": 1950, "to": 2020, "n_components": 2}, seed=10)
+    HMMRateModel({"frm": 1951, "to": 2020, "n_components": 2}, seed=9)
+    assert len(calls) == 2
+
+
+def test_cached_fit_is_a_copy():
+    model = VARRateModel({"frm": 1950, "to": 2020}, seed=1)
+    model._A[:] = 0.0
+    again = VARRateModel({"frm": 1950, "to": 2020}, seed=1)
+    assert np.any(again._A != 0.0)
+
+
+def test_fits_survive_in_the_cache_directory(tmp_path, monkeypatch):
+    fit_cache.set_fit_cache_dir(tmp_path)
+    first = GARCHDCCRateModel({"frm": 1950, "to": 2020}, seed=4).generate(20)
+    assert list(tmp_path.glob("*.pkl"))
+
+    fit_cache.clear_fit_cache()
+    calls = _count_calls(monkeypatch, GARCHDCCRateModel, "_fit")
+    second = GARCHDCCRateModel({"frm": 1950, "to": 2020}, seed=4).generate(20)
+    assert calls == []
+    np.testing.assert_array_equal(second, first)
+
+
+def test_new_historical_data_invalidates_the_fits(tmp_path, monkeypatch):
+    fit_cache.set_fit_cache_dir(tmp_path)
+    VARRateModel({"frm": 1950, "to": 2020})
+    calls = _count_calls(monkeypatch, VARRateModel, "_fit")
+
+    fit_cache.clear_fit_cache()
+    monkeypatch.setattr(fit_cache, "rates_data_hash", lambda: "new data")
+    VARRateModel({"frm": 1950, "to": 2020})
+    assert calls == [1]
@@ -4,7 +4,7 @@ Tests for the Hidden Markov Model rate model.
 Covers:
 - Model attributes (name, flags)
 - Output shape and decimal range
-- Reproducibility (same/different seeds)
+- Reproducibility (same/different seeds, and a pinned seeded series)
 - Fitted parameter shapes and validity (pi, trans, means, covs)
 - Transition matrix row sums and diagonal persistence
 - Stationary distribution sums to 1
@@ -146,6 +146,23 @@ def test_different_seeds_differ():
     assert not np.allclose(p1.tau_kn, p2.tau_kn)
 
 
+def test_seeded_series_is_pinned():
+    """Emissions and regimes are drawn year by year: seeded cases keep their series."""
+    expected = [
+        [-0.18930230079062524, -0.07529155513509747, -0.07414653853847553, 0.08144328525888996],
+        [-0.01649891261822056, 0.11454344223118326, 0.1581631266852622, 0.06184518027504111],
+        [0.19133159330357122, 0.0979359662161755, 0.08023386574661875, 0.02995274260961458],
+    ]
+    series = HMMRateModel({"frm": 1950, "to": 2020}, seed=42).generate(3)
+    np.testing.assert_allclose(series, expected, rtol=1e-12)
+    expected = [
+        [-0.04264766021026804, 0.08678020916589323, 0.13542084316712627, 0.02036225324331634],
+        [0.10003219005499013, 0.04347574307976081, 0.01067015829969079, 0.03286150186072521],
+    ]
+    batch = HMMRateModel({"frm": 1950, "to": 2020}, seed=42).generate_batch(2, 2)
+    np.testing.assert_allclose(batch[1], expected, rtol=1e-12)
+
+
 # ------------------------------------------------------------
 # Fitted parameter shapes and validity
 # ------------------------------------------------------------
@@ -0,0 +1,111 @@
+"""
+Tests for variance-reduced sampling of stochastic rate models.
+
+Covers:
+- Antithetic pairs mirror each other around the mean
+- Latin hypercube blocks stratify every coordinate
+- Scrambled Sobol' blocks balance the draws of a block
+- Models driven by per-year innovations (garch_dcc, vector_ar) accept the option
+- The HMM draws the emission normals of its paths through its sampler
+- Unknown schemes are rejected
+- reset_sampling() starts a pair over
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import numpy as np
+import pytest
+from scipy.stats import norm
+
+from owlplanner.rate_models._sampling import SAMPLING_BLOCK, NormalSampler
+from owlplanner.rate_models.builtin import GaussianRateModel
+from owlplanner.rate_models.hmm import HMMRateModel
+from owlplanner.rate_models.vector_ar import VARRateModel
+
+VALUES = [7.0, 4.5, 3.5, 2.5]
+STDEV = [17.0, 8.0, 6.0, 2.0]
+
+
+def _gaussian(sampling):
+    return GaussianRateModel({"values": VALUES, "stdev": STDEV, "sampling": sampling}, seed=42)
+
+
+def test_antithetic_paths_mirror_around_the_mean():
+    model = _gaussian("antithetic")
+    mean = np.array(VALUES) / 100.0
+    first = model.generate(30)
+    second = model.generate(30)
+    third = model.generate(30)
+    np.testing.assert_allclose(second - mean, -(first - mean), atol=1e-12)
+    assert not np.allclose(third - mean, -(second - mean))
+
+
+def test_reset_sampling_starts_a_new_pair():
+    model = _gaussian("antithetic")
+    mean = np.array(VALUES) / 100.0
+    first = model.generate(30)
+    model.reset_sampling()
+    second = model.generate(30)
+    assert not np.allclose(second - mean, -(first - mean))
+
+
+def test_latin_hypercube_stratifies_each_coordinate():
+    sampler = NormalSampler("lhs")
+    rng = np.random.default_rng(7)
+    z = np.array([sampler.standard_normal(rng, (5, 4)) for _ in range(SAMPLING_BLOCK)])
+    strata = np.floor(norm.cdf(z) * SAMPLING_BLOCK).reshape(SAMPLING_BLOCK, -1)
+    for column in strata.T:
+        assert sorted(column) == list(range(SAMPLING_BLOCK))
+
+
+def test_sobol_block_is_balanced():
+    sampler = NormalSampler("sobol")
+    rng = np.random.default_rng(7)
+    z = np.array([sampler.standard_normal(rng, (5, 4)) for _ in range(SAMPLING_BLOCK)])
+    u = norm.cdf(z).reshape(SAMPLING_BLOCK, -1)
+    # Every coordinate of a scrambled Sobol' block has one point in each 1/64 interval.
+    assert np.all(np.sort(np.floor(u * SAMPLING_BLOCK), axis=0) == np.arange(SAMPLING_BLOCK)[:, None])
+
+
+def test_innovation_models_accept_sampling():
+    model = VARRateModel({"frm": 1950, "to": 2020, "sampling": "antithetic"}, seed=3)
+    first = model.generate(20)
+    second = model.generate(20)
+    assert first.shape == second.shape == (20, 4)
+    assert not np.allclose(first, second)
+
+
+def test_hmm_draws_its_emissions_through_the_sampler(monkeypatch):
+    model = HMMRateModel({"frm": 1950, "to": 2020, "sampling": "sobol"}, seed=3)
+    calls = []
+    paths, standard_normal = model._sampler.paths, model._sampler.standard_normal
+    monkeypatch.setattr(model._sampler, "paths", lambda rng, n, shape: calls.append((n, shape)) or paths(rng, n, shape))
+    monkeypatch.setattr(
+        model._sampler, "standard_normal", lambda rng, shape: calls.append(shape) or standard_normal(rng, shape)
+    )
+    batch = model.generate_batch(20, 8)
+    single = model.generate(20)
+    assert batch.shape == (8, 20, 4)
+    assert single.shape == (20, 4)
+    assert np.isfinite(batch).all() and np.isfinite(single).all()
+    # The batch asks once for every path; the Sobol' sampler serves it path by path.
+    assert calls[0] == (8, (20, 4))
+    assert calls[-1] == (20, 4)
+
+
+def test_unknown_scheme_is_rejected():
+    with pytest.raises(ValueError, match="sampling scheme"):
+        _gaussian("halton")
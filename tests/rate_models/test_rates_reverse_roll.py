@@ -8,10 +8,12 @@ Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
 """
 
 import numpy as np
+import pytest
 from io import StringIO
 
 import owlplanner as owl
 import owlplanner.config as config
+from owlplanner import rates
 
 
 def _make_plan_with_historical_rates():
@@ -273,3 +275,27 @@ class TestConstantRateReverseRollNoOp:
         log_output = strio.getvalue()
         assert "reverse and roll are ignored" in log_output or "ignored for constant" in log_output
         np.testing.assert_array_almost_equal(p.tau_kn, tau_no_transform)
+
+
+class TestHistoricalWindows:
+    """The historical scenario bank gives the rates and multipliers setRates computes."""
+
+    def test_windows_match_setRates(self):
+        p = _make_plan_with_historical_rates()
+        windows = rates.historical_windows(p.N_n)
+        for year, reverse, roll in [(1928, False, 0), (1969, True, 0), (1969, False, 3), (1990, True, 7)]:
+            p.setRates("historical", year, reverse=reverse, roll=roll)
+            np.testing.assert_array_equal(windows.tau_kn(year, reverse, roll), p.tau_kn)
+            np.testing.assert_array_equal(windows.gamma_n(year, reverse, roll), p.gamma_n)
+
+    def test_windows_are_read_only_views(self):
+        windows = rates.historical_windows(20)
+        tau_kn = windows.tau_kn(1950)
+        assert not tau_kn.flags.writeable
+        assert np.shares_memory(tau_kn, windows.tau_kn(1951))
+        assert not windows.gamma_n(1950, True, 2).flags.writeable
+
+    def test_windows_reject_years_without_a_full_sequence(self):
+        windows = rates.historical_windows(20)
+        with pytest.raises(ValueError, match="starts in"):
+            windows.tau_kn(rates.TO - 10)
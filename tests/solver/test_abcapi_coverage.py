@@ -321,6 +321,13 @@ def test_constraint_matrix_to_csr():
     # Column index for row 2 (nz 5)
     assert a_index[5] == 0
 
+    # Cached between calls, so read-only: a caller cannot corrupt later solves.
+    for a in (a_start, a_index, a_value):
+        assert not a.flags.writeable
+    with pytest.raises(ValueError):
+        a_value[0] = 99.0
+    assert cm.to_csr()[2][0] == 1.0
+
 
 def test_objective_lists():
     """Test Objective.lists method."""
@@ -334,3 +341,147 @@ def test_objective_lists():
     assert 5 in ind
     assert 1.0 in val
     assert 2.0 in val
+
+
+def test_constraint_matrix_add_block():
+    """Test ConstraintMatrix.addBlock against the equivalent row-by-row build."""
+    cm = abc.ConstraintMatrix(6)
+    cm.addNewRow({5: 1.0}, 0, 0, tag="first")
+    first = cm.addBlock(2, [0, 0, 1], [1, 2, 3], [1.0, -1.0, 2.0], [0, -np.inf], [np.inf, 4], tags=["a", "b"])
+    assert first == 1
+    assert cm.ncons == 3
+    assert cm.Aind == [[5], [1, 2], [3]]
+    assert cm.Aval == [[1.0], [1.0, -1.0], [2.0]]
+    assert cm.keys() == ["fx", "lo", "up"]
+    assert cm.tags == ["first", "a", "b"]
+
+
+def test_constraint_matrix_add_block_errors():
+    """Test ConstraintMatrix.addBlock validation."""
+    cm = abc.ConstraintMatrix(4)
+    with pytest.raises(ValueError, match="Index.*out of range"):
+        cm.addBlock(1, 0, 4, 1.0, 0, 1)
+    with pytest.raises(ValueError, match="Index.*out of range"):
+        cm.addBlock(1, 1, 0, 1.0, 0, 1)
+    with pytest.raises(ValueError, match="Expected 2 tags"):
+        cm.addBlock(2, [0, 1], [0, 1], 1.0, 0, 1, tags=["a"])
+
+
+def test_constraint_matrix_add_rows_mask():
+    """Test ConstraintMatrix.addRows with broadcast values and a row mask."""
+    cm = abc.ConstraintMatrix(6)
+    mask = np.array([True, False, True])
+    cm.addRows(3, [(np.arange(3), 1.0), (np.arange(3, 6), [2.0, 3.0, 4.0], mask)], 0, [1, 2, 3])
+    assert cm.Aind == [[0, 3], [1], [2, 5]]
+    assert cm.Aval == [[1.0, 2.0], [1.0], [1.0, 4.0]]
+    np.testing.assert_array_equal(cm.ub, [1, 2, 3])
+
+
+def test_constraint_matrix_add_interleaved_rows():
+    """Test that interleaved families are emitted row by row."""
+    cm = abc.ConstraintMatrix(4)
+    fam_a = ([(np.array([0, 1]), 1.0)], 0, np.inf)
+    fam_b = ([(np.array([2, 3]), -1.0), (np.array([0, 1]), 5.0)], -np.inf, 0)
+    cm.addInterleavedRows(2, [fam_a, fam_b], tags=[("a", 0), ("b", 0), ("a", 1), ("b", 1)])
+    assert cm.Aind == [[0], [2, 0], [1], [3, 1]]
+    assert cm.Aval == [[1.0], [-1.0, 5.0], [1.0], [-1.0, 5.0]]
+    assert cm.keys() == ["lo", "up", "lo", "up"]
+
+
+def test_constraint_matrix_to_csr_unsorted():
+    """Test to_csr() when a block adds elements to its rows out of order."""
+    cm = abc.ConstraintMatrix(5)
+    cm.addBlock(2, [1, 0, 1, 0], [4, 0, 2, 1], [1.0, 2.0, 3.0, 4.0], 0, 1)
+    a_start, a_index, a_value = cm.to_csr()
+    np.testing.assert_array_equal(a_start, [0, 2])
+    np.testing.assert_array_equal(a_index, [0, 1, 4, 2])
+    np.testing.assert_array_equal(a_value, [2.0, 4.0, 1.0, 3.0])
+    np.testing.assert_allclose(cm.activity(np.arange(5)), [4.0, 10.0])
+    np.testing.assert_array_equal(cm.rowCounts(), [2, 2])
+
+
+def test_bounds_set_ranges():
+    """Test Bounds.setRanges broadcasting, validation, and later-wins ordering."""
+    b = abc.Bounds(5, 0)
+    b.setRanges(np.arange(5), 0, [1, 2, 3, 4, 5])
+    b.setRange(2, 1, 1)
+    b.setRanges([3], -np.inf, np.inf)
+    lb, ub = b.arrays()
+    np.testing.assert_array_equal(lb, [0, 0, 1, -np.inf, 0])
+    np.testing.assert_array_equal(ub, [1, 2, 1, np.inf, 5])
+    assert b.keys() == ["ra", "ra", "fx", "fr", "ra"]
+
+    with pytest.raises(ValueError, match="out of range"):
+        b.setRanges([5], 0, 1)
+    with pytest.raises(ValueError, match="Lower bound.*upper bound"):
+        b.setRanges([0, 1], [0, 2], 1)
+
+
+def test_constraint_matrix_copy_and_patch():
+    """Test ConstraintMatrix.copy() independence and patch() of a matching block."""
+    cm = abc.ConstraintMatrix(4)
+    cm.addNewRow({0: 1.0}, 0, 0, tag="head")
+    cm.addRows(2, [(np.array([1, 2]), 1.0), (3, [2.0, 3.0])], 0, [5, 6], tags=[("p", 0), ("p", 1)])
+    cp = cm.copy()
+    cp.addNewRow({3: 1.0}, 0, 1)
+    assert cm.ncons == 3
+    assert cp.ncons == 4
+
+    part = abc.ConstraintMatrix(4)
+    part.addRows(2, [(np.array([1, 2]), 4.0), (3, [5.0, 6.0])], -1, [7, 8], tags=[("p", 0), ("p", 1)])
+    cm.patch(part, 1, 1)
+    assert cm.Aind == [[0], [1, 3], [2, 3]]
+    assert cm.Aval == [[1.0], [4.0, 5.0], [4.0, 6.0]]
+    np.testing.assert_array_equal(cm.lb, [0, -1, -1])
+    np.testing.assert_array_equal(cm.ub, [0, 7, 8])
+    assert cp.Aval[1] == [1.0, 2.0]
+
+    other = abc.ConstraintMatrix(4)
+    other.addRows(2, [(np.array([2, 1]), 1.0), (3, 1.0)], 0, 0, tags=[("p", 0), ("p", 1)])
+    with pytest.raises(ValueError, match="layout"):
+        cm.patch(other, 1, 1)
+    with pytest.raises(ValueError, match="beyond"):
+        cm.patch(part, 2, 3)
+
+
+def test_bounds_copy_and_patch():
+    """Test Bounds.copy() independence and patch() of matching bounds."""
+    b = abc.Bounds(5, 1)
+    b.setRanges([0, 1, 2], 0, [1, 2, 3])
+    cp = b.copy()
+    assert cp.integralityList() == [4]
+
+    part = abc.Bounds(5, 0)
+    part.setRanges([1, 2], 0, [7, 8])
+    b.patch(part, 2)
+    np.testing.assert_array_equal(b.arrays()[1], [1, 7, 8, np.inf, 1])
+    np.testing.assert_array_equal(cp.arrays()[1], [1, 2, 3, np.inf, 1])
+
+    with pytest.raises(ValueError, match="does not match"):
+        b.patch(part, 1)
+
+
+def test_template_cache_lru_and_sharing():
+    """Test TemplateCache counters, LRU eviction, and sharing on deepcopy."""
+    import copy
+    import pickle
+
+    cache = abc.TemplateCache(maxsize=2)
+    assert cache.get("a") is None
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert copy.deepcopy({"t": cache})["t"] is cache
+    assert len(pickle.loads(pickle.dumps(cache))) == 0
+
+
+def test_digest():
+    """Test that digest() tells apart contents and shapes."""
+    a = np.arange(6.0)
+    assert abc.digest(a) == abc.digest(a.copy())
+    assert abc.digest(a) != abc.digest(a.reshape(2, 3))
+    assert abc.digest(a, a) != abc.digest(a)
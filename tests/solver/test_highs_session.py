@@ -0,0 +1,211 @@
+"""
+Tests for the persistent HiGHS session used by the self-consistent loop.
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+import owlplanner as owl
+from owlplanner import highssession
+
+
+def _lp(rhs, coef=1.0):
+    """min -x - y  s.t.  x + coef*y <= rhs,  x - y <= 1,  0 <= x, y <= 10."""
+    c = np.array([-1.0, -1.0])
+    Lb = np.zeros(2)
+    Ub = np.full(2, 10.0)
+    lbvec = np.full(2, -np.inf)
+    ubvec = np.array([rhs, 1.0])
+    a_start = np.array([0, 2])
+    a_index = np.array([0, 1, 0, 1])
+    a_value = np.array([1.0, coef, 1.0, -1.0])
+    integrality = np.zeros(2, dtype=np.int32)
+    return c, Lb, Ub, lbvec, ubvec, a_start, a_index, a_value, integrality
+
+
+def test_session_updates_in_place(monkeypatch):
+    monkeypatch.setattr(highssession, "MAX_COEFF_CHANGES", 0.5)
+    session = highssession.HighsSession()
+    obj, xx, ok, _, gap = session.solve(*_lp(4.0), 60, 1e-4)
+    assert ok
+    assert gap == -1.0
+    assert obj == pytest.approx(-4.0)
+
+    obj, xx, ok, _, _ = session.solve(*_lp(6.0), 60, 1e-4)
+    assert ok
+    assert obj == pytest.approx(-6.0)
+
+    obj, xx, ok, _, _ = session.solve(*_lp(6.0, coef=2.0), 60, 1e-4)
+    assert ok
+    assert obj == pytest.approx(-13.0 / 3.0)
+    np.testing.assert_allclose(xx, [8.0 / 3.0, 5.0 / 3.0], atol=1e-7)
+    assert [mode for mode, _, _ in session.history] == ["cold", "hot", "hot"]
+
+
+def test_session_repasses_changed_structure():
+    session = highssession.HighsSession()
+    session.solve(*_lp(4.0), 60, 1e-4)
+    c, Lb, Ub, lbvec, ubvec, a_start, a_index, a_value, integrality = _lp(4.0)
+    integrality[0] = 1
+    obj, _, ok, _, _ = session.solve(c, Lb, Ub, lbvec, ubvec, a_start, a_index, a_value, integrality, 60, 1e-4)
+    assert ok
+    assert obj == pytest.approx(-4.0)
+    assert [mode for mode, _, _ in session.history] == ["cold", "cold"]
+
+
+def test_loop_mode_solve_matches_cold_solves(monkeypatch):
+    thisyear = date.today().year
+
+    def solve():
+        p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [86], "session", verbose=False)
+        p.setSpendingProfile("flat")
+        p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+        p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+        p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+        p.setSocialSecurity([2000], [67])
+        p.solve("maxSpending", {"solver": "HiGHS", "maxRothConversion": 50})
+        assert p.caseStatus == "solved"
+        return p
+
+    hot = solve()
+    monkeypatch.setattr(highssession.HighsSession, "_update", lambda self, model: False)
+    cold = solve()
+
+    assert hot.g_n[0] == pytest.approx(cold.g_n[0], rel=1e-6)
+
+
+def test_opt_in_hot_solves_match_cold_solves_of_the_same_model(monkeypatch):
+    """
+    With withHotStart, every hot solve of the loop finds the optimum a fresh HiGHS instance
+    finds for the same model. Where that optimum is degenerate the two can return different
+    vertices, and the loop may then settle on another fixed point: hence opt-in.
+    """
+    thisyear = date.today().year
+    solve = highssession.HighsSession.solve
+    pairs = []
+
+    def checked(self, *args, **kwargs):
+        result = solve(self, *args, **kwargs)
+        pairs.append((self.history[-1][0], result[0], solve(highssession.HighsSession(), *args, **kwargs)[0]))
+        return result
+
+    monkeypatch.setattr(highssession.HighsSession, "solve", checked)
+    p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [86], "session", verbose=False)
+    p.setSpendingProfile("flat")
+    p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+    p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+    p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+    p.setSocialSecurity([2000], [67])
+    p.solve("maxSpending", {"solver": "HiGHS", "maxRothConversion": 50, "withHotStart": True})
+    assert p.caseStatus == "solved"
+
+    assert any(mode == "hot" for mode, _, _ in pairs)
+    for _, hot, cold in pairs:
+        assert hot == pytest.approx(cold, rel=1e-7)
+
+    # Without the option, no solve is hot started.
+    pairs.clear()
+    p.solve("maxSpending", {"solver": "HiGHS", "maxRothConversion": 50})
+    assert pairs and all(mode == "cold" for mode, _, _ in pairs)
+
+
+def test_session_starts_from_a_saved_basis():
+    first = highssession.HighsSession()
+    first.solve(*_lp(4.0), 60, 1e-4)
+    basis = first.basis()
+    assert basis is not None and len(basis[0]) == 2 and len(basis[1]) == 2
+
+    cold = highssession.HighsSession()
+    cold.solve(*_lp(4.5), 60, 1e-4)
+    warm = highssession.HighsSession(basis=basis)
+    obj, _, ok, _, _ = warm.solve(*_lp(4.5), 60, 1e-4)
+    assert ok
+    assert obj == pytest.approx(-4.5)
+    assert warm.history[0][2] <= cold.history[0][2]
+
+    # A basis of another model is not used.
+    other = highssession.HighsSession(basis=(np.zeros(3, dtype=np.int8), np.zeros(1, dtype=np.int8)))
+    obj, _, ok, _, _ = other.solve(*_lp(4.5), 60, 1e-4)
+    assert ok
+    assert obj == pytest.approx(-4.5)
+
+
+def test_plan_warm_start_from_a_neighbouring_case():
+    thisyear = date.today().year
+
+    def plan():
+        p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [86], "warm", verbose=False)
+        p.setSpendingProfile("flat")
+        p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+        p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+        p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+        p.setSocialSecurity([2000], [67])
+        return p
+
+    options = {"solver": "HiGHS", "maxRothConversion": 50, "withMedicare": "loop"}
+    neighbour = plan()
+    assert neighbour.getWarmStart() is None
+    neighbour.solve("maxSpending", dict(options, bequest=400))
+    warm = neighbour.getWarmStart()
+    assert warm["nvars"] == neighbour.nvars
+    assert {"M_n", "J_n", "Psi_n"} <= set(warm["params"])
+
+    cold = plan()
+    cold.solve("maxSpending", dict(options, bequest=450))
+    seeded = plan()
+    seeded.setWarmStart(warm)
+    seeded.solve("maxSpending", dict(options, bequest=450))
+    assert seeded.caseStatus == "solved"
+    assert seeded.basis == pytest.approx(cold.basis, rel=1e-3)
+    assert seeded.scIterations <= cold.scIterations
+    # Used once: the next solve starts cold again.
+    assert seeded._warmStartIn is None
+
+
+def test_interrupted_solves_fail():
+    session = highssession.HighsSession(interrupt=lambda: True)
+    obj, _, ok, msg, _ = session.solve(*_lp(4.0), 60, 1e-4)
+    assert not ok and obj is None
+    assert session.history == [("interrupted", 0.0, 0)]
+
+    thisyear = date.today().year
+    p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [86], "interrupted", verbose=False)
+    p.setSpendingProfile("flat")
+    p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+    p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+    p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+    p.setSocialSecurity([2000], [67])
+    options = {"solver": "HiGHS", "maxRothConversion": 50}
+
+    polls = []
+
+    def interrupt():
+        # The loop checks once before its first solve; HiGHS polls the next ones.
+        polls.append(1)
+        return len(polls) > 3
+
+    p.setSolveInterrupt(interrupt)
+    p.solve("maxSpending", options)
+    assert p.caseStatus != "solved"
+    assert len(polls) == 4
+
+    p.setSolveInterrupt(None)
+    p.solve("maxSpending", options)
+    assert p.caseStatus == "solved"
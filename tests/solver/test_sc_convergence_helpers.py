@@ -21,6 +21,7 @@ from datetime import date
 
 import numpy as np
 import owlplanner as owl
+from owlplanner import abcapi
 from owlplanner import plan as planmod
 
 
@@ -104,3 +105,68 @@ def test_max_iteration_check():
     assert p._check_max_iterations(5, 6) is None
     decision = p._check_max_iterations(6, 6)
     assert decision["reason"] == "max_iter"
+
+
+def test_patched_constraints_match_full_rebuild():
+    thisyear = date.today().year
+    p = owl.Plan(["Pat", "Sam"], [f"{thisyear - 63}-01-01", f"{thisyear - 60}-06-01"], [88, 90], "sc_patch")
+    p.setSpendingProfile("smile")
+    p.setAccountBalances(taxable=[300, 100], taxDeferred=[900, 400], taxFree=[100, 50])
+    p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+    p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]], [[60, 40, 0, 0], [70, 30, 0, 0]]])
+    p.setSocialSecurity([2400, 1800], [67, 70])
+    p.solve("maxSpending", {"maxRothConversion": 50})
+    assert p.caseStatus == "solved"
+    options = p.solverOptions
+
+    p._reuseLpPattern = True
+    p._buildConstraints(p.objective, options)
+    assert p._lpPattern is not None
+    p.M_n = p.M_n * 1.3 + 1.0
+    p.J_n = p.J_n + 2.0
+    p.Psi_n = np.clip(p.Psi_n * 0.9, 0, 0.85)
+    p.MAGI_n = p.MAGI_n * 1.1
+    p._buildConstraints(p.objective, options)
+    patched = (p.A.to_csr(), p.A.lb.copy(), p.A.ub.copy(), p.B.arrays(), list(p.A.tags))
+
+    p._reuseLpPattern = False
+    p._lpPattern = None
+    p._buildConstraints(p.objective, options)
+    fresh = (p.A.to_csr(), p.A.lb, p.A.ub, p.B.arrays(), p.A.tags)
+
+    for got, expected in zip(patched[0] + patched[3], fresh[0] + fresh[3]):
+        np.testing.assert_array_equal(got, expected)
+    np.testing.assert_array_equal(patched[1], fresh[1])
+    np.testing.assert_array_equal(patched[2], fresh[2])
+    assert patched[4] == fresh[4]
+
+
+def test_model_template_matches_full_rebuild():
+    thisyear = date.today().year
+    p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [87], "sc_template")
+    p.setSpendingProfile("flat")
+    p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+    p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+    p.setSocialSecurity([2000], [67])
+    templates = abcapi.TemplateCache()
+    p.setModelTemplateCache(templates)
+
+    p.setRates("historical", 1969)
+    p.solve("maxSpending", {"maxRothConversion": 50})
+    p.setRates("historical", 1990)
+    p.solve("maxSpending", {"maxRothConversion": 50})
+    assert p.caseStatus == "solved"
+    assert templates.hits > 0
+    options = p.solverOptions
+
+    p._buildConstraints(p.objective, options)
+    from_template = (p.A.to_csr(), p.A.lb.copy(), p.A.ub.copy(), p.B.arrays(), list(p.A.tags))
+    p.setModelTemplateCache(None)
+    p._buildConstraints(p.objective, options)
+    fresh = (p.A.to_csr(), p.A.lb, p.A.ub, p.B.arrays(), p.A.tags)
+
+    for got, expected in zip(from_template[0] + from_template[3], fresh[0] + fresh[3]):
+        np.testing.assert_array_equal(got, expected)
+    np.testing.assert_array_equal(from_template[1], fresh[1])
+    np.testing.assert_array_equal(from_template[2], fresh[2])
+    assert from_template[4] == fresh[4]
@@ -0,0 +1,154 @@
+"""
+Tests for the checkpoints of long scenario runs.
+
+Covers:
+- Results round-trip through the file, and a line cut short by a crash is ignored
+- The checkpoint of another run is refused
+- A stochastic spending run or a regret sweep resumed from its checkpoint only solves
+  the scenarios missing from it, and returns the results of an uninterrupted run
+- A Monte Carlo run is only checkpointed when its rates and lifespans can be drawn again
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+import owlplanner as owl
+from owlplanner import stresstests
+from owlplanner.checkpoint import ScenarioCheckpoint, run_fingerprint
+
+OPTIONS = {"maxRothConversion": 50, "solver": "HiGHS"}
+
+
+def _plan():
+    thisyear = date.today().year
+    p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [86], "checkpointed", verbose=False)
+    p.setSpendingProfile("flat")
+    p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+    p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+    p.setSocialSecurity([2000], [67])
+    p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+    return p
+
+
+def _crash_after(path, n_lines):
+    """Keep the header and n_lines results of a checkpoint, then half of the next line."""
+    lines = path.read_text().splitlines(keepends=True)
+    path.write_text("".join(lines[: n_lines + 1]) + lines[n_lines + 1][:10])
+
+
+def _counting(monkeypatch, name):
+    calls = []
+    original = getattr(stresstests, name)
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(stresstests, name, counting)
+    return calls
+
+
+def test_results_round_trip_and_survive_a_cut_line(tmp_path):
+    path = tmp_path / "run.jsonl"
+    with ScenarioCheckpoint(path, "abc") as ckpt:
+        assert len(ckpt) == 0
+        ckpt.record(0, (np.float64(1.5), {"x": [1.0, 2.0]}, None))
+        ckpt.record(1, None)
+        ckpt.record(2, [np.nan])
+
+    _crash_after(path, 2)
+    with ScenarioCheckpoint(path, "abc") as ckpt:
+        assert 0 in ckpt and 1 in ckpt and 2 not in ckpt
+        assert ckpt.results[0] == [1.5, {"x": [1.0, 2.0]}, None]
+        assert ckpt.results[1] is None
+        ckpt.record(2, [3.0])
+    assert ScenarioCheckpoint(path, "abc").results == {0: [1.5, {"x": [1.0, 2.0]}, None], 1: None, 2: [3.0]}
+
+    with pytest.raises(ValueError, match="another run"):
+        ScenarioCheckpoint(path, "def")
+
+
+def test_fingerprint_follows_the_plan_options_and_scenarios():
+    p = _plan()
+    key = run_fingerprint(p, "stochastic_spending", OPTIONS, ystart=1960, yend=1965)
+    assert run_fingerprint(_plan(), "stochastic_spending", dict(OPTIONS, verbose=True), ystart=1960, yend=1965) == key
+    assert run_fingerprint(p, "stochastic_spending", OPTIONS, ystart=1960, yend=1966) != key
+    assert run_fingerprint(p, "stochastic_spending", dict(OPTIONS, maxRothConversion=60), ystart=1960, yend=1965) != key
+    assert run_fingerprint(p, "conversion_regret", OPTIONS, ystart=1960, yend=1965) != key
+    p.setSpendingProfile("smile")
+    assert run_fingerprint(p, "stochastic_spending", OPTIONS, ystart=1960, yend=1965) != key
+
+
+def test_stochastic_spending_resumes_from_its_checkpoint(monkeypatch, tmp_path):
+    p = _plan()
+    path = tmp_path / "spending.jsonl"
+    full = p.runStochasticSpending(OPTIONS, "historical", ystart=1960, yend=1965, checkpoint=path)
+    assert len(path.read_text().splitlines()) == 1 + 6
+
+    _crash_after(path, 4)
+    calls = _counting(monkeypatch, "_scenario_worker")
+    resumed = p.runStochasticSpending(OPTIONS, "historical", ystart=1960, yend=1965, checkpoint=path)
+    assert len(calls) == 2
+    np.testing.assert_array_equal(resumed["bases"], full["bases"])
+    np.testing.assert_array_equal(resumed["partial_bequests"], full["partial_bequests"])
+    assert resumed["year1_decisions"] == full["year1_decisions"]
+
+    calls.clear()
+    p.runStochasticSpending(OPTIONS, "historical", ystart=1960, yend=1965, checkpoint=path)
+    assert calls == []
+    with pytest.raises(ValueError, match="another run"):
+        p.runStochasticSpending(OPTIONS, "historical", ystart=1960, yend=1964, checkpoint=path)
+
+
+def test_monte_carlo_checkpoints_need_repeatable_draws(monkeypatch, tmp_path):
+    p = _plan()
+    p.setRates("gaussian", values=[7.0, 4.0, 3.3, 2.8], stdev=[17.0, 8.0, 10.0, 3.0])
+    path = tmp_path / "mc.jsonl"
+    with pytest.raises(ValueError, match="reproducible"):
+        p.runStochasticSpending(OPTIONS, "mc", N=3, checkpoint=path)
+    assert not path.exists()
+
+    p.setReproducible(True, seed=7)
+    p.setRates("gaussian", values=[7.0, 4.0, 3.3, 2.8], stdev=[17.0, 8.0, 10.0, 3.0])
+    with pytest.raises(ValueError, match="seed"):
+        p.runStochasticSpending(OPTIONS, "mc", N=3, with_longevity=True, sexes=["F"], checkpoint=path)
+    assert not path.exists()
+
+    full = p.runStochasticSpending(OPTIONS, "mc", N=3, checkpoint=path)
+    _crash_after(path, 1)
+    calls = _counting(monkeypatch, "_scenario_worker")
+    resumed = p.runStochasticSpending(OPTIONS, "mc", N=3, checkpoint=path)
+    assert len(calls) == 2
+    np.testing.assert_array_equal(resumed["bases"], full["bases"])
+
+
+def test_regret_sweep_resumes_from_its_checkpoint(monkeypatch, tmp_path):
+    p = _plan()
+    path = tmp_path / "regret.jsonl"
+    full = owl.run_conversion_regret_sweep(p, "maxSpending", OPTIONS, [0, 20_000], 1960, 1962, checkpoint=path)
+
+    _crash_after(path, 1)
+    calls = _counting(monkeypatch, "_regret_worker")
+    resumed = owl.run_conversion_regret_sweep(p, "maxSpending", OPTIONS, [0, 20_000], 1960, 1962, checkpoint=path)
+    assert len(calls) == 2
+    np.testing.assert_array_equal(resumed["v_star"], full["v_star"])
+    np.testing.assert_array_equal(resumed["v_at"], full["v_at"])
+    np.testing.assert_array_equal(resumed["v_noconv"], full["v_noconv"])
+    assert resumed["v_star_conv"] == full["v_star_conv"]
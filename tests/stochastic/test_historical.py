@@ -21,6 +21,8 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import os
 
+import pytest
+
 import owlplanner as owl
 
 
@@ -80,3 +82,78 @@ def test_historical_range_reverse_roll():
     n, df = p.runHistoricalRange(objective, options, 1970, 1972, figure=False, reverse=True, roll=1)
     assert n == 3
     assert len(df) == 3
+
+
+def test_historical_range_parallel_matches_serial():
+    """Parallel workers return the same results, in the same order, as the serial path."""
+    exdir = "./examples/"
+    case = "Case_joe"
+    p = owl.readConfig(os.path.join(exdir, case))
+    p.readHFP(getHFP(exdir, case))
+    options = p.solverOptions
+    objective = p.objective
+    n1, df1 = p.runHistoricalRange(objective, options, 1970, 1975, figure=False, workers=1)
+    n4, df4 = p.runHistoricalRange(objective, options, 1970, 1975, figure=False, workers=4)
+    assert n1 == n4 == 6
+    assert df1.attrs["n_solves"] == 6
+    assert list(df1.columns) == list(df4.columns)
+    assert df1.to_numpy() == pytest.approx(df4.to_numpy(), rel=1e-6)
+
+
+def test_scenarios_with_the_same_rates_are_solved_once():
+    """A reversed, rolled 2-year window is the window itself; another year or order is not."""
+    from owlplanner.stresstests import _distinct_rate_sequences
+
+    scenarios = [(1970, False, 0), (1970, True, 1), (1971, False, 0), (1970, True, 0)]
+    distinct, which = _distinct_rate_sequences(2, scenarios)
+    assert distinct == [(1970, False, 0), (1971, False, 0), (1970, True, 0)]
+    assert list(which) == [0, 0, 1, 2]
+
+
+def test_streamed_historical_range_matches_single_solves():
+    """Each streamed start year carries the value of solving the plan on that year's rates."""
+    exdir = "./examples/"
+    case = "Case_joe"
+    p = owl.readConfig(os.path.join(exdir, case))
+    p.readHFP(getHFP(exdir, case))
+    options = p.solverOptions
+
+    updates = list(p.iterScenarios("maxSpending", options, "historical", ystart=1970, yend=1972, workers=2))
+    assert sorted(up.index for up in updates) == [0, 1, 2]
+    assert [up.n_done for up in updates] == [1, 2, 3]
+    assert updates[-1].n_total == 3
+
+    for up in updates:
+        year, reverse, roll = up.scenario
+        assert (reverse, roll) == (False, 0)
+        p.setRates("historical", year)
+        p.solve("maxSpending", options)
+        assert up.value == pytest.approx(p.basis, rel=1e-6)
+
+
+def test_stochastic_spending_keeps_the_scenarios_completed_before_a_cancel():
+    """The frontier of a cancelled run is that of the start years it completed."""
+    import threading
+
+    from owlplanner import progress
+
+    exdir = "./examples/"
+    case = "Case_joe"
+    p = owl.readConfig(os.path.join(exdir, case))
+    p.readHFP(getHFP(exdir, case))
+    options = dict(p.solverOptions, solver="HiGHS")
+
+    cancel = threading.Event()
+
+    class CancelAfterTwo(progress.Progress):
+        def show(self, n, N):
+            if n == 2:
+                cancel.set()
+
+    res = p.runStochasticSpending(
+        options, "historical", ystart=1960, yend=1975, progcall=CancelAfterTwo(), cancel_event=cancel
+    )
+    assert res["budget"] == {"stopped_by": "cancelled", "n_completed": 2, "n_scenarios": 16}
+    assert len(res["bases"]) == 2
+    assert set(res["start_years"]) <= set(range(1960, 1976))
+    assert res["precision"] is None
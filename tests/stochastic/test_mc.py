@@ -20,8 +20,13 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import os
+from datetime import date
+
+import numpy as np
+import pytest
 
 import owlplanner as owl
+from owlplanner.stresstests import _compute_efficient_frontier
 
 
 def getHFP(exdir, case, check_exists=True):
@@ -63,3 +68,193 @@ def test_MC():
     options = p.solverOptions
     objective = p.objective
     p.runMC(objective, options, 20)
+
+
+def _gaussian_plan(name):
+    thisyear = date.today().year
+    p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [86], name, verbose=False)
+    p.setSpendingProfile("flat")
+    p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+    p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+    p.setSocialSecurity([2000], [67])
+    p.setReproducible(True, seed=4321)
+    p.setRates("gaussian", values=[7.0, 4.5, 3.5, 2.5], stdev=[17.0, 8.0, 6.0, 2.0])
+    return p
+
+
+def test_MC_seeded_results_do_not_depend_on_workers():
+    """Each path has its own seed: worker count and N do not change a seeded run."""
+    p = _gaussian_plan("mc_workers")
+    options = {"maxRothConversion": 50}
+
+    n1, df1 = p.runMC("maxSpending", options, 6, workers=1)
+    n3, df3 = p.runMC("maxSpending", options, 6, workers=3)
+    n4, df4 = p.runMC("maxSpending", options, 4, workers=2)
+    assert n1 == n3 == 6
+    assert len(df1) == 6
+    assert df1.to_numpy() == pytest.approx(df3.to_numpy(), rel=1e-6)
+    assert df4.to_numpy() == pytest.approx(df1.to_numpy()[:4], rel=1e-6)
+
+
+def test_mc_precision_brackets_the_committed_value():
+    values = np.arange(1, 101) * 1000.0
+    est = owl.mc_precision(values, target_success_rate_pct=90)
+    assert est["n"] == 100
+    assert est["value"] == 11000.0
+    assert est["success_rate_pct"] == pytest.approx(90.0)
+    assert est["value_lo"] < est["value"] < est["value_hi"]
+    assert est["success_rate_halfwidth_pct"] == pytest.approx(6.0, abs=0.1)
+
+    wider = owl.mc_precision(values[::4], target_success_rate_pct=90)
+    assert wider["value_halfwidth_pct"] > est["value_halfwidth_pct"]
+    assert wider["success_rate_halfwidth_pct"] > est["success_rate_halfwidth_pct"]
+
+    with pytest.raises(ValueError):
+        owl.mc_precision([1.0])
+
+
+def test_mc_precision_judges_the_reported_commitment():
+    """The value the stop is judged on is the one the efficient frontier reports."""
+    rng = np.random.default_rng(3)
+    for n in (37, 200, 1000):
+        for rate in (50, 75, 90):
+            values = rng.lognormal(np.log(50_000), 0.3, n)
+            lambdas, frontier_g, frontier_prob, _ = _compute_efficient_frontier(values)
+            reported, _ = owl.g_for_success_rate(rate, lambdas, frontier_g, frontier_prob)
+            est = owl.mc_precision(values, target_success_rate_pct=rate)
+            assert est["value"] == reported
+            assert est["value_lo"] <= reported <= est["value_hi"]
+
+
+def test_adaptive_MC_stops_on_a_batch_boundary():
+    """A loose precision target stops early, on the first paths of the fixed-N run."""
+    p = _gaussian_plan("mc_adaptive")
+    options = {"maxRothConversion": 50}
+
+    n_fixed, df_fixed = p.runMC("maxSpending", options, 12, workers=2)
+    n, df = p.runMC("maxSpending", options, 12, workers=2, precision_pct=150.0, target_success_rate_pct=50, batch=4)
+    assert n == 4
+    assert df.attrs["precision"]["stopped_by"] == "precision"
+    assert df.attrs["precision"]["n"] == 4
+    assert df.to_numpy() == pytest.approx(df_fixed.to_numpy()[:4], rel=1e-6)
+
+    n, df = p.runMC("maxSpending", options, 8, workers=2, precision_pct=1e-3, batch=4)
+    assert n == 8
+    assert df.attrs["precision"]["stopped_by"] == "max_n"
+
+
+def test_MC_on_a_rate_path_bank(tmp_path):
+    """A bank file holds the paths of the seeded run, and variants solved on it meet them all."""
+    p = _gaussian_plan("mc_bank")
+    options = {"maxRothConversion": 50}
+
+    filename = tmp_path / "paths.npy"
+    owl.RatePathBank.create(p, 6, filename, N_n=p.N_n + 5)
+    bank = owl.RatePathBank.load(filename)
+    assert (bank.n_paths, bank.N_n) == (6, p.N_n + 5)
+    assert bank.meta["model"] == "gaussian"
+    assert bank.meta["seed"] == 4321
+    assert not bank.tau_kn(0).flags.writeable
+
+    n, df = p.runMC("maxSpending", options, 6, workers=2)
+    p.setReproducible(True, seed=99)
+    n_bank, df_bank = p.runMC("maxSpending", options, 6, workers=2, bank=bank)
+    assert n_bank == n == 6
+    assert df_bank.to_numpy() == pytest.approx(df.to_numpy(), rel=1e-6)
+
+    with pytest.raises(ValueError, match="holds 6 paths"):
+        p.runMC("maxSpending", options, 7, bank=bank)
+
+
+def test_streamed_MC_yields_every_path_with_running_statistics():
+    """Streamed paths are those of the seeded run, each with the summary of the paths done so far."""
+    p = _gaussian_plan("mc_stream")
+    options = {"maxRothConversion": 50}
+
+    serial = list(p.iterScenarios("maxSpending", options, "mc", N=6, workers=1))
+    assert [up.index for up in serial] == list(range(6))
+    parallel = sorted(p.iterScenarios("maxSpending", options, "mc", N=6, workers=3), key=lambda up: up.index)
+    assert [up.value for up in parallel] == pytest.approx([up.value for up in serial], rel=1e-6)
+
+    assert [up.n_done for up in serial] == list(range(1, 7))
+    last = serial[-1]
+    values = np.array([up.value for up in serial])
+    solved = values[~np.isnan(values)]
+    assert last.n_total == 6
+    assert last.success_rate_pct == pytest.approx(100.0 * len(solved) / 6)
+    assert last.median == pytest.approx(np.median(solved))
+    assert last.hist_counts.sum() == len(solved)
+    assert len(last.hist_edges) == len(last.hist_counts) + 1
+
+
+def test_MC_stops_when_cancelled_or_out_of_time(monkeypatch):
+    """A cancelled run keeps the paths completed before; one out of time keeps none."""
+    import threading
+
+    from owlplanner import stresstests
+
+    cancel = threading.Event()
+    original = stresstests._mc_solve
+    calls = []
+
+    def cancelling(*args):
+        calls.append(1)
+        if len(calls) == 3:
+            cancel.set()
+        return original(*args)
+
+    p = _gaussian_plan("mc_cancel")
+    options = {"maxRothConversion": 50}
+    n_full, df_full = p.runMC("maxSpending", options, 4, workers=1)
+    assert "budget" not in df_full.attrs
+
+    monkeypatch.setattr(stresstests, "_mc_solve", cancelling)
+    n, df = p.runMC("maxSpending", options, 10, workers=1, cancel_event=cancel)
+    # The third path saw the event before its solve, which was interrupted and dropped.
+    assert n == 2
+    assert df.attrs["budget"] == {"stopped_by": "cancelled", "n_completed": 2, "n_scenarios": 10}
+    assert df.to_numpy() == pytest.approx(df_full.to_numpy()[:2], rel=1e-6)
+
+    n, df = p.runMC("maxSpending", options, 10, workers=2, deadline=1e-9)
+    assert n == 0 and df.empty
+    assert df.attrs["budget"] == {"stopped_by": "deadline", "n_completed": 0, "n_scenarios": 10}
+
+    # Solver time limits shrink to the time left.
+    budget = stresstests._RunBudget(deadline=10)
+    assert 9 < budget.options({"maxTime": 120})["maxTime"] <= 10
+    assert budget.options({"maxTime": 5})["maxTime"] == 5
+    with pytest.raises(ValueError, match="deadline"):
+        p.runMC("maxSpending", options, 10, deadline=0)
+
+
+def test_dropping_the_MC_stream_stops_the_run(monkeypatch):
+    """Closing the stream early cancels the paths that have not started."""
+    from owlplanner import stresstests
+
+    calls = []
+    original = stresstests._mc_solve
+
+    def counting(*args):
+        calls.append(1)
+        return original(*args)
+
+    monkeypatch.setattr(stresstests, "_mc_solve", counting)
+    p = _gaussian_plan("mc_stream_stop")
+    options = {"maxRothConversion": 50}
+
+    stream = owl.iter_scenarios(p, "maxSpending", options, "mc", N=40, workers=1)
+    assert [next(stream).index for _ in range(2)] == [0, 1]
+    stream.close()
+    assert len(calls) == 2
+
+    calls.clear()
+    stream = owl.iter_scenarios(p, "maxSpending", options, "mc", N=40, workers=2)
+    first = next(stream)
+    stream.close()
+    assert first.n_done == 1
+    # At most the scenarios that were already submitted to the pool get solved.
+    assert len(calls) <= 1 + stresstests.IN_FLIGHT_PER_WORKER * 2
+
+    p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+    with pytest.raises(ValueError, match="stochastic rate method"):
+        owl.iter_scenarios(p, "maxSpending", options, "mc", N=4)
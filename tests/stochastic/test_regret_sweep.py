@@ -87,6 +87,8 @@ def test_rejects_bad_arguments(dana):
         run_conversion_regret_sweep(dana, "maxSpending", opts, [-5.0], 1966, 1966)
     with pytest.raises(ValueError, match="person"):
         run_conversion_regret_sweep(dana, "maxSpending", opts, [0.0], 1966, 1966, person=3)
+    with pytest.raises(ValueError, match="executor"):
+        run_conversion_regret_sweep(dana, "maxSpending", opts, [0.0], 1966, 1966, executor="fork")
 
 
 # Values refreshed 2026-08-11 when the AMO exclusion binaries were removed. The maxSpending
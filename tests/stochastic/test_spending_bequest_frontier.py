@@ -29,18 +29,25 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import threading
+import time
+
 import numpy as np
 import pytest
 
 import owlplanner as owl
 from owlplanner import run_spending_bequest_frontier, summarize_spending_bequest_frontier
 from owlplanner.config import readConfig
-from owlplanner.stresstests import run_stochastic_spending
+from owlplanner.stresstests import _schedule_levels, run_stochastic_spending
 
 CASE = "examples/Case_jack+jill.toml"
 # Kept short: these tests check sweep mechanics, not scenario coverage.
 HIST_YSTART, HIST_YEND = 1970, 1980
 NOISE = 1.0  # $/yr tolerance on monotonicity
+WARM_RTOL = 1e-3  # warm-started against cold solves: within loop tolerance and MIP gap
+# Across an ensemble, some scenarios' loops settle on another of their fixed points when
+# started from a neighbouring level: measured at 0.4% on the historical window below.
+WARM_ENSEMBLE_RTOL = 1e-2
 
 
 @pytest.fixture(scope="module")
@@ -96,6 +103,21 @@ class TestDeterministic:
         assert result["frontier_g"] is None
         assert result["bequest_dollars"] == pytest.approx(result["bequest_grid"] * 1000)
 
+    def test_warm_start_saves_iterations(self, case, opts, result):
+        """
+        Starting each level from the one below lands on the same frontier as starting
+        cold, in fewer iterations of the self-consistent loop.
+        """
+        warm = run_spending_bequest_frontier(
+            case, opts, [0, 500, 1000, 2000], scenario_method="deterministic", warm_start=True
+        )
+        # The first level has no level below: it is solved cold either way.
+        assert warm["base_basis"][0] == pytest.approx(result["base_basis"][0], abs=NOISE)
+        np.testing.assert_allclose(warm["base_basis"], result["base_basis"], rtol=WARM_RTOL)
+        assert warm["sc_iterations"][0] == result["sc_iterations"][0]
+        assert warm["sc_iterations"].sum() <= result["sc_iterations"].sum()
+        assert (warm["sc_iterations"] > 0).all() and (warm["solve_seconds"] > 0).all()
+
     def test_summary_is_json_ready(self, result):
         s = summarize_spending_bequest_frontier(result)
         assert s["scenario_method"] == "deterministic"
@@ -135,6 +157,40 @@ class TestHistorical:
         assert np.allclose(direct["bases"], result["bases"][1, :])
         assert np.allclose(direct["frontier_g"], result["frontier_g"][1, :])
 
+    def test_stream_yields_the_surface(self, case, opts, result):
+        """Streamed solves carry the bases of the run, with a running summary per level."""
+        stream = owl.iter_spending_bequest_frontier(
+            case, opts, [3000, 0, 1000], scenario_method="historical", ystart=HIST_YSTART, yend=HIST_YEND, workers=2
+        )
+        updates = list(stream)
+        S = HIST_YEND - HIST_YSTART + 1
+        assert len(updates) == 3 * S
+        for k in range(3):
+            level = [up for up in updates if up.level == k]
+            assert [up.n_done for up in level] == list(range(1, S + 1))
+            assert all(up.n_total == S for up in level)
+            assert sorted(up.scenario[0] for up in level) == list(range(HIST_YSTART, HIST_YEND + 1))
+            values = np.array([up.value for up in sorted(level, key=lambda up: up.index)])
+            np.testing.assert_allclose(np.nan_to_num(values), result["bases"][k], rtol=1e-6, atol=NOISE)
+            assert level[-1].median == pytest.approx(np.nanmedian(values))
+
+    def test_warm_start_tracks_the_cold_surface(self, case, opts, result):
+        """Warm starts move a scenario's loop, not the surface: same levels, nearby spending."""
+        warm = run_spending_bequest_frontier(
+            case,
+            opts,
+            [0, 1000, 3000],
+            scenario_method="historical",
+            ystart=HIST_YSTART,
+            yend=HIST_YEND,
+            success_rates=(50.0, 75.0, 90.0),
+            with_duals=False,
+            warm_start=True,
+        )
+        assert warm["sc_iterations"].sum() < result["sc_iterations"].sum()
+        np.testing.assert_allclose(warm["bases"], result["bases"], rtol=WARM_ENSEMBLE_RTOL)
+        np.testing.assert_allclose(warm["g_at_success"], result["g_at_success"], rtol=WARM_ENSEMBLE_RTOL)
+
     def test_spending_is_monotone_in_the_floor_at_every_confidence(self, result):
         G = result["g_at_success"]
         for j in range(G.shape[1]):
@@ -308,6 +364,42 @@ class TestAwkwardCases:
         for j in range(G.shape[1]):
             assert G[1, j] <= G[0, j] + NOISE, "common random numbers should keep the surface monotone"
 
+    def test_mc_stream_meets_the_same_ensemble(self, case):
+        """Streamed, the Monte Carlo levels solve the paths the run draws for the same seed."""
+        p = readConfig(CASE, verbose=False)
+        p.setRates("historical_bootstrap", 1928, 2025)
+        o = dict(p.solverOptions)
+        o["solver"] = "HiGHS"
+
+        kw = dict(scenario_method="mc", N=4, seed=7)
+        run = run_spending_bequest_frontier(p, o, [0, 1000], with_duals=False, **kw)
+        updates = list(p.iterSpendingBequestFrontier(o, [0, 1000], workers=1, **kw))
+        bases = np.zeros((2, 4))
+        for up in updates:
+            bases[up.level, up.scenario] = np.nan_to_num(up.value)
+        np.testing.assert_allclose(bases, run["bases"], rtol=1e-6, atol=NOISE)
+
+        with pytest.raises(ValueError, match="scenario_method"):
+            owl.iter_spending_bequest_frontier(p, o, [0], scenario_method="deterministic")
+
+    def test_mc_on_a_rate_path_bank(self, case, tmp_path):
+        """A bank stands in for the draws: every level, and any variant, meets its paths."""
+        p = readConfig(CASE, verbose=False)
+        p.setRates("historical_bootstrap", 1928, 2025)
+        o = dict(p.solverOptions)
+        o["solver"] = "HiGHS"
+
+        bank = owl.RatePathBank.create(p, 6, tmp_path / "paths.npy")
+        a = run_spending_bequest_frontier(p, o, [0, 1000], scenario_method="mc", bank=bank, with_duals=False)
+        b = run_spending_bequest_frontier(
+            p, o, [0, 1000], scenario_method="mc", N=6, seed=3, bank=bank, with_duals=False
+        )
+        assert a["n_scenarios"] == 6
+        assert np.allclose(a["bases"], b["bases"]), "the seed must not matter on a bank"
+
+        with pytest.raises(ValueError, match="Monte Carlo"):
+            run_spending_bequest_frontier(p, o, [0], scenario_method="deterministic", bank=bank)
+
     def test_grid_is_sorted_and_deduplicated(self, case, opts):
         res = run_spending_bequest_frontier(
             case, opts, [1000, 0, 1000], scenario_method="deterministic", with_duals=False
@@ -441,3 +533,52 @@ def test_summarize_is_pure():
     assert s["exchange_rate"][0]["spending_per_dollar_of_bequest"] == pytest.approx(-0.006)
     # The dual is a lifetime figure; dividing by the profile sum puts it in basis units.
     assert s["exchange_rate"][0]["shadow_price_implied"] == pytest.approx(-0.18 / 30.0)
+
+
+def test_schedule_solves_every_pair_once_and_keeps_errors():
+    calls = []
+    lock = threading.Lock()
+
+    def solve(k, s):
+        with lock:
+            calls.append((k, s))
+        if (k, s) == (1, 2):
+            raise RuntimeError("solver blew up")
+        return 10 * k + s
+
+    results = _schedule_levels(3, 4, solve, 3, chained=False)
+    assert sorted(calls) == [(k, s) for k in range(3) for s in range(4)]
+    assert isinstance(results[1][2], RuntimeError)
+    results[1][2] = 12
+    assert results == [[10 * k + s for s in range(4)] for k in range(3)]
+
+
+def test_schedule_chains_levels_of_a_scenario():
+    finished = {}
+    lock = threading.Lock()
+
+    def solve(k, s):
+        with lock:
+            assert k == 0 or (k - 1, s) in finished, f"level {k} of scenario {s} started before level {k - 1}"
+        time.sleep(0.001 * s)
+        with lock:
+            finished[(k, s)] = True
+        return k
+
+    shown = []
+    results = _schedule_levels(4, 5, solve, 3, chained=True, show=lambda n, total: shown.append((n, total)))
+    assert results == [[k] * 5 for k in range(4)]
+    assert shown[-1] == (20, 20) and len(shown) == 20
+
+
+def test_schedule_runs_the_slowest_scenario_first():
+    order = []
+
+    def solve(k, s):
+        order.append((k, s))
+        if s == 1:
+            time.sleep(0.05)
+
+    _schedule_levels(3, 2, solve, 1, chained=False)
+    # Scenarios are timed on the first level, in order; then the slow one goes first.
+    assert order == [(0, 0), (0, 1), (1, 1), (2, 1), (1, 0), (2, 0)]
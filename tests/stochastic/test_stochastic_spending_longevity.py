@@ -159,12 +159,161 @@ def test_stochastic_spending_mc_longevity_seed_sensitivity(monkeypatch):
     assert not np.allclose(out_base["bases"], out_rate_changed["bases"], atol=1e-9)
 
 
+def test_stochastic_spending_process_executor_matches_threads():
+    """Worker processes rebuild the plan from its spec and read rate paths from shared memory."""
+    options = {"maxRothConversion": 100, "bequest": 100, "withSSTaxability": 0.85}
+    out_threads = _create_plan_for_stochastic_longevity().runStochasticSpending(options, "mc", N=4)
+    out_procs = _create_plan_for_stochastic_longevity().runStochasticSpending(
+        options, "mc", N=4, executor="process"
+    )
+    np.testing.assert_allclose(out_procs["bases"], out_threads["bases"], rtol=1e-6)
+    np.testing.assert_allclose(out_procs["partial_bequests"], out_threads["partial_bequests"], rtol=1e-6)
+
+    with pytest.raises(ValueError, match="executor"):
+        _create_plan_for_stochastic_longevity().runStochasticSpending(options, "mc", N=4, executor="fork")
+
+
+@pytest.mark.parametrize("method, config, batched", [
+    ("gaussian", {"values": [6, 3, 2, 2], "stdev": [10, 4, 3, 1]}, True),
+    ("historical_bootstrap", {"frm": 1950, "to": 2020, "bootstrap_type": "iid"}, False),
+    ("historical_bootstrap", {"frm": 1950, "to": 2020, "bootstrap_type": "stationary", "block_size": 5}, False),
+    ("gmm", {"frm": 1950, "to": 2020}, False),
+    ("hmm", {"frm": 1950, "to": 2020}, False),
+])
+def test_seeded_rate_paths_follow_successive_generate_calls(monkeypatch, method, config, batched):
+    """Batched or not, seeded stochastic spending draws the paths of successive generate() calls."""
+    p = _create_plan_for_stochastic_longevity()
+    p.setRates(method, **config)
+    stresstests._reset_scenario_rng(p)
+    looped = [stresstests._draw_rate_path(p, 12) for _ in range(5)]
+
+    calls = []
+    generate_batch = p.rateModel.generate_batch
+    monkeypatch.setattr(p.rateModel, "generate_batch", lambda *args: calls.append(args) or generate_batch(*args))
+    stresstests._reset_scenario_rng(p)
+    paths = stresstests._draw_rate_paths(p, 12, 5)
+
+    assert calls == ([(12, 5)] if batched else [])
+    np.testing.assert_allclose(paths, looped, rtol=1e-9, atol=1e-12)
+
+
+def test_workers_attach_rate_paths_without_tracking_them(monkeypatch):
+    """Only the parent, which unlinks the block, registers it with the resource tracker."""
+    shm, shape = stresstests._share_rate_paths([np.full((4, 3), 0.05)])
+    try:
+        calls = []
+        monkeypatch.setattr(stresstests.resource_tracker, "register", lambda *args: calls.append(args))
+        monkeypatch.setattr(stresstests.resource_tracker, "unregister", lambda *args: calls.append(args))
+        attached = stresstests._attach_rate_paths(shm.name)
+        np.testing.assert_array_equal(np.ndarray(shape, dtype=np.float64, buffer=attached.buf), 0.05)
+        attached.close()
+        assert calls == []
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def test_stochastic_spending_on_a_rate_path_bank(tmp_path):
+    """Processes map a bank file themselves; without N, every path of the bank is solved."""
+    options = {"maxRothConversion": 100, "bequest": 100, "withSSTaxability": 0.85}
+    p = _create_plan_for_stochastic_longevity()
+    bank = stresstests.RatePathBank.create(p, 4, tmp_path / "paths.npy")
+    out_threads = p.runStochasticSpending(options, "mc", bank=bank)
+    out_procs = _create_plan_for_stochastic_longevity().runStochasticSpending(
+        options, "mc", executor="process", bank=bank
+    )
+    assert len(out_threads["bases"]) == 4
+    np.testing.assert_allclose(out_procs["bases"], out_threads["bases"], rtol=1e-6)
+
+    with pytest.raises(ValueError, match="Monte Carlo"):
+        p.runStochasticSpending(options, "historical", ystart=1990, yend=1995, bank=bank)
+
+
+def test_streamed_longevity_scenarios_match_stochastic_spending():
+    """On a bank, with the same seed, the stream draws the lifespans and bases of the run."""
+    options = {"maxRothConversion": 100, "bequest": 100, "withSSTaxability": 0.85}
+    p = _create_plan_for_stochastic_longevity()
+    bank = stresstests.RatePathBank.create(p, 6, N_n=p.N_n + 30)
+    out = p.runStochasticSpending(options, "mc", bank=bank, with_longevity=True, sexes=["F"], seed=5)
+    stream = p.iterScenarios(
+        "maxSpending", options, "mc", bank=bank, with_longevity=True, sexes=["F"], seed=5, workers=2
+    )
+    updates = sorted(stream, key=lambda up: up.index)
+
+    assert [up.scenario for up in updates] == [(n, tuple(d)) for n, d in enumerate(out["drawn_lifespans"])]
+    np.testing.assert_allclose([up.value for up in updates], out["bases"], rtol=1e-6)
+
+    with pytest.raises(ValueError, match="sexes"):
+        p.iterScenarios("maxSpending", options, "mc", bank=bank, with_longevity=True)
+    with pytest.raises(ValueError, match="historical"):
+        p.iterScenarios("maxSpending", options, "historical", ystart=1970, yend=1972, with_longevity=True)
+
+
+def test_stochastic_spending_adaptive_keeps_the_first_batches():
+    """An adaptive run that stops early keeps the first scenarios of the fixed-N run."""
+    options = {"maxRothConversion": 100, "bequest": 100, "withSSTaxability": 0.85}
+    full = _create_plan_for_stochastic_longevity().runStochasticSpending(options, "mc", N=8)
+    out = _create_plan_for_stochastic_longevity().runStochasticSpending(
+        options, "mc", N=8, batch=3, time_budget=0
+    )
+    assert full["precision"] is None
+    assert len(out["bases"]) == 3
+    assert out["precision"]["stopped_by"] == "time_budget"
+    assert out["precision"]["n"] == 3
+    np.testing.assert_allclose(out["bases"], full["bases"][:3], rtol=1e-6)
+    reported, _ = owl.g_for_success_rate(90, out["lambdas"], out["frontier_g"], out["frontier_prob"])
+    assert out["precision"]["value"] == reported
+
+    with pytest.raises(ValueError, match="Monte Carlo"):
+        _create_plan_for_stochastic_longevity().runStochasticSpending(
+            options, "historical", ystart=1990, yend=1995, precision_pct=1.0
+        )
+
+
+def test_horizon_plans_build_each_expectancy_once():
+    """Scenarios drawing the same expectancy are views of a single rebuilt plan."""
+    p = _create_plan_for_stochastic_longevity()
+    horizons = stresstests._HorizonPlans(p)
+    a = horizons.view([95])
+    b = horizons.view([95])
+    c = horizons.view([96])
+    assert (horizons.misses, horizons.hits) == (2, 1)
+    assert a is not b
+    assert a.N_n == b.N_n == p.N_n + 3
+    assert c.N_n == a.N_n + 1
+    assert np.shares_memory(a.alpha_ijkn, b.alpha_ijkn)
+    assert not np.shares_memory(a.tau_kn, b.tau_kn)
+
+
+def test_bounded_submission_caps_scenarios_in_flight(monkeypatch):
+    """Tasks are pulled lazily, never more than IN_FLIGHT_PER_WORKER * workers at a time."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    monkeypatch.setattr(stresstests, "IN_FLIGHT_PER_WORKER", 2)
+    pulled = []
+
+    def tasks():
+        for k in range(20):
+            pulled.append(k)
+            yield k, k * k
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        results = {}
+        for key, fut in stresstests._as_completed_bounded(lambda t: pool.submit(lambda: t), tasks(), 3):
+            assert len(pulled) - len(results) <= 6
+            results[key] = fut.result()
+
+    assert results == {k: k * k for k in range(20)}
+
+
 def test_scenario_worker_historical_applies_reverse_roll():
-    """Historical worker path should pass reverse/roll through to setRates."""
+    """Historical worker path should apply reverse/roll as setRates would."""
+    from owlplanner import rates
+    from owlplanner.rate_models._builtin_impl import generate_historical_series
 
     class _DummyPlan:
         def __init__(self):
-            self.calls = []
+            self.N_n = 30
             self.caseStatus = "unknown"
             self.basis = 123.0
             self.bequest = 456.0
@@ -176,9 +325,6 @@ def test_scenario_worker_historical_applies_reverse_roll():
             self.g_n = np.array([100.0])
             self.s_n = np.array([0.0])
 
-        def setRates(self, method, year, reverse=False, roll=0):
-            self.calls.append((method, year, reverse, roll))
-
         def solve(self, objective, options):
             _ = (objective, options)
             self.caseStatus = "solved"
@@ -191,9 +337,61 @@ def test_scenario_worker_historical_applies_reverse_roll():
     # The dummy has no partialBequest, so the worker falls back to zero rather than
     # failing: a plan without a first death legitimately transfers nothing.
     assert partial == 0.0
-    assert p.calls == [("historical", 1975, True, 2)]
+    expected = rates.apply_rate_sequence_transform(generate_historical_series(30, 1975, 2004).T, True, 2)
+    np.testing.assert_array_equal(p.tau_kn, expected)
+    np.testing.assert_allclose(p.gamma_n, rates.gen_gamma_n(expected))
+    assert (p.rateMethod, p.rateFrm, p.rateTo, p.rateReverse, p.rateRoll) == ("historical", 1975, 2004, True, 2)
 
 
 def test_stochastic_lp_rejects_empty_bases():
     with pytest.raises(ValueError, match="at least one scenario"):
         stresstests._stochastic_lp([], 0.5)
+
+
+def _stochastic_lp_by_linprog(bases, lam):
+    """The LP of _stochastic_lp() handed to a solver, as it used to be computed."""
+    from scipy.optimize import linprog
+
+    S = len(bases)
+    c = np.concatenate([[-1.0], np.full(S, lam / S)])
+    A_ub = np.hstack([np.ones((S, 1)), -np.eye(S)])
+    bounds = [(0.0, float(np.max(bases)))] + [(0.0, None)] * S
+    res = linprog(c, A_ub=A_ub, b_ub=bases, bounds=bounds, method="highs")
+    return -res.fun
+
+
+@pytest.mark.parametrize("S", [1, 7, 40])
+def test_closed_form_frontier_matches_the_lp(S):
+    bases = np.random.default_rng(S).uniform(40_000, 120_000, S).round(-2)
+    lambdas, frontier_g, frontier_prob, frontier_shortfall = stresstests._compute_efficient_frontier(bases)
+    for lam, g, prob, shortfall in zip(lambdas, frontier_g, frontier_prob, frontier_shortfall, strict=True):
+        # Where the LP has a flat top the solver may land anywhere on it; the objective is unique.
+        objective = g - lam * np.maximum(0.0, g - bases).mean()
+        assert objective == pytest.approx(_stochastic_lp_by_linprog(bases, lam), rel=1e-9, abs=1e-6)
+        assert prob == np.mean(bases < g)
+        assert shortfall == pytest.approx(np.maximum(0.0, g - bases).mean())
+    assert frontier_g[0] == bases.max()
+    assert frontier_g[-1] == bases.min()
+    assert np.all(np.diff(frontier_g) <= 0)
+
+
+def test_closed_form_frontier_takes_the_quantile():
+    bases = np.array([50.0, 10.0, 40.0, 20.0, 30.0])
+    assert stresstests._stochastic_lp(bases, 0.0) == (50.0, 20.0, 0.8)
+    assert stresstests._stochastic_lp(bases, 1.0) == (50.0, 20.0, 0.8)
+    # Slope 1 - 2.5j/5 vanishes at j = 2: the whole segment [20, 30] is optimal, 20 is kept.
+    assert stresstests._stochastic_lp(bases, 2.5) == (20.0, 2.0, 0.2)
+    assert stresstests._stochastic_lp(bases, 3.0) == (20.0, 2.0, 0.2)
+    assert stresstests._stochastic_lp(bases, 1000.0) == (10.0, 0.0, 0.0)
+
+
+def test_compute_cvar_matches_the_scenario_loop():
+    rng = np.random.default_rng(3)
+    bases = rng.uniform(30_000, 90_000, 200)
+    floor = 45_000.0
+    _, frontier_g, frontier_prob, _ = stresstests._compute_efficient_frontier(bases)
+    expected = [
+        np.maximum(0.0, g - np.maximum(floor, bases)).mean() / prob if prob > 0 else 0.0
+        for g, prob in zip(frontier_g, frontier_prob, strict=True)
+    ]
+    np.testing.assert_allclose(owl.compute_cvar(bases, frontier_g, frontier_prob, floor), expected, rtol=1e-12)
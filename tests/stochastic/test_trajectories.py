@@ -0,0 +1,154 @@
+"""
+Tests for the per-year trajectories kept by stochastic spending runs.
+
+Covers:
+- A store is filled by row, taken in scenario order, and read in today's dollars
+- It round-trips through .npz and Parquet files
+- run_stochastic_spending() keeps the asked series of each scenario, consistent with
+  its spending bases, and restores them from a checkpoint
+- Fan charts of a series are drawn by both plotting backends
+
+Copyright (C) 2024-2026 Martin-D. Lacasse and The Owl Authors
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+import owlplanner as owl
+from owlplanner import stresstests
+from owlplanner.trajectories import TRAJECTORY_FIELDS, TrajectoryStore, trajectory_fields
+
+OPTIONS = {"maxRothConversion": 50, "solver": "HiGHS"}
+
+
+def _plan():
+    thisyear = date.today().year
+    p = owl.Plan(["Pat"], [f"{thisyear - 64}-01-01"], [86], "trajectories", verbose=False)
+    p.setSpendingProfile("flat")
+    p.setAccountBalances(taxable=[200], taxDeferred=[800], taxFree=[100])
+    p.setAllocationRatios("individual", generic=[[[60, 40, 0, 0], [70, 30, 0, 0]]])
+    p.setSocialSecurity([2000], [67])
+    p.setRates("user", values=[6.0, 4.0, 3.0, 2.5])
+    return p
+
+
+def _small_store():
+    store = TrajectoryStore.empty(["balance"], 3, np.arange(2030, 2034))
+    store.record(0, {"balance": [100.0, 110.0, 120.0, 130.0], "gamma": [1.0, 1.1, 1.2, 1.3]})
+    store.record(2, {"balance": [300.0, 330.0], "gamma": [1.0, 1.1]})
+    return store
+
+
+def test_store_is_filled_by_row_and_read_in_todays_dollars():
+    store = _small_store()
+    assert store.columns["balance"].dtype == np.float32
+    assert store.columns["balance"].shape == (3, 4)
+    assert np.isnan(store.columns["balance"][1]).all()
+    assert np.isnan(store.columns["balance"][2, 2:]).all()
+    np.testing.assert_allclose(store.values("balance", "today")[0], 100.0)
+
+    kept = store.take([0, 2], [1966, 1968])
+    assert kept.n_scenarios == 2
+    assert list(kept.scenarios) == [1966, 1968]
+    bands = kept.percentiles("balance", (0, 50, 100))
+    np.testing.assert_allclose(bands[:, 0], [100, 200, 300])
+    np.testing.assert_allclose(bands[:, 3], 130)
+
+    with pytest.raises(ValueError, match="No trajectory"):
+        store.values("gamma")
+    with pytest.raises(ValueError, match="Value type"):
+        store.values("balance", "real")
+    with pytest.raises(ValueError, match="Unknown trajectory field"):
+        trajectory_fields(["balance", "wealth"])
+    assert trajectory_fields(None) is None
+    assert trajectory_fields("spending") == ["spending"]
+
+
+def test_store_round_trips_through_files(tmp_path):
+    store = _small_store()
+    for saved in (TrajectoryStore.from_npz(_npz(store, tmp_path)), _through_parquet(store, tmp_path)):
+        assert saved.fields == ["balance"]
+        np.testing.assert_array_equal(saved.year_n, store.year_n)
+        np.testing.assert_array_equal(saved.scenarios, store.scenarios)
+        for name in ("balance", "gamma"):
+            np.testing.assert_array_equal(saved.columns[name], store.columns[name])
+
+
+def _npz(store, tmp_path):
+    path = tmp_path / "trajectories.npz"
+    store.to_npz(path)
+    return path
+
+
+def _through_parquet(store, tmp_path):
+    pytest.importorskip("pyarrow")
+    path = tmp_path / "trajectories.parquet"
+    store.to_parquet(path)
+    return TrajectoryStore.from_parquet(path)
+
+
+@pytest.fixture(scope="module")
+def run():
+    return _plan().runStochasticSpending(OPTIONS, "historical", ystart=1960, yend=1965, trajectories=True)
+
+
+def test_run_keeps_the_series_of_each_scenario(run):
+    store = run["trajectories"]
+    p = _plan()
+    assert store.fields == list(TRAJECTORY_FIELDS)
+    assert store.columns["balance"].shape == (6, p.N_n)
+    assert list(store.scenarios) == list(run["start_years"])
+    np.testing.assert_array_equal(store.year_n, p.year_n)
+    # The flat profile spends its basis in the first year, in today's dollars.
+    np.testing.assert_allclose(store.values("spending", "today")[:, 0], run["bases"], rtol=1e-5)
+    assert not np.isnan(store.columns["income_tax"]).any()
+
+
+def test_run_without_trajectories_keeps_none():
+    result = _plan().runStochasticSpending(OPTIONS, "historical", ystart=1960, yend=1961)
+    assert result["trajectories"] is None
+
+
+def test_trajectories_are_restored_from_a_checkpoint(monkeypatch, tmp_path, run):
+    p = _plan()
+    path = tmp_path / "spending.jsonl"
+    kwargs = dict(ystart=1960, yend=1965, trajectories=["balance", "spending"], checkpoint=path)
+    p.runStochasticSpending(OPTIONS, "historical", **kwargs)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("a checkpointed scenario must not be solved again")
+
+    monkeypatch.setattr(stresstests, "_scenario_worker", fail)
+    store = p.runStochasticSpending(OPTIONS, "historical", **kwargs)["trajectories"]
+    assert store.fields == ["balance", "spending"]
+    for name in ("balance", "spending", "gamma"):
+        np.testing.assert_allclose(store.columns[name], run["trajectories"].columns[name], rtol=1e-6)
+
+
+@pytest.mark.parametrize("backend", ["matplotlib", "plotly"])
+def test_fan_chart_in_both_backends(run, backend):
+    p = _plan()
+    p.setPlotBackend(backend)
+    fig = p.showTrajectoryBands(run, "balance", value="today", figure=True)
+    assert fig is not None
+    if backend == "matplotlib":
+        import matplotlib.pyplot as plt
+
+        plt.close(fig)
+    with pytest.raises(ValueError, match="No trajectories"):
+        p.showTrajectoryBands({"trajectories": None}, "balance")
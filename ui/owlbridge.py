@@ -40,6 +40,7 @@ from owlplanner.utils import (
 from owlplanner.rates import FROM, TO, get_fixed_rate_values
 from owlplanner.hfp_io import conditionDebtsAndFixedAssetsDF
 from owlplanner.mylogging import Logger
+from owlplanner.solvecache import cached_solve
 from owlplanner.rate_models.constants import (
     CONSTRAIN_MEAN_METHODS,
     HISTORICAL_RANGE_METHODS,
@@ -207,7 +208,7 @@ def runPlan(plan):
 
     objective, options = kz.getSolveParameters()
     try:
-        plan.solve(objective, options=options)
+        cached_solve(plan, objective, options)
     except Exception as e:
         st.error(f"Solution failed: {e}", icon=":material/error:")
         kz.storeCaseKey("caseStatus", "exception")